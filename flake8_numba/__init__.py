@@ -1,5 +1,2 @@
 from flake8_numba.rule import Error as Error
 from flake8_numba.rule import Rule as Rule
-
-# To perform init_subclass
-from flake8_numba import rules as rules
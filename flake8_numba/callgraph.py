@@ -0,0 +1,238 @@
+"""Call graph between the functions defined within a module.
+
+It records which functions are compiled with numba, the options given to their
+decorators and every call made within the module, either from another function or from
+the module level. This allows rules to know, for instance, whether a jitted function is
+called from plain Python (paying the dispatcher overhead on each call) or from another
+jitted function.
+
+The graph is built by `ModuleIndex` in a single pass over the whole module, which also
+finds the functions linked to the index, and it is shared by all functions of the module.
+"""
+
+import ast
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Final, NamedTuple, Optional, Union
+
+if TYPE_CHECKING:
+    from flake8_numba.symbols import ModuleIndex
+
+JIT_DECORATORS: Final = ("jit", "njit", "vectorize", "guvectorize", "cfunc")
+"""Decorators that compile the decorated function with numba."""
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+"""Nodes defining a function that can be part of the graph."""
+
+
+class FunctionInfo(NamedTuple):
+    """Function defined within the module."""
+
+    name: str
+    """Name relative to the module. Nested functions and methods are written as
+    `outer.inner` and `Class.method`."""
+    node: FunctionNode
+    """Node representing the function definition."""
+    decorator: str
+    """Numba decorator used to compile the function (e.g. `njit`). Empty if it is not
+    jitted."""
+    args: list[ast.expr]
+    """Positional arguments of the numba decorator, with module constants resolved."""
+    options: dict[str, ast.expr]
+    """Keyword arguments of the numba decorator, with module constants resolved."""
+
+    @property
+    def is_jitted(self) -> bool:
+        return bool(self.decorator)
+
+    @property
+    def is_nopython(self) -> bool:
+        """Whether it is compiled in nopython mode (the default since numba 0.59)."""
+        if not self.is_jitted or self.option("forceobj") is True:
+            return False
+        return self.option("nopython") is not False
+
+    def option(self, name: str, default: Any = None) -> Any:
+        """Get the value of a keyword argument of the numba decorator.
+
+        Args:
+            name (str): Name of the keyword argument (e.g. `parallel`).
+            default (Any, optional): Returned if it is not given or if its value can not
+                be known statically.
+
+        Returns:
+            Any: Value of the keyword argument.
+        """
+        if name not in self.options:
+            return default
+        try:
+            return ast.literal_eval(self.options[name])
+        except ValueError:
+            return default
+
+
+class CallSite(NamedTuple):
+    """Call found within the module."""
+
+    node: ast.Call
+    """Node representing the call."""
+    caller: Optional[FunctionInfo]
+    """Innermost function where the call is made. `None` if made at module level."""
+    callee_name: str
+    """Qualified name of the called object, with import aliases resolved."""
+    callee: Optional[FunctionInfo]
+    """Called function, if it is defined within the module."""
+
+    @property
+    def is_from_python(self) -> bool:
+        """Whether the call is made from code that is not compiled by numba."""
+        return self.caller is None or not self.caller.is_jitted
+
+
+class CallGraph:
+    """Functions of a module and calls between them."""
+
+    def __init__(self, module: ast.Module, index: "ModuleIndex") -> None:
+        """Build the graph with a single pass over the module.
+
+        Args:
+            module (ast.Module): Module whose functions are recorded.
+            index (ModuleIndex): Index of the module, used to resolve imported names.
+        """
+        self.index = index
+        self.module = module
+        """Module whose functions are recorded."""
+        self.functions: dict[str, FunctionInfo] = {}
+        """All functions of the module by their name relative to the module."""
+        self.calls: list[CallSite] = []
+        """All calls of the module, in source order."""
+        self.scopes: list[Union[FunctionNode, ast.Lambda]] = []
+        """All functions and lambdas of the module, in source order."""
+        self._by_node: dict[ast.AST, FunctionInfo] = {}
+        self._classes: set[str] = set()
+        self._call_sites: dict[ast.AST, CallSite] = {}
+        self._callers: dict[FunctionNode, list[CallSite]] = {}
+        self._callees: dict[Optional[FunctionNode], list[CallSite]] = {}
+        pending: list[tuple[ast.Call, Optional[FunctionInfo], tuple[str, ...]]] = []
+        self._visit(module, None, "", ("",), pending)
+        # Functions can be called before being defined
+        for call, caller, scopes in pending:
+            site = self._call_site(call, caller, scopes)
+            self.calls.append(site)
+            self._call_sites[call] = site
+            self._callees.setdefault(caller.node if caller else None, []).append(site)
+            if site.callee is not None:
+                self._callers.setdefault(site.callee.node, []).append(site)
+
+    def _visit(
+        self,
+        node: ast.AST,
+        caller: Optional[FunctionInfo],
+        prefix: str,
+        scopes: tuple[str, ...],
+        pending: list[tuple[ast.Call, Optional[FunctionInfo], tuple[str, ...]]],
+    ) -> None:
+        """Record the functions and calls within a node.
+
+        `prefix` is prepended to the names of the functions defined within it, while
+        `scopes` are the prefixes of the scopes where its names are looked up, from the
+        outermost.
+        """
+        body_caller, body_prefix, body_scopes = caller, prefix, scopes
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            body_caller = self._add_function(node, prefix)
+            body_prefix = f"{body_caller.name}."
+            # Class bodies are not enclosing scopes of the functions defined within them
+            enclosing = (scope for scope in scopes if scope not in self._classes)
+            body_scopes = (*enclosing, body_prefix)
+            self.scopes.append(node)
+        elif isinstance(node, ast.ClassDef):
+            body_prefix = f"{prefix}{node.name}."
+            body_scopes = (*scopes, body_prefix)
+            self._classes.add(body_prefix)
+        elif isinstance(node, ast.Lambda):
+            self.scopes.append(node)
+        elif isinstance(node, ast.Call):
+            pending.append((node, caller, scopes))
+
+        # Decorators, default values and bases are evaluated in the enclosing scope
+        for field, value in ast.iter_fields(node):
+            if field == "body" and body_prefix != prefix:
+                scope = (body_caller, body_prefix, body_scopes)
+            else:
+                scope = (caller, prefix, scopes)
+            for child in value if isinstance(value, list) else [value]:
+                if isinstance(child, ast.AST):
+                    self._visit(child, *scope, pending)
+
+    def _add_function(self, node: FunctionNode, prefix: str) -> FunctionInfo:
+        decorator_name, args, options = "", [], {}
+        for decorator in node.decorator_list:
+            func = decorator.func if isinstance(decorator, ast.Call) else decorator
+            name = (self.index.qualified_name(func) or "").rsplit(".", 1)[-1]
+            if name in JIT_DECORATORS:
+                decorator_name = name
+                if isinstance(decorator, ast.Call):
+                    args = [self.index.resolve(arg) for arg in decorator.args]
+                    options = {
+                        keyword.arg: self.index.resolve(keyword.value)
+                        for keyword in decorator.keywords
+                        if keyword.arg
+                    }
+                break
+        function = FunctionInfo(
+            f"{prefix}{node.name}", node, decorator_name, args, options
+        )
+        self.functions[function.name] = function
+        self._by_node[node] = function
+        return function
+
+    def _call_site(
+        self, call: ast.Call, caller: Optional[FunctionInfo], scopes: tuple[str, ...]
+    ) -> CallSite:
+        callee_name = self.index.qualified_name(call.func) or ""
+        callee = None
+        if isinstance(call.func, ast.Name):
+            # Innermost scope first, as Python resolves names
+            for scope in reversed(scopes):
+                candidate = f"{scope}{call.func.id}"
+                if candidate in self.functions:
+                    callee = self.functions[candidate]
+                    break
+        return CallSite(call, caller, callee_name, callee)
+
+    def function_of(self, node: ast.AST) -> Optional[FunctionInfo]:
+        """Get the information recorded for a function definition.
+
+        Args:
+            node (ast.AST): Node representing the function definition.
+
+        Returns:
+            Optional[FunctionInfo]: Recorded information. `None` if the node is not a
+                function of the module.
+        """
+        return self._by_node.get(node)
+
+    def call_site(self, node: ast.AST) -> Optional[CallSite]:
+        """Get the information recorded for a call.
+
+        Args:
+            node (ast.AST): Node representing the call.
+
+        Returns:
+            Optional[CallSite]: Recorded information. `None` if the node is not a call of
+                the module.
+        """
+        return self._call_sites.get(node)
+
+    def callers(self, function: FunctionInfo) -> Iterator[CallSite]:
+        """Iterate over the calls made to a function within the module."""
+        return iter(self._callers.get(function.node, []))
+
+    def callees(self, function: Optional[FunctionInfo]) -> Iterator[CallSite]:
+        """Iterate over the calls made by a function. `None` stands for module level."""
+        return iter(self._callees.get(function.node if function else None, []))
+
+    def calls_from_python(self) -> Iterator[CallSite]:
+        """Iterate over the calls made to jitted functions from plain Python."""
+        for call in self.calls:
+            if call.callee is not None and call.callee.is_jitted and call.is_from_python:
+                yield call
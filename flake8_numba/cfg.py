@@ -0,0 +1,287 @@
+"""Lightweight control-flow graph of a function body.
+
+The graph is made of basic blocks: sequences of statements that are always executed one
+after the other. Compound statements (`if`, `for`, `while`, `with`, `try`, `match`) are
+stored in the block where their header is evaluated, while the statements within them
+belong to their own blocks.
+
+It is built lazily the first time it is requested for a function and it is reused by
+all rules afterwards, so that path-sensitive checks are linear in the size of the
+function. Exceptions are approximated: any block within a `try` body can jump to its
+handlers and a `raise` outside of them ends the path.
+"""
+
+import ast
+from collections.abc import Callable, Iterator
+from typing import Final, Optional, Union
+
+_CFG_ATTRIBUTE: Final = "_flake8_numba_cfg"
+"""Attribute used to memoize the graph within the function node."""
+
+StatementPredicate = Callable[[ast.stmt], bool]
+"""Condition that statements of the graph can meet."""
+
+
+class Block:
+    """Basic block of the graph."""
+
+    def __init__(self, index: int) -> None:
+        """Create an empty block.
+
+        Args:
+            index (int): Position of the block within the graph.
+        """
+        self.index = index
+        self.statements: list[ast.stmt] = []
+        """Statements of the block, in execution order."""
+        self.successors: list[Block] = []
+        """Blocks that can be executed right after this one."""
+        self.handlers: list[Block] = []
+        """Blocks executed if any statement of this one raises an exception."""
+
+    def __repr__(self) -> str:
+        """Represent the block with its index and the index of its successors."""
+        successors = [block.index for block in self.successors]
+        return f"Block({self.index}, successors={successors})"
+
+
+class ControlFlowGraph:
+    """Control-flow graph of a single function."""
+
+    def __init__(self, node: ast.FunctionDef) -> None:
+        """Build the graph of a function.
+
+        Args:
+            node (ast.FunctionDef): Node representing the function definition.
+        """
+        self.blocks: list[Block] = []
+        self.entry = self.new_block()
+        """Block where the function starts."""
+        self.exit = self.new_block()
+        """Empty block reached after a `return` or after the last statement."""
+        self._loops: list[tuple[Block, Block]] = []
+        self._handlers: list[list[Block]] = []
+
+        last = self._build(node.body, self.entry)
+        if last is not None:
+            self.link(last, self.exit)
+        self._reachable = self._visit(self.entry)
+
+    def new_block(self) -> Block:
+        block = Block(len(self.blocks))
+        self.blocks.append(block)
+        return block
+
+    def link(self, source: Block, target: Block) -> None:
+        if target not in source.successors:
+            source.successors.append(target)
+
+    def _build(
+        self, statements: list[ast.stmt], current: Optional[Block]
+    ) -> Optional[Block]:
+        """Add statements to the graph.
+
+        Returns:
+            Optional[Block]: Block where execution continues. `None` if it can not
+                continue (e.g. after a `return`).
+        """
+        for statement in statements:
+            if current is None:
+                # Dead code is kept in the graph, within unreachable blocks
+                current = self.new_block()
+            current.statements.append(statement)
+            current = self._build_statement(statement, current)
+        return current
+
+    def _build_statement(self, statement: ast.stmt, current: Block) -> Optional[Block]:
+        if isinstance(statement, ast.Return):
+            self.link(current, self.exit)
+            return None
+        if isinstance(statement, ast.Raise):
+            for handler in self._handlers[-1] if self._handlers else []:
+                self.link(current, handler)
+            return None
+        if isinstance(statement, (ast.Break, ast.Continue)):
+            if self._loops:
+                header, after = self._loops[-1]
+                self.link(current, after if isinstance(statement, ast.Break) else header)
+            return None
+        if isinstance(statement, ast.If):
+            return self._build_branches([statement.body, statement.orelse], current)
+        if isinstance(statement, (ast.For, ast.AsyncFor, ast.While)):
+            return self._build_loop(statement, current)
+        if isinstance(statement, (ast.With, ast.AsyncWith)):
+            return self._build(statement.body, current)
+        if isinstance(statement, ast.Try):
+            return self._build_try(statement, current)
+        if hasattr(ast, "Match") and isinstance(statement, ast.Match):
+            # Cases are not assumed to be exhaustive, unless the last one is `case _:`
+            branches = [case.body for case in statement.cases]
+            last = statement.cases[-1]
+            irrefutable = (
+                isinstance(last.pattern, ast.MatchAs)
+                and last.pattern.pattern is None
+                and last.guard is None
+            )
+            return self._build_branches(
+                branches if irrefutable else [*branches, []], current
+            )
+        return current
+
+    def _build_branches(
+        self, branches: list[list[ast.stmt]], current: Block
+    ) -> Optional[Block]:
+        after: Optional[Block] = None
+        for branch in branches:
+            start = self.new_block()
+            self.link(current, start)
+            end = self._build(branch, start)
+            if end is not None:
+                after = after or self.new_block()
+                self.link(end, after)
+        return after
+
+    def _build_loop(
+        self, statement: Union[ast.For, ast.AsyncFor, ast.While], current: Block
+    ) -> Optional[Block]:
+        header = self.new_block()
+        self.link(current, header)
+        after = self.new_block()
+
+        body = self.new_block()
+        self.link(header, body)
+        self._loops.append((header, after))
+        end = self._build(statement.body, body)
+        self._loops.pop()
+        if end is not None:
+            self.link(end, header)
+
+        infinite = (
+            isinstance(statement, ast.While)
+            and isinstance(statement.test, ast.Constant)
+            and bool(statement.test.value)
+        )
+        if not infinite:
+            orelse = self.new_block()
+            self.link(header, orelse)
+            end = self._build(statement.orelse, orelse)
+            if end is not None:
+                self.link(end, after)
+        return after
+
+    def _build_try(self, statement: ast.Try, current: Block) -> Optional[Block]:
+        handlers = [self.new_block() for _ in statement.handlers]
+        body = self.new_block()
+        self.link(current, body)
+        first_block = len(self.blocks) - 1
+
+        self._handlers.append(handlers)
+        end = self._build(statement.body, body)
+        self._handlers.pop()
+        # Any statement of the body can raise
+        for block in self.blocks[first_block : len(self.blocks)]:
+            if block not in handlers:
+                block.handlers.extend(handlers)
+        if end is not None:
+            end = self._build(statement.orelse, end)
+
+        ends = [end]
+        for handler_block, handler in zip(handlers, statement.handlers):
+            ends.append(self._build(handler.body, handler_block))
+
+        if not statement.finalbody:
+            if all(end is None for end in ends):
+                return None
+            after = self.new_block()
+            for end in ends:
+                if end is not None:
+                    self.link(end, after)
+            return after
+
+        final = self.new_block()
+        for end in ends:
+            if end is not None:
+                self.link(end, final)
+        return self._build(statement.finalbody, final)
+
+    def _visit(
+        self, start: Block, avoid: Optional[StatementPredicate] = None
+    ) -> set[Block]:
+        """Get all blocks reachable from `start`.
+
+        Args:
+            start (Block): Block where the traversal starts.
+            avoid (Optional[StatementPredicate], optional): Paths are not followed
+                after a statement meeting this condition.
+        """
+        visited: set[Block] = set()
+        pending = [start]
+        while pending:
+            block = pending.pop()
+            if block in visited:
+                continue
+            visited.add(block)
+            # Exceptions can be raised before the statement that is avoided
+            pending.extend(block.handlers)
+            if avoid is not None and any(avoid(s) for s in block.statements):
+                continue
+            pending.extend(block.successors)
+        return visited
+
+    def is_reachable(self, statement: ast.stmt) -> bool:
+        """Check whether a statement can be executed.
+
+        Args:
+            statement (ast.stmt): Statement of the function.
+
+        Returns:
+            bool: `False` if it is dead code (e.g. after a `return`).
+        """
+        return any(statement in block.statements for block in self._reachable)
+
+    def reachable_statements(self) -> Iterator[ast.stmt]:
+        """Iterate over all statements that can be executed."""
+        for block in self.blocks:
+            if block in self._reachable:
+                yield from block.statements
+
+    def on_any_path(self, predicate: StatementPredicate) -> bool:
+        """Check whether any reachable statement meets a condition.
+
+        Args:
+            predicate (StatementPredicate): Condition to be met.
+
+        Returns:
+            bool: `True` if at least one execution can run a statement meeting it.
+        """
+        return any(predicate(statement) for statement in self.reachable_statements())
+
+    def on_all_paths(self, predicate: StatementPredicate) -> bool:
+        """Check whether all paths reaching the end of the function meet a condition.
+
+        Paths that end with an exception are not taken into account.
+
+        Args:
+            predicate (StatementPredicate): Condition to be met.
+
+        Returns:
+            bool: `True` if every path from the start of the function to its end goes
+                through a statement meeting the condition.
+        """
+        return self.exit not in self._visit(self.entry, avoid=predicate)
+
+
+def get_cfg(node: ast.FunctionDef) -> ControlFlowGraph:
+    """Get the control-flow graph of a function, building it only the first time.
+
+    Args:
+        node (ast.FunctionDef): Node representing the function definition.
+
+    Returns:
+        ControlFlowGraph: Graph of the function.
+    """
+    cfg = getattr(node, _CFG_ATTRIBUTE, None)
+    if cfg is None:
+        cfg = ControlFlowGraph(node)
+        setattr(node, _CFG_ATTRIBUTE, cfg)
+    return cfg
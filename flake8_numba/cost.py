@@ -0,0 +1,387 @@
+"""Static estimation of the work done by each call to a jitted function.
+
+The estimate is derived from the AST only. Each operation of the body is weighted by its
+kind (e.g. a division is more expensive than an addition, a transcendental function even
+more) and multiplied by the number of iterations of the loops enclosing it. Loops whose
+bounds are not constant are assumed to run `DEFAULT_TRIP_COUNT` times, and operations over
+whole arrays are assumed to process `DEFAULT_ARRAY_SIZE` elements. Numbers are therefore
+only meaningful relative to each other: they are useful to find kernels where the JIT or
+parallel overhead outweighs the computation, or to track them across commits.
+
+The report is enabled with the `--numba-cost-report` option. Since Flake8 checks files in
+several processes, each one buffers the results of its files and merges them into the
+report once, when it exits, guarded by a lock file.
+
+When a compile profile is given with `--numba-profile` (see `flake8_numba.runtime`), the
+report also includes the measured compile time of each function and the codes of the
+findings reported on it, and it is sorted by the measured compile time first.
+"""
+
+import ast
+import contextlib
+import csv
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from multiprocessing import util as multiprocessing_util
+from typing import Any, Final, NamedTuple
+
+from flake8_numba.inference import FunctionTypes, infer_types
+from flake8_numba.loops import get_loop_nest
+from flake8_numba.symbols import ModuleIndex, get_module_index
+from flake8_numba.utils import walk_function_body
+
+DEFAULT_TRIP_COUNT: Final = 100
+"""Iterations assumed for loops whose bounds are not constant."""
+DEFAULT_ARRAY_SIZE: Final = 100
+"""Elements assumed for operations over whole arrays."""
+
+OPERATION_WEIGHTS: Final = {
+    ast.Add: 1,
+    ast.Sub: 1,
+    ast.Mult: 1,
+    ast.Div: 4,
+    ast.FloorDiv: 8,
+    ast.Mod: 8,
+    ast.Pow: 10,
+    ast.MatMult: DEFAULT_ARRAY_SIZE,
+}
+"""Weight of each arithmetic operator. Those not listed weigh 1."""
+SUBSCRIPT_WEIGHT: Final = 1
+"""Weight of each access to an element of an array."""
+CALL_WEIGHT: Final = 5
+"""Weight of calling a function that is not known to be cheap or expensive."""
+TRANSCENDENTAL_WEIGHT: Final = 20
+"""Weight of each call to a transcendental function (e.g. `exp`)."""
+ALLOCATION_WEIGHT: Final = 50
+"""Weight of each new array allocated, without taking its size into account."""
+
+TRANSCENDENTALS: Final = frozenset(
+    {
+        "sqrt",
+        "cbrt",
+        "exp",
+        "exp2",
+        "expm1",
+        "log",
+        "log2",
+        "log10",
+        "log1p",
+        "sin",
+        "cos",
+        "tan",
+        "arcsin",
+        "arccos",
+        "arctan",
+        "arctan2",
+        "asin",
+        "acos",
+        "atan",
+        "atan2",
+        "sinh",
+        "cosh",
+        "tanh",
+        "power",
+        "pow",
+        "hypot",
+        "erf",
+        "erfc",
+        "gamma",
+        "lgamma",
+    }
+)
+"""NumPy and `math` functions considered transcendental."""
+ALLOCATIONS: Final = frozenset(
+    {
+        "empty",
+        "zeros",
+        "ones",
+        "full",
+        "empty_like",
+        "zeros_like",
+        "ones_like",
+        "full_like",
+        "array",
+        "copy",
+        "arange",
+        "linspace",
+        "concatenate",
+        "stack",
+        "hstack",
+        "vstack",
+    }
+)
+"""NumPy functions (and array methods) that allocate a new array."""
+ALLOCATING_METHODS: Final = frozenset({"copy", "astype", "flatten"})
+"""Array methods that allocate a new array."""
+_FREE_CALLS: Final = frozenset({"range", "prange", "enumerate", "len", "zip"})
+"""Builtins (and `numba.prange`) whose calls are not considered work."""
+_MODULES: Final = ("numpy", "np", "math", "cmath")
+"""Modules whose functions are classified by name."""
+
+REPORT_FIELDS: Final = (
+    "file",
+    "line",
+    "function",
+    "decorator",
+    "work",
+    "allocations",
+    "transcendentals",
+    "loop_depth",
+    "operations_per_level",
+    "compile_time",
+    "compilations",
+    "findings",
+)
+"""Columns of the report, in order."""
+LOCK_TIMEOUT: Final = 10.0
+"""Age in seconds after which the lock of the report is assumed to be left behind."""
+
+
+class CostEstimate(NamedTuple):
+    """Estimated cost of a single call to a function."""
+
+    file: str
+    """File where the function is defined."""
+    line: int
+    """Line where the function is defined."""
+    function: str
+    """Name of the function relative to its module (e.g. `Class.method`)."""
+    decorator: str
+    """Numba decorator used to compile it."""
+    work: float
+    """Weighted operations executed by each call, taking loops into account."""
+    allocations: float
+    """Arrays allocated by each call, taking loops into account."""
+    transcendentals: float
+    """Transcendental functions evaluated by each call, taking loops into account."""
+    loop_depth: int
+    """Maximum number of nested loops."""
+    operations_per_level: tuple[int, ...]
+    """Weighted operations written at each loop level, without multiplying them by the
+    number of iterations. The first element counts those outside of any loop."""
+    compile_time: float = 0.0
+    """Seconds spent compiling it, as measured in the compile profile."""
+    compilations: int = 0
+    """Signatures compiled, as measured in the compile profile."""
+    findings: tuple[str, ...] = ()
+    """Codes of the errors reported on the function."""
+
+    def as_row(self) -> dict[str, Any]:
+        """Represent the estimate as a row of the report."""
+        row = self._asdict()
+        row["operations_per_level"] = list(self.operations_per_level)
+        row["findings"] = list(self.findings)
+        return row
+
+
+def _node_cost(
+    node: ast.AST, types_: FunctionTypes, index: ModuleIndex
+) -> tuple[int, str]:
+    """Weight of a single node and its category (`allocation`, `transcendental`...)."""
+    if isinstance(node, (ast.BinOp, ast.AugAssign)):
+        weight = OPERATION_WEIGHTS.get(type(node.op), 1)
+        target = node if isinstance(node, ast.BinOp) else node.target
+        if types_.type_of(target).is_array:
+            weight *= DEFAULT_ARRAY_SIZE
+        return weight, "operation"
+    if isinstance(node, ast.Compare):
+        return len(node.comparators), "operation"
+    if isinstance(node, (ast.BoolOp, ast.UnaryOp)):
+        return 1, "operation"
+    if isinstance(node, ast.Subscript):
+        return SUBSCRIPT_WEIGHT, "operation"
+    if not isinstance(node, ast.Call):
+        return 0, ""
+
+    name = index.qualified_name(node.func) or ""
+    module, _, short_name = name.rpartition(".")
+    in_module = module.split(".")[0] in _MODULES
+    is_method = isinstance(node.func, ast.Attribute) and not in_module
+    size = DEFAULT_ARRAY_SIZE if types_.type_of(node).is_array else 1
+    if module in ("", "numba") and short_name in _FREE_CALLS:
+        return 0, ""
+    if is_method and short_name in ALLOCATING_METHODS:
+        return ALLOCATION_WEIGHT + size, "allocation"
+    if not in_module:
+        return CALL_WEIGHT, "operation"
+    if short_name in TRANSCENDENTALS:
+        return TRANSCENDENTAL_WEIGHT * size, "transcendental"
+    if short_name in ALLOCATIONS:
+        return ALLOCATION_WEIGHT + size, "allocation"
+    return CALL_WEIGHT * size, "operation"
+
+
+def estimate_function(node: ast.FunctionDef, filename: str = "") -> CostEstimate:
+    """Estimate the work done by each call to a function.
+
+    Args:
+        node (ast.FunctionDef): Node representing the function definition.
+        filename (str, optional): File where the function is defined.
+
+    Returns:
+        CostEstimate: Estimated cost.
+    """
+    index = get_module_index(node)
+    function = index.call_graph.function_of(node)
+    types_ = infer_types(node)[0]
+    nest = get_loop_nest(node)
+    per_level = [0] * (max((loop.depth for loop in nest.loops), default=-1) + 2)
+    totals = {"operation": 0.0, "allocation": 0.0, "transcendental": 0.0}
+    work = 0.0
+    for child in walk_function_body(node):
+        weight, category = _node_cost(child, types_, index)
+        if not weight:
+            continue
+        loop = nest.loop_of(child)
+        iterations, level = 1, 0
+        if loop is not None:
+            level = loop.depth + 1
+            for enclosing in (loop, *loop.ancestors()):
+                iterations *= enclosing.trip_count or DEFAULT_TRIP_COUNT
+        per_level[level] += weight
+        work += weight * iterations
+        totals[category] += iterations
+    return CostEstimate(
+        file=filename or index.filename,
+        line=node.lineno,
+        function=function.name if function is not None else node.name,
+        decorator=function.decorator if function is not None else "",
+        work=work,
+        allocations=totals["allocation"],
+        transcendentals=totals["transcendental"],
+        loop_depth=len(per_level) - 1,
+        operations_per_level=tuple(per_level),
+    )
+
+
+def estimate_module(module: ast.Module, filename: str = "") -> list[CostEstimate]:
+    """Estimate the cost of all jitted functions of a module.
+
+    Args:
+        module (ast.Module): Module already linked by `index_module`.
+        filename (str, optional): File where the module is defined.
+
+    Returns:
+        list[CostEstimate]: Estimated cost of each jitted function, in source order.
+    """
+    return [
+        estimate_function(function.node, filename)
+        for function in get_module_index(module).call_graph.functions.values()
+        if function.is_jitted and isinstance(function.node, ast.FunctionDef)
+    ]
+
+
+@contextlib.contextmanager
+def _locked(path: str) -> Iterator[None]:
+    """Hold an exclusive lock over a file, shared by all processes."""
+    lock_path = f"{path}.lock"
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            # Left behind by a process that was killed, unlike the locks still held
+            with contextlib.suppress(FileNotFoundError):
+                if time.time() - os.path.getmtime(lock_path) > LOCK_TIMEOUT:
+                    os.remove(lock_path)
+            time.sleep(0.01)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.remove(lock_path)
+
+
+def read_report(path: str) -> list[dict[str, Any]]:
+    """Read the rows of a JSON or CSV report. Empty if it does not exist yet."""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8", newline="") as f:
+        if not path.endswith(".csv"):
+            return json.load(f)  # type: ignore
+        rows: list[dict[str, Any]] = list(csv.DictReader(f))
+    for row in rows:
+        row["line"], row["loop_depth"] = int(row["line"]), int(row["loop_depth"])
+        row["compilations"] = int(row.get("compilations") or 0)
+        for field in ("work", "allocations", "transcendentals", "compile_time"):
+            row[field] = float(row.get(field) or 0)
+        for field in ("operations_per_level", "findings"):
+            row[field] = [n for n in (row.get(field) or "").split(";") if n]
+        row["operations_per_level"] = [int(n) for n in row["operations_per_level"]]
+    return rows
+
+
+def _write_report(path: str, rows: Sequence[dict[str, Any]]) -> None:
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "w", encoding="utf-8", newline="") as f:
+        if path.endswith(".csv"):
+            writer = csv.DictWriter(f, REPORT_FIELDS)
+            writer.writeheader()
+            for row in rows:
+                lists = {
+                    field: ";".join(str(n) for n in row.get(field, ()))
+                    for field in ("operations_per_level", "findings")
+                }
+                writer.writerow({**row, **lists})
+        else:
+            json.dump(list(rows), f, indent=2)
+    os.replace(temporary_path, path)
+
+
+def update_report(path: str, estimates: Mapping[str, Iterable[CostEstimate]]) -> None:
+    """Replace the rows of some files within the report, keeping it sorted by cost.
+
+    Rows are sorted by the measured compile time and then by the estimated work.
+
+    The format is chosen from the extension of the report: CSV for `.csv` and JSON
+    otherwise.
+
+    Args:
+        path (str): Path to the report.
+        estimates (Mapping[str, Iterable[CostEstimate]]): Estimates of all jitted
+            functions of each file whose rows are replaced.
+    """
+    with _locked(path):
+        rows = [row for row in read_report(path) if row["file"] not in estimates]
+        rows.extend(estimate.as_row() for file in estimates.values() for estimate in file)
+        rows.sort(
+            key=lambda row: (
+                -row.get("compile_time", 0.0),
+                -row["work"],
+                row["file"],
+                row["line"],
+            )
+        )
+        _write_report(path, rows)
+
+
+class ReportBuffer:
+    """Estimates of the files checked by a process, written to the report at once."""
+
+    def __init__(self, path: str) -> None:
+        """Instantiate the buffer.
+
+        Args:
+            path (str): Path to the report.
+        """
+        self.path = path
+        self._estimates: dict[str, list[CostEstimate]] = {}
+        self._pid = 0
+
+    def add(self, filename: str, estimates: Iterable[CostEstimate]) -> None:
+        """Buffer the estimates of a file. They are written when the process exits."""
+        if self._pid != os.getpid():
+            # Flake8 checks files in worker processes, which do not run `atexit`
+            # handlers, but run the finalizers of `multiprocessing` when they exit
+            self._pid = os.getpid()
+            self._estimates = {}
+            multiprocessing_util.Finalize(self, self.flush, exitpriority=10)
+        self._estimates[filename] = list(estimates)
+
+    def flush(self) -> None:
+        """Write the buffered estimates to the report."""
+        if self._estimates:
+            update_report(self.path, self._estimates)
+            self._estimates = {}
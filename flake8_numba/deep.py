@@ -0,0 +1,377 @@
+"""Opt-in check that compiles the eager signatures of jitted functions with numba.
+
+Some errors can only be confirmed by numba itself, such as operations not supported for
+the dtype declared in a signature. With `--numba-deep`, each top-level function with
+eager signatures is compiled in a separate worker process, together with the imports,
+constants and functions of its module that it needs. Workers are plain subprocesses,
+since Flake8 may already run the checks within daemonic processes. They are reused for
+several functions, so that numba is only imported once per worker, and are killed if a
+compilation takes longer than a timeout or crashes them. They exit when the compiler is
+closed or when the process that started them exits. Typing errors and object mode
+fallbacks are reported by rules `NBA411` and `NBA412`.
+
+Results are cached on disk, one file per function, keyed by the hash of the compiled
+source and the numba and Python versions, so repeated runs only compile what changed.
+Functions whose dependencies can not be reproduced in isolation (relative imports,
+classes, constants computed with side effects...) are not compiled.
+"""
+import ast
+import atexit
+import contextlib
+import hashlib
+import importlib.metadata as importlib_metadata
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, ClassVar, Final, NamedTuple, Optional
+
+from flake8_numba.callgraph import FunctionInfo
+from flake8_numba.symbols import ModuleIndex, get_module_index
+
+DEFAULT_CACHE_DIR: Final = ".flake8_numba_deep"
+"""Directory where results are cached if no path is given."""
+DEFAULT_TIMEOUT: Final = 60.0
+"""Seconds given to compile each function before killing its worker."""
+_RESULT_ATTRIBUTE: Final = "_flake8_numba_deep"
+"""Attribute of function nodes where the pending result is stored."""
+_NOISE: Final = ("Failed in ", "During: ", "File ", "<source missing")
+"""Lines of numba error messages that do not describe the error itself."""
+_REPLY_PREFIX: Final = "flake8-numba-deep:"
+"""Prefix of the lines with results written by workers, unlike prints of the snippets."""
+
+
+class DeepResult(NamedTuple):
+    """Result of compiling a function in a worker."""
+
+    status: str
+    """`ok` if it compiled, `error` if numba failed to compile it, `skipped` if its
+    module-level dependencies could not be run and `timeout` if the worker was killed."""
+    message: str
+    """Description of the error, if any."""
+    object_mode: tuple[str, ...]
+    """Signatures compiled in object mode."""
+
+
+def _defined_names(statement: ast.stmt) -> list[str]:
+    if isinstance(statement, (ast.Import, ast.ImportFrom)):
+        return [alias.asname or alias.name.split(".")[0] for alias in statement.names]
+    if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [statement.name]
+    if isinstance(statement, (ast.Assign, ast.AnnAssign)):
+        targets = (
+            statement.targets if isinstance(statement, ast.Assign) else [statement.target]
+        )
+        return [
+            node.id
+            for target in targets
+            for node in ast.walk(target)
+            if isinstance(node, ast.Name)
+        ]
+    return []
+
+
+def _is_reproducible(statement: ast.stmt, name: str, index: ModuleIndex) -> bool:
+    """Whether a module-level statement can be run in isolation without side effects."""
+    if isinstance(statement, ast.ImportFrom):
+        return not statement.level
+    if isinstance(statement, (ast.Assign, ast.AnnAssign)):
+        if name not in index.constants:
+            return False
+        # Only calls to numba are allowed, such as signatures
+        return all(
+            (index.qualified_name(node.func) or "").split(".")[0] == "numba"
+            for node in ast.walk(index.constants[name])
+            if isinstance(node, ast.Call)
+        )
+    return not isinstance(statement, ast.ClassDef)
+
+
+def build_snippet(function: FunctionInfo, index: ModuleIndex) -> Optional[str]:
+    """Get the source of a function together with the module-level code it needs.
+
+    Args:
+        function (FunctionInfo): Function defined at the top level of the module.
+        index (ModuleIndex): Index of the module.
+
+    Returns:
+        Optional[str]: Source with the needed statements in their original order,
+            followed by the function. `None` if any of them can not be reproduced.
+    """
+    module = index.call_graph.module
+    definitions: dict[str, list[ast.stmt]] = {}
+    for statement in module.body:
+        for name in _defined_names(statement):
+            definitions.setdefault(name, []).append(statement)
+
+    selected: set[ast.stmt] = set()
+    pending: list[ast.stmt] = [function.node]
+    while pending:
+        statement = pending.pop()
+        if statement in selected:
+            continue
+        selected.add(statement)
+        for node in ast.walk(statement):
+            if not isinstance(node, ast.Name) or node.id not in definitions:
+                continue
+            candidates = definitions[node.id]
+            if len(candidates) > 1 or not _is_reproducible(candidates[0], node.id, index):
+                return None
+            pending.append(candidates[0])
+    # Eager signatures are compiled as soon as the function is defined, so the
+    # functions it calls have to be defined before
+    statements = [s for s in module.body if s in selected and s is not function.node]
+    return "\n".join(ast.unparse(s) for s in [*statements, function.node])
+
+
+def _describe(error: Exception) -> str:
+    lines = [
+        line.strip() for line in re.sub(r"\x1b\[[\d;]*m", "", str(error)).split("\n")
+    ]
+    lines = [line for line in lines if line and not line.startswith(_NOISE)]
+    return lines[0] if lines else type(error).__name__
+
+
+def compile_snippet(source: str, name: str) -> DeepResult:
+    """Run a snippet built by `build_snippet`, which compiles its eager signatures.
+
+    Meant to be run in a separate process.
+
+    Args:
+        source (str): Source of the snippet.
+        name (str): Name of the function defined in its last statement.
+
+    Returns:
+        DeepResult: Result of the compilation.
+    """
+    from numba.core.errors import NumbaError  # noqa: PLC0415
+
+    *setup, target = ast.parse(source).body
+    namespace: dict[str, Any] = {"__name__": "__flake8_numba_deep__"}
+    try:
+        exec(compile(ast.Module(setup, []), "<setup>", "exec"), namespace)
+    except Exception as error:  # noqa: BLE001
+        return DeepResult("skipped", _describe(error), ())
+    try:
+        exec(compile(ast.Module([target], []), name, "exec"), namespace)
+    except NumbaError as error:
+        return DeepResult("error", _describe(error), ())
+    except Exception as error:  # noqa: BLE001
+        return DeepResult("skipped", _describe(error), ())
+    overloads = getattr(namespace[name], "overloads", {})
+    object_mode = tuple(
+        f"({', '.join(str(arg) for arg in args)})"
+        for args, result in overloads.items()
+        if result.objectmode
+    )
+    return DeepResult("ok", "", object_mode)
+
+
+class _Worker:
+    """Worker process that compiles one snippet after another."""
+
+    def __init__(self) -> None:
+        # A file, unlike a pipe, can not fill up and block the worker
+        self.stderr = tempfile.TemporaryFile("w+", encoding="utf-8")  # noqa: SIM115
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", __name__],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self.stderr,
+            text=True,
+            encoding="utf-8",
+        )
+        self.timed_out = False
+        self._error_start = 0
+
+    def run(self, request: str, timeout: float) -> Optional[str]:
+        """Send a request and wait for its reply.
+
+        Args:
+            request (str): JSON-encoded request, in a single line.
+            timeout (float): Seconds given to the worker before killing it.
+
+        Returns:
+            Optional[str]: JSON-encoded reply. `None` if the worker crashed or was killed.
+        """
+        assert self.process.stdin is not None
+        assert self.process.stdout is not None
+        # Warnings of previous snippets are not part of the error
+        self._error_start = os.lseek(self.stderr.fileno(), 0, os.SEEK_END)
+        timer = threading.Timer(timeout, self._kill)
+        timer.start()
+        try:
+            self.process.stdin.write(f"{request}\n")
+            self.process.stdin.flush()
+            for line in self.process.stdout:
+                if line.startswith(_REPLY_PREFIX):
+                    return line[len(_REPLY_PREFIX) :]
+        except OSError:
+            pass
+        finally:
+            timer.cancel()
+        return None
+
+    def error(self) -> str:
+        """Get what the worker wrote to stderr after it crashed."""
+        self.process.wait()
+        self.stderr.seek(self._error_start)
+        return self.stderr.read().strip()
+
+    def close(self) -> None:
+        """Stop the worker, letting it finish the current snippet."""
+        if self.process.stdin is not None:
+            with contextlib.suppress(OSError):
+                self.process.stdin.close()
+        self.process.wait()
+        self.stderr.close()
+
+    def _kill(self) -> None:
+        self.timed_out = True
+        self.process.kill()
+
+
+class DeepCompiler:
+    """Pool of workers compiling functions, with their results cached on disk."""
+
+    active: ClassVar[Optional["DeepCompiler"]] = None
+    """Compiler used by the rules. Disabled by default."""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        timeout: float = DEFAULT_TIMEOUT,
+        workers: Optional[int] = None,
+    ) -> None:
+        """Instantiate the compiler. Workers are only started when needed.
+
+        Args:
+            cache_dir (str, optional): Directory where results are cached.
+            timeout (float, optional): Seconds given to compile each function before
+                killing its worker.
+            workers (Optional[int], optional): Maximum number of workers running at the
+                same time. By default, as many as CPUs.
+        """
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.workers = workers or os.cpu_count() or 1
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._idle: list[_Worker] = []
+        self._lock = threading.Lock()
+        self._versions = f"{importlib_metadata.version('numba')}\n{sys.version}"
+        atexit.register(self.close)
+
+    def compile(self, source: str, name: str) -> DeepResult:
+        """Compile a snippet in a worker, unless its result is already cached.
+
+        Args:
+            source (str): Source built by `build_snippet`.
+            name (str): Name of the function defined in its last statement.
+
+        Returns:
+            DeepResult: Result of the compilation.
+        """
+        key = hashlib.sha256(f"{self._versions}\n{name}\n{source}".encode()).hexdigest()
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                status, message, object_mode = json.load(f)
+            return DeepResult(status, message, tuple(object_mode))
+
+        with self._lock:
+            worker = self._idle.pop() if self._idle else _Worker()
+        reply = worker.run(json.dumps({"source": source, "name": name}), self.timeout)
+        if reply is None:
+            error = worker.error()
+            worker.close()
+            if not worker.timed_out:
+                # Crashed workers are not cached, as they may depend on the environment
+                return DeepResult("skipped", error, ())
+            result = DeepResult("timeout", f"Killed after {self.timeout}s.", ())
+        else:
+            # The timeout may still expire right after the reply
+            if not worker.timed_out:
+                with self._lock:
+                    self._idle.append(worker)
+            else:
+                worker.close()
+            status, message, object_mode = json.loads(reply)
+            result = DeepResult(status, message, tuple(object_mode))
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(temporary_path, path)
+        return result
+
+    def submit(self, source: str, name: str) -> "Future[DeepResult]":
+        """Compile a snippet in the background. See `compile`."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers)
+        return self._executor.submit(self.compile, source, name)
+
+    def close(self) -> None:
+        """Wait for the pending compilations and stop all workers.
+
+        It is called when the interpreter exits. Workers started by processes that exit
+        without running `atexit` handlers stop as soon as their stdin is closed.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+
+def get_deep_result(node: ast.FunctionDef) -> Optional[DeepResult]:
+    """Get the result of compiling the eager signatures of a function.
+
+    The first time it is called for a module, all its functions with eager signatures
+    are submitted at once, so that they are compiled in parallel.
+
+    Args:
+        node (ast.FunctionDef): Function linked by `index_module`.
+
+    Returns:
+        Optional[DeepResult]: Result of the compilation. `None` if `--numba-deep` is not
+            enabled or if the function is not compiled.
+    """
+    compiler = DeepCompiler.active
+    if compiler is None:
+        return None
+    if not hasattr(node, _RESULT_ATTRIBUTE):
+        index = get_module_index(node)
+        for function in index.call_graph.functions.values():
+            source = None
+            if function.is_jitted and function.args and "." not in function.name:
+                source = build_snippet(function, index)
+            future = compiler.submit(source, function.name) if source else None
+            setattr(function.node, _RESULT_ATTRIBUTE, future)
+        if not hasattr(node, _RESULT_ATTRIBUTE):
+            setattr(node, _RESULT_ATTRIBUTE, None)
+    future = getattr(node, _RESULT_ATTRIBUTE, None)
+    return future.result() if future is not None else None
+
+
+def main() -> None:
+    """Worker: compile the snippets read from stdin, one per line, until it is closed."""
+    requests = sys.stdin
+    # Snippets must not consume the next requests
+    sys.stdin = open(os.devnull, encoding="utf-8")  # noqa: SIM115
+    for line in requests:
+        request = json.loads(line)
+        result = compile_snippet(request["source"], request["name"])
+        # Snippets may print as well, even without a trailing newline
+        sys.stdout.write(f"\n{_REPLY_PREFIX}{json.dumps(result)}\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
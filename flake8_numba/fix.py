@@ -0,0 +1,253 @@
+"""Apply mechanical performance fixes to the decorators of jitted functions.
+
+Available fixes:
+
+- `cache`: add `cache=True` to the top-level functions compiled with `@jit`, `@njit`, or
+    with `@vectorize` and `@guvectorize` with eager signatures.
+- `nogil`: add `nogil=True` to the functions compiled with `@jit` or `@njit`, unless they
+    run in object mode.
+- `duplicates`: remove repeated signatures from the list given to the decorator.
+- `layout`: declare arrays of the signatures given to `@jit`, `@njit` and `@cfunc` as
+    C-contiguous (`[:]` to `[::1]`, `[:, :]` to `[:, ::1]`). Not applied by default, since
+    the compiled functions no longer accept non-contiguous arrays.
+
+Only the tokens that change are rewritten, so the rest of the file (comments, formatting)
+is preserved. All the fixes of a file are written at once, only if the fixed file still
+parses, and running them again changes nothing. Signatures defined as module constants
+are not rewritten, and no options are added to decorators given `**kwargs`.
+
+```
+python -m flake8_numba.fix [PATHS] [--select cache,nogil,duplicates,layout] [--check]
+```
+"""
+
+import argparse
+import ast
+import io
+import os
+import re
+import sys
+from collections.abc import Iterator, Sequence
+from typing import Final, NamedTuple, Optional
+
+from flake8_numba.callgraph import FunctionInfo
+from flake8_numba.project_index import iter_python_files
+from flake8_numba.symbols import ModuleIndex
+
+FIXES: Final = ("cache", "nogil", "duplicates", "layout")
+"""All available fixes."""
+DEFAULT_FIXES: Final = ("cache", "nogil", "duplicates")
+"""Fixes applied if none are selected. They do not change the accepted inputs."""
+
+_LAYOUT: Final = re.compile(r"\[\s*(?::\s*,\s*)*(:)\s*\]")
+"""Array type without layout. The last group is the colon of the contiguous dimension."""
+
+
+class Edit(NamedTuple):
+    """Replacement of a span of the source."""
+
+    start: int
+    """Offset of the first character replaced."""
+    end: int
+    """Offset after the last character replaced. Equal to `start` for insertions."""
+    text: str
+    """New text."""
+
+
+class _Source:
+    """Source of a module, converting AST positions to offsets."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        # Only the line breaks of Python, unlike `str.splitlines` (e.g. form feeds)
+        self._lines = io.StringIO(text, newline="").readlines()
+        self._starts = [0]
+        for line in self._lines:
+            self._starts.append(self._starts[-1] + len(line))
+
+    def offset(self, lineno: int, col_offset: int) -> int:
+        # AST columns count UTF-8 bytes
+        line = self._lines[lineno - 1].encode("utf-8")
+        return self._starts[lineno - 1] + len(line[:col_offset].decode("utf-8"))
+
+    def start(self, node: ast.AST) -> int:
+        return self.offset(node.lineno, node.col_offset)  # type: ignore
+
+    def end(self, node: ast.AST) -> int:
+        return self.offset(node.end_lineno, node.end_col_offset)  # type: ignore
+
+
+def _contiguous(text: str) -> str:
+    """Rewrite the array types of a signature as C-contiguous."""
+    return _LAYOUT.sub(lambda m: m.group(0)[: m.start(1) - m.start(0)] + "::1]", text)
+
+
+def _signature_key(node: ast.expr, layout: bool) -> str:
+    """Text of a signature, ignoring its spacing and whether it is a string or not."""
+    is_str = isinstance(node, ast.Constant) and isinstance(node.value, str)
+    text = node.value if is_str else ast.unparse(node)  # type: ignore
+    text = re.sub(r"\s", "", text)
+    return _contiguous(text) if layout else text
+
+
+def _numba_decorator(function: FunctionInfo, index: ModuleIndex) -> Optional[ast.expr]:
+    for decorator in function.node.decorator_list:
+        func = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if (index.qualified_name(func) or "").rsplit(".", 1)[-1] == function.decorator:
+            return decorator
+    return None
+
+
+def _options_to_add(function: FunctionInfo, fixes: Sequence[str]) -> list[str]:
+    options = []
+    jit = function.decorator in ("jit", "njit")
+    vectorized = function.decorator in ("vectorize", "guvectorize") and function.args
+    top_level = "." not in function.name
+    if "cache" in fixes and "cache" not in function.options and top_level:
+        if jit or vectorized:
+            options.append("cache=True")
+    if "nogil" in fixes and "nogil" not in function.options and jit:
+        if function.option("forceobj") is not True:
+            options.append("nogil=True")
+    return options
+
+
+def _function_edits(
+    function: FunctionInfo, index: ModuleIndex, source: _Source, fixes: Sequence[str]
+) -> Iterator[Edit]:
+    decorator = _numba_decorator(function, index)
+    if decorator is None:
+        return
+
+    # Options given with `**kwargs` are unknown, and repeating one breaks the import
+    unpacked = isinstance(decorator, ast.Call) and any(
+        keyword.arg is None for keyword in decorator.keywords
+    )
+    options = "" if unpacked else ", ".join(_options_to_add(function, fixes))
+    if options and not isinstance(decorator, ast.Call):
+        yield Edit(source.end(decorator), source.end(decorator), f"({options})")
+    elif options and isinstance(decorator, ast.Call):
+        arguments = [*decorator.args, *decorator.keywords]
+        if arguments:
+            last = max(arguments, key=source.end)
+            yield Edit(source.end(last), source.end(last), f", {options}")
+        else:
+            # Right before the closing parenthesis
+            position = source.end(decorator) - 1
+            yield Edit(position, position, options)
+
+    if not isinstance(decorator, ast.Call) or not decorator.args:
+        return
+    signatures = decorator.args[0]
+    layout = "layout" in fixes and function.decorator in ("jit", "njit", "cfunc")
+    if "duplicates" in fixes and isinstance(signatures, (ast.List, ast.Tuple)):
+        seen: set[str] = set()
+        for previous, element in zip([None, *signatures.elts], signatures.elts):
+            key = _signature_key(element, layout)
+            if key in seen and previous is not None:
+                # Together with the comma that precedes it
+                yield Edit(source.end(previous), source.end(element), "")
+            seen.add(key)
+    if layout:
+        start = source.start(signatures)
+        for match in _LAYOUT.finditer(source.text, start, source.end(signatures)):
+            yield Edit(match.start(1), match.end(1), "::1")
+
+
+def fix_source(source: str, fixes: Sequence[str] = DEFAULT_FIXES) -> str:
+    """Apply fixes to the source of a module.
+
+    Args:
+        source (str): Source of the module.
+        fixes (Sequence[str], optional): Fixes to be applied. See `FIXES`.
+
+    Returns:
+        str: Fixed source. The same one if there is nothing to fix or if the fixed source
+            would not parse.
+    """
+    module = ast.parse(source)
+    index = ModuleIndex(module)
+    text = _Source(source)
+    edits = sorted(
+        (
+            edit
+            for function in index.call_graph.functions.values()
+            if function.is_jitted
+            for edit in _function_edits(function, index, text, fixes)
+        ),
+        key=lambda edit: (edit.start, edit.end),
+    )
+    parts, position = [], 0
+    for edit in edits:
+        # Edits within a removed span are discarded
+        if edit.start < position:
+            continue
+        parts.extend([source[position : edit.start], edit.text])
+        position = edit.end
+    parts.append(source[position:])
+    fixed = "".join(parts)
+    try:
+        ast.parse(fixed)
+    except SyntaxError:
+        return source
+    return fixed
+
+
+def fix_file(path: str, fixes: Sequence[str] = DEFAULT_FIXES, write: bool = True) -> bool:
+    """Apply fixes to a file, writing it once.
+
+    Args:
+        path (str): Path to the file.
+        fixes (Sequence[str], optional): Fixes to be applied. See `FIXES`.
+        write (bool, optional): Whether to write the fixed file.
+
+    Returns:
+        bool: Whether anything had to be fixed.
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        source = f.read()
+    try:
+        fixed = fix_source(source, fixes)
+    except SyntaxError:
+        return False
+    if fixed == source:
+        return False
+    if write:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(fixed)
+    return True
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Apply fixes to files or directories from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=["."], help="Files or directories.")
+    parser.add_argument(
+        "--select",
+        default=",".join(DEFAULT_FIXES),
+        help=f"Comma-separated fixes among {', '.join(FIXES)}.",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Only list the files that would change."
+    )
+    args = parser.parse_args(argv)
+    fixes = [fix.strip() for fix in args.select.split(",") if fix.strip()]
+    unknown = set(fixes) - set(FIXES)
+    if unknown:
+        parser.error(f"Unknown fixes: {', '.join(sorted(unknown))}.")
+
+    changed = 0
+    for path in args.paths:
+        files = iter_python_files(path) if os.path.isdir(path) else [path]
+        for filename in sorted(files):
+            if fix_file(filename, fixes, write=not args.check):
+                changed += 1
+                print(filename)
+    action = "would be fixed" if args.check else "fixed"
+    print(f"{changed} file(s) {action}.")
+    if args.check and changed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,617 @@
+"""Lightweight type inference over the body of jitted functions.
+
+Types declared in the decorator signatures are propagated through assignments,
+arithmetic, NumPy calls and subscripts. Only what matters for performance is tracked:
+the dtype, the number of dimensions, the memory layout and whether a value is a scalar
+or an array.
+
+This is an abstract interpretation in a single pass, in source order. Branches are not
+merged: after an `if`, a variable keeps the type of its last assignment. All assignments
+are recorded though, so that rules can compare them. Results are memoized within each
+function node.
+"""
+import ast
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Final, NamedTuple, Optional
+
+import numba
+import numpy as np
+from numba.core import types as nb_types
+from numba.core.sigutils import normalize_signature
+
+from flake8_numba.symbols import get_module_index
+from flake8_numba.utils import (
+    JIT_DECORATORS,
+    get_pos_arg_from_decorator,
+    is_decorated_with,
+)
+
+_TYPES_ATTRIBUTE: Final = "_flake8_numba_types"
+"""Attribute used to memoize the inferred types within the function node."""
+
+_KIND_ORDER: Final = {"b": 0, "u": 1, "i": 1, "f": 2, "c": 3}
+"""Order between kinds of dtypes. Scalars of a lower kind do not upcast arrays."""
+NUMPY_PREFIXES: Final = ("numpy.", "np.")
+"""Prefixes of the qualified names of NumPy functions."""
+
+_ALLOCATIONS: Final = frozenset({"empty", "zeros", "ones", "full"})
+"""NumPy functions allocating a new array given its shape."""
+_ALLOCATIONS_LIKE: Final = frozenset(
+    {"empty_like", "zeros_like", "ones_like", "full_like", "copy"}
+)
+"""NumPy functions allocating a new array like a given one."""
+_ELEMENTWISE: Final = frozenset(
+    {
+        "sqrt",
+        "exp",
+        "expm1",
+        "log",
+        "log2",
+        "log10",
+        "log1p",
+        "sin",
+        "cos",
+        "tan",
+        "arcsin",
+        "arccos",
+        "arctan",
+        "sinh",
+        "cosh",
+        "tanh",
+        "arctan2",
+        "hypot",
+        "power",
+        "floor",
+        "ceil",
+        "trunc",
+        "rint",
+        "round",
+        "cbrt",
+        "exp2",
+        "sign",
+    }
+)
+"""NumPy functions returning floats with the same shape as their input."""
+_SAME_TYPE: Final = frozenset({"abs", "absolute", "negative", "square", "fabs"})
+"""NumPy functions returning the same type as their input."""
+_REDUCTIONS: Final = frozenset({"sum", "prod", "min", "max", "amin", "amax", "cumsum"})
+"""Reductions keeping the dtype of the input."""
+_FLOAT_REDUCTIONS: Final = frozenset({"mean", "std", "var", "median", "nanmean"})
+"""Reductions returning floats."""
+_INDEX_REDUCTIONS: Final = frozenset({"argmin", "argmax"})
+"""Reductions returning indices."""
+
+
+class InferredType(NamedTuple):
+    """Abstract value tracked for each expression."""
+
+    kind: str
+    """Either `scalar`, `array` or `unknown`."""
+    dtype: str = ""
+    """NumPy name of the dtype (e.g. `float32`). Empty string if unknown."""
+    ndim: int = 0
+    """Number of dimensions. Zero for scalars."""
+    layout: str = ""
+    """Memory layout of arrays: `C`, `F` or `A` (any). Empty string for scalars."""
+
+    @property
+    def is_array(self) -> bool:
+        return self.kind == "array"
+
+    @property
+    def is_scalar(self) -> bool:
+        return self.kind == "scalar"
+
+    @property
+    def is_known(self) -> bool:
+        return self.kind != "unknown" and bool(self.dtype)
+
+    def with_dtype(self, dtype: str) -> "InferredType":
+        return self._replace(dtype=dtype) if self.kind != "unknown" else self
+
+    def __str__(self) -> str:
+        """Represent the type as it would be written in a numba signature."""
+        if not self.is_known:
+            return "unknown"
+        if self.is_scalar:
+            return self.dtype
+        dims = [":"] * self.ndim
+        if self.layout == "C":
+            dims[-1] = "::1"
+        elif self.layout == "F":
+            dims[0] = "::1"
+        return f"{self.dtype}[{', '.join(dims)}]"
+
+
+UNKNOWN: Final = InferredType("unknown")
+"""Type of any expression that could not be inferred."""
+
+
+def scalar(dtype: str) -> InferredType:
+    return InferredType("scalar", dtype)
+
+
+def array(dtype: str, ndim: int, layout: str = "C") -> InferredType:
+    return InferredType("array", dtype, ndim, layout)
+
+
+def from_numba_type(numba_type: Any) -> InferredType:
+    """Convert a numba type (e.g. `float32[::1]`) into an inferred type.
+
+    Args:
+        numba_type (Any): Type as evaluated from a decorator signature.
+
+    Returns:
+        InferredType: Equivalent type. `UNKNOWN` if it is not a number nor an array.
+    """
+    if isinstance(numba_type, nb_types.Array):
+        dtype = from_numba_type(numba_type.dtype).dtype
+        return array(dtype, numba_type.ndim, numba_type.layout) if dtype else UNKNOWN
+    if isinstance(numba_type, (nb_types.Number, nb_types.Boolean)):
+        return scalar(np.dtype(str(numba_type)).name)
+    return UNKNOWN
+
+
+def parse_dtype(name: str) -> str:
+    """Get the NumPy name of a dtype given any of its aliases (`f4`, `double`...).
+
+    Args:
+        name (str): Alias of the dtype. Prefixes such as `np.` are ignored.
+
+    Returns:
+        str: Name of the dtype. Empty string if it is not a numeric dtype.
+    """
+    name = name.rsplit(".", 1)[-1]
+    name = {"boolean": "bool", "b1": "bool", "byte": "uint8", "char": "int8"}.get(
+        name, name
+    )
+    try:
+        dtype = np.dtype(name)
+    except TypeError:
+        return ""
+    return dtype.name if dtype.kind in _KIND_ORDER else ""
+
+
+def promote(left: InferredType, right: InferredType) -> InferredType:
+    """Get the type resulting from an arithmetic operation between two values.
+
+    Scalars only upcast arrays if they are of a higher kind (e.g. a float scalar with an
+    integer array), as numba does.
+
+    Args:
+        left (InferredType): Type of the left operand.
+        right (InferredType): Type of the right operand.
+
+    Returns:
+        InferredType: Type of the result.
+    """
+    if not left.is_known or not right.is_known:
+        return UNKNOWN
+    if left.is_array != right.is_array:
+        array_, scalar_ = (left, right) if left.is_array else (right, left)
+        array_kind = _KIND_ORDER[np.dtype(array_.dtype).kind]
+        if _KIND_ORDER[np.dtype(scalar_.dtype).kind] <= array_kind:
+            return array(array_.dtype, array_.ndim)
+        return array(np.promote_types(left.dtype, right.dtype).name, array_.ndim)
+    dtype = np.promote_types(left.dtype, right.dtype).name
+    if left.is_array:
+        return array(dtype, max(left.ndim, right.ndim))
+    return scalar(dtype)
+
+
+def _to_float(type_: InferredType) -> InferredType:
+    """Type of the result of a function that always returns floats (e.g. `sqrt`)."""
+    if not type_.is_known:
+        return UNKNOWN
+    if np.dtype(type_.dtype).kind in "fc":
+        return type_._replace(layout="C") if type_.is_array else type_
+    return type_._replace(dtype="float64", layout="C" if type_.is_array else "")
+
+
+class FunctionTypes:
+    """Types inferred for a function, given one of its declared signatures."""
+
+    def __init__(
+        self,
+        node: ast.FunctionDef,
+        arguments: Sequence[InferredType],
+        return_type: InferredType = UNKNOWN,
+    ) -> None:
+        """Infer the types of all expressions within the function.
+
+        Args:
+            node (ast.FunctionDef): Node representing the function definition.
+            arguments (Sequence[InferredType]): Types of the positional arguments.
+            return_type (InferredType, optional): Declared return type, if any.
+        """
+        self.node = node
+        self.index = get_module_index(node)
+        self.return_type = return_type
+        """Return type declared in the signature."""
+        self.arguments: dict[str, InferredType] = {
+            arg.arg: type_ for arg, type_ in zip(node.args.args, arguments)
+        }
+        """Declared type of each argument."""
+        self.expressions: dict[ast.expr, InferredType] = {}
+        """Type inferred for each expression of the body."""
+        self.assignments: dict[str, list[tuple[ast.stmt, InferredType]]] = {}
+        """Types assigned to each local variable, in source order."""
+        self.returns: list[tuple[ast.Return, InferredType]] = []
+        """Type of each returned value."""
+        self.variables: dict[str, InferredType] = dict(self.arguments)
+        """Type of each variable after the last statement of the function."""
+        self._statements(node.body)
+
+    def type_of(self, expr: ast.expr) -> InferredType:
+        """Get the type inferred for an expression of the function body."""
+        return self.expressions.get(expr, UNKNOWN)
+
+    def _statements(self, statements: Iterable[ast.stmt]) -> None:
+        for statement in statements:
+            self._statement(statement)
+
+    def _statement(self, statement: ast.stmt) -> None:
+        if isinstance(statement, ast.Assign):
+            value = self._expr(statement.value)
+            for target in statement.targets:
+                self._assign(target, value, statement)
+        elif isinstance(statement, ast.AnnAssign):
+            if statement.value is not None:
+                value = self._expr(statement.value)
+                self._assign(statement.target, value, statement)
+        elif isinstance(statement, ast.AugAssign):
+            current = self._expr(statement.target)
+            value = self._binop(statement.op, current, self._expr(statement.value))
+            if isinstance(statement.target, ast.Name):
+                self._assign(statement.target, value, statement)
+        elif isinstance(statement, (ast.For, ast.AsyncFor)):
+            self._assign(statement.target, self._iterated(statement.iter), statement)
+            self._statements(statement.body)
+            self._statements(statement.orelse)
+        elif isinstance(statement, ast.Return):
+            type_ = self._expr(statement.value) if statement.value else UNKNOWN
+            self.returns.append((statement, type_))
+        elif isinstance(statement, ast.Expr):
+            self._expr(statement.value)
+        elif isinstance(statement, (ast.If, ast.While)):
+            self._expr(statement.test)
+            self._statements(statement.body)
+            self._statements(statement.orelse)
+        elif isinstance(statement, (ast.With, ast.AsyncWith)):
+            for item in statement.items:
+                self._expr(item.context_expr)
+            self._statements(statement.body)
+        elif isinstance(statement, ast.Try):
+            self._statements(statement.body)
+            for handler in statement.handlers:
+                self._statements(handler.body)
+            self._statements(statement.orelse)
+            self._statements(statement.finalbody)
+
+    def _assign(self, target: ast.expr, value: InferredType, statement: ast.stmt) -> None:
+        if isinstance(target, ast.Name):
+            self.variables[target.id] = value
+            self.assignments.setdefault(target.id, []).append((statement, value))
+            self.expressions[target] = value
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for element in target.elts:
+                self._assign(element, UNKNOWN, statement)
+        else:
+            self._expr(target)
+
+    def _iterated(self, expr: ast.expr) -> InferredType:
+        """Type of the values produced when iterating over an expression."""
+        if isinstance(expr, ast.Call) and self._name(expr.func) in ("range", "prange"):
+            for arg in expr.args:
+                self._expr(arg)
+            return scalar("int64")
+        type_ = self._expr(expr)
+        if type_.is_array:
+            if type_.ndim == 1:
+                return scalar(type_.dtype)
+            return array(type_.dtype, type_.ndim - 1, "C" if type_.layout == "C" else "A")
+        return UNKNOWN
+
+    def _name(self, expr: ast.expr) -> str:
+        """Qualified name of a function, with `numba.prange` shortened to `prange`."""
+        name = self.index.qualified_name(expr) or ""
+        if name.startswith(("numba.", "nb.")):
+            return name.rsplit(".", 1)[-1]
+        return name
+
+    def _expr(self, expr: ast.expr) -> InferredType:
+        type_ = self._infer(expr)
+        self.expressions[expr] = type_
+        return type_
+
+    def _infer(self, expr: ast.expr) -> InferredType:
+        if isinstance(expr, ast.Constant):
+            value = expr.value
+            if isinstance(value, bool):
+                return scalar("bool")
+            if isinstance(value, int):
+                return scalar("int64")
+            if isinstance(value, float):
+                return scalar("float64")
+            if isinstance(value, complex):
+                return scalar("complex128")
+            return UNKNOWN
+        if isinstance(expr, ast.Name):
+            return self.variables.get(expr.id, UNKNOWN)
+        if isinstance(expr, ast.BinOp):
+            left, right = self._expr(expr.left), self._expr(expr.right)
+            return self._binop(expr.op, left, right)
+        if isinstance(expr, ast.UnaryOp):
+            operand = self._expr(expr.operand)
+            if isinstance(expr.op, ast.Not):
+                return scalar("bool")
+            return operand
+        if isinstance(expr, ast.Compare):
+            types_ = [self._expr(expr.left)] + [self._expr(c) for c in expr.comparators]
+            ndim = max((t.ndim for t in types_ if t.is_array), default=0)
+            return array("bool", ndim) if ndim else scalar("bool")
+        if isinstance(expr, ast.BoolOp):
+            types_ = [self._expr(value) for value in expr.values]
+            return types_[0] if len(set(types_)) == 1 else UNKNOWN
+        if isinstance(expr, ast.IfExp):
+            self._expr(expr.test)
+            body, orelse = self._expr(expr.body), self._expr(expr.orelse)
+            return body if body == orelse else promote(body, orelse)
+        if isinstance(expr, ast.Subscript):
+            return self._subscript(expr)
+        if isinstance(expr, ast.Attribute):
+            return self._attribute(expr)
+        if isinstance(expr, ast.Call):
+            return self._call(expr)
+        for child in ast.iter_child_nodes(expr):
+            if isinstance(child, ast.expr):
+                self._expr(child)
+        return UNKNOWN
+
+    def _binop(
+        self, op: ast.operator, left: InferredType, right: InferredType
+    ) -> InferredType:
+        result = promote(left, right)
+        if not result.is_known:
+            return result
+        kind = np.dtype(result.dtype).kind
+        if isinstance(op, ast.Div) and kind in "biu":
+            return result.with_dtype("float64")
+        if isinstance(op, ast.MatMult):
+            return UNKNOWN
+        if kind == "b" and not isinstance(op, (ast.BitAnd, ast.BitOr, ast.BitXor)):
+            return result.with_dtype("int64")
+        return result
+
+    def _subscript(self, expr: ast.Subscript) -> InferredType:
+        value = self._expr(expr.value)
+        indices = expr.slice.elts if isinstance(expr.slice, ast.Tuple) else [expr.slice]
+        index_types = [
+            UNKNOWN if isinstance(index, ast.Slice) else self._expr(index)
+            for index in indices
+        ]
+        for index in indices:
+            if isinstance(index, ast.Slice):
+                for part in (index.lower, index.upper, index.step):
+                    if part is not None:
+                        self._expr(part)
+        if not value.is_array:
+            shape = expr.value
+            if isinstance(shape, ast.Attribute) and shape.attr in ("shape", "strides"):
+                # E.g. `a.shape[0]`
+                return scalar("int64") if self.type_of(shape.value).is_array else UNKNOWN
+            return UNKNOWN
+
+        if any(t.is_array for t in index_types):
+            # Boolean masks and fancy indexing always create a new array
+            return array(value.dtype, 1)
+        n_integers = sum(not isinstance(index, ast.Slice) for index in indices)
+        ndim = value.ndim - n_integers
+        if ndim <= 0:
+            return scalar(value.dtype)
+        contiguous = value.layout == "C" and all(
+            isinstance(index, ast.Slice) and index.step is None for index in indices[1:]
+        )
+        return array(value.dtype, ndim, "C" if contiguous else "A")
+
+    def _attribute(self, expr: ast.Attribute) -> InferredType:
+        name = self.index.qualified_name(expr) or ""
+        if name in ("math.pi", "math.e", "math.inf", "math.nan") or (
+            name.startswith(NUMPY_PREFIXES) and name.rsplit(".", 1)[-1] in ("pi", "e")
+        ):
+            return scalar("float64")
+        value = self._expr(expr.value)
+        if not value.is_array:
+            return UNKNOWN
+        if expr.attr == "T":
+            layout = {"C": "F", "F": "C"}.get(value.layout, "A")
+            return value._replace(layout=layout)
+        if expr.attr in ("size", "ndim"):
+            return scalar("int64")
+        if expr.attr in ("real", "imag") and value.dtype.startswith("complex"):
+            # Extended precision (e.g. `complex256`) is not supported by numba
+            half = {"complex64": "float32", "complex128": "float64"}.get(value.dtype)
+            return value._replace(dtype=half, layout="A") if half else UNKNOWN
+        return UNKNOWN
+
+    def _dtype_argument(self, expr: Optional[ast.expr]) -> str:
+        if expr is None:
+            return ""
+        if isinstance(expr, ast.Constant) and isinstance(expr.value, str):
+            return parse_dtype(expr.value)
+        if isinstance(expr, ast.Name) and expr.id in ("float", "int", "bool", "complex"):
+            return {"float": "float64", "int": "int64"}.get(expr.id, expr.id)
+        return parse_dtype(self.index.qualified_name(expr) or "")
+
+    def _call(self, expr: ast.Call) -> InferredType:
+        args = [self._expr(arg) for arg in expr.args]
+        kwargs: Mapping[Optional[str], ast.expr] = {k.arg: k.value for k in expr.keywords}
+        for keyword in expr.keywords:
+            self._expr(keyword.value)
+        first = args[0] if args else UNKNOWN
+        if isinstance(expr.func, ast.Attribute) and not self._is_module(expr.func.value):
+            # Method of an array
+            value = self._expr(expr.func.value)
+            return self._method(expr.func.attr, value, expr, kwargs)
+
+        name = self._name(expr.func)
+        short_name = name.rsplit(".", 1)[-1]
+        if name.startswith(NUMPY_PREFIXES):
+            if short_name in _ALLOCATIONS:
+                dtype = self._dtype_argument(kwargs.get("dtype"))
+                if not dtype and short_name == "full" and len(args) > 1:
+                    dtype = args[1].dtype
+                shape = expr.args[0] if expr.args else None
+                ndim = len(shape.elts) if isinstance(shape, ast.Tuple) else 1
+                order = kwargs.get("order")
+                is_f = isinstance(order, ast.Constant) and order.value == "F"
+                return array(dtype or "float64", ndim, "F" if is_f else "C")
+            if short_name in _ALLOCATIONS_LIKE and first.is_array:
+                dtype = self._dtype_argument(kwargs.get("dtype")) or first.dtype
+                return array(dtype, first.ndim)
+            if short_name in ("arange", "linspace"):
+                float_args = any(
+                    np.dtype(a.dtype).kind == "f" for a in args if a.is_known
+                )
+                is_float = short_name == "linspace" or float_args
+                return array("float64" if is_float else "int64", 1)
+            if short_name in _ELEMENTWISE:
+                return _to_float(promote(first, args[1]) if len(args) > 1 else first)
+            if short_name in _SAME_TYPE:
+                return first._replace(layout="C") if first.is_array else first
+            if short_name == "dot" and len(args) == 2:
+                if args[0].ndim == 1 and args[1].ndim == 1:
+                    return scalar(promote(args[0], args[1]).dtype or "float64")
+                return UNKNOWN
+            dtype = parse_dtype(short_name) if hasattr(np, short_name) else ""
+            if dtype:
+                # Scalar types used to cast values. E.g. `np.float32(x)`
+                return first.with_dtype(dtype) if first.is_array else scalar(dtype)
+            return self._method(short_name, first, expr, kwargs)
+        if name.startswith("math."):
+            if short_name in ("floor", "ceil", "trunc", "factorial", "gcd"):
+                return scalar("int64")
+            if short_name in ("isnan", "isinf", "isfinite"):
+                return scalar("bool")
+            return scalar("float64")
+        if name in ("float", "int", "bool", "complex"):
+            return scalar(self._dtype_argument(expr.func))
+        if name in ("abs", "min", "max") and args:
+            result = args[0]
+            for arg in args[1:]:
+                result = promote(result, arg)
+            return result
+        if name == "len":
+            return scalar("int64")
+        if name.count(".") <= 1 and name.split(".")[0] in (short_name, "numba", "nb"):
+            if isinstance(getattr(numba, short_name, None), nb_types.Number):
+                # Numba types used to cast values. E.g. `float32(x)`
+                return scalar(parse_dtype(str(getattr(numba, short_name))))
+        return UNKNOWN
+
+    def _is_module(self, expr: ast.expr) -> bool:
+        name = self.index.qualified_name(expr) or ""
+        return name.split(".")[0] in ("np", "numpy", "math", "nb", "numba")
+
+    def _method(
+        self,
+        name: str,
+        value: InferredType,
+        expr: ast.Call,
+        kwargs: Mapping[Optional[str], ast.expr],
+    ) -> InferredType:
+        if not value.is_array:
+            return UNKNOWN
+        has_axis = "axis" in kwargs or len(expr.args) > int(name in ("copy", "astype"))
+        if name in ("copy", "ravel", "flatten"):
+            ndim = value.ndim if name == "copy" else 1
+            return array(value.dtype, ndim)
+        if name == "astype" and expr.args:
+            return array(self._dtype_argument(expr.args[0]) or value.dtype, value.ndim)
+        if name == "reshape":
+            shape = expr.args[0] if len(expr.args) == 1 else None
+            ndim = len(shape.elts) if isinstance(shape, ast.Tuple) else len(expr.args)
+            return array(value.dtype, ndim, value.layout)
+        if name in _REDUCTIONS | _FLOAT_REDUCTIONS | _INDEX_REDUCTIONS:
+            if name in _INDEX_REDUCTIONS:
+                dtype = "int64"
+            elif name in _FLOAT_REDUCTIONS:
+                dtype = _to_float(scalar(value.dtype)).dtype
+            elif name in ("sum", "prod", "cumsum") and np.dtype(value.dtype).kind in "bi":
+                dtype = "int64"
+            else:
+                dtype = value.dtype
+            if name == "cumsum":
+                return array(dtype, 1)
+            if has_axis and value.ndim > 1:
+                return array(dtype, value.ndim - 1)
+            return scalar(dtype)
+        return UNKNOWN
+
+
+def get_signatures(node: ast.FunctionDef) -> list[Any]:
+    """Get the signatures declared in the decorator of a jitted function.
+
+    Args:
+        node (ast.FunctionDef): Node representing the function definition.
+
+    Returns:
+        list[Any]: Evaluated signatures, either `numba` signatures or tuples of types.
+            Empty if none could be evaluated.
+    """
+    if not is_decorated_with(JIT_DECORATORS, node):
+        return []
+    signatures = get_pos_arg_from_decorator(0, node).numba_signature
+    if signatures is None or isinstance(signatures, str):
+        return []
+    if not isinstance(signatures, (list, tuple)) or (
+        isinstance(signatures, tuple) and not is_decorated_with("guvectorize", node)
+    ):
+        signatures = [signatures]
+    evaluated = []
+    for signature in signatures:
+        if isinstance(signature, str):
+            # Strings within lists are not evaluated. E.g. `["float32(float32)"]`
+            try:
+                args, return_type = normalize_signature(  # type: ignore[no-untyped-call]
+                    signature
+                )
+            except Exception:  # noqa: BLE001
+                continue
+            evaluated.append(return_type(*args) if return_type else tuple(args))
+        elif hasattr(signature, "args") or isinstance(signature, tuple):
+            evaluated.append(signature)
+    return evaluated
+
+
+def infer_types(node: ast.FunctionDef) -> tuple[FunctionTypes, ...]:
+    """Infer the types within a function, once per signature declared in its decorator.
+
+    Functions without declared signatures are inferred once, with unknown arguments.
+    Results are only computed the first time.
+
+    Args:
+        node (ast.FunctionDef): Node representing the function definition.
+
+    Returns:
+        tuple[FunctionTypes, ...]: Types inferred for each signature.
+    """
+    inferred = getattr(node, _TYPES_ATTRIBUTE, None)
+    if inferred is not None:
+        return inferred  # type: ignore
+    results: list[FunctionTypes] = []
+    for signature in get_signatures(node):
+        arguments = signature.args if hasattr(signature, "args") else signature
+        return_type = getattr(signature, "return_type", None)
+        results.append(
+            FunctionTypes(
+                node,
+                [from_numba_type(arg) for arg in arguments],
+                from_numba_type(return_type) if return_type is not None else UNKNOWN,
+            )
+        )
+    if not results:
+        results.append(FunctionTypes(node, []))
+    inferred = tuple(results)
+    setattr(node, _TYPES_ATTRIBUTE, inferred)
+    return inferred
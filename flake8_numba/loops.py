@@ -0,0 +1,355 @@
+"""Model of the loop nest of a function and of the arrays accessed within it.
+
+Each loop records its induction variable and its bounds when it iterates over `range`
+or `prange`, together with the names assigned within its body. Each subscript of the
+function is recorded as an array access, whose index expressions are described
+relative to the induction variables of the loops enclosing it. For instance, within
+`for i in range(n)` and `for j in range(m)`, the access `a[i, 2 * j + 1]` has
+coefficient 1 for `i` in its first index and coefficient 2 for `j` in its second index.
+
+Like the control-flow graph, the model is built lazily the first time it is requested
+for a function and it is shared by all rules.
+"""
+
+import ast
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Final, NamedTuple, Optional, Union
+
+from flake8_numba.symbols import ModuleIndex, get_module_index
+
+_LOOPS_ATTRIBUTE: Final = "_flake8_numba_loops"
+"""Attribute used to memoize the loop nest within the function node."""
+
+LoopNode = Union[ast.For, ast.AsyncFor, ast.While]
+"""Statements that define a loop."""
+_SCOPES: Final = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+"""Nodes defining a new scope, whose loops belong to another function."""
+
+
+class Loop:
+    """Single loop of a function."""
+
+    def __init__(
+        self, node: LoopNode, parent: Optional["Loop"], index: ModuleIndex
+    ) -> None:
+        """Describe a loop. Its header is parsed, but not its body.
+
+        Args:
+            node (LoopNode): Statement defining the loop.
+            parent (Optional[Loop]): Innermost loop enclosing this one, if any.
+            index (ModuleIndex): Index of the module, used to resolve `prange`.
+        """
+        self.node = node
+        self.parent = parent
+        self.children: list[Loop] = []
+        """Loops directly nested within this one."""
+        self.depth: int = parent.depth + 1 if parent is not None else 0
+        """Number of loops enclosing this one."""
+        self.kind = "while"
+        """Either `range`, `prange`, `enumerate`, `iter` (over any object) or `while`."""
+        self.variable: Optional[str] = None
+        """Induction variable, for loops over `range`, `prange` or `enumerate`."""
+        self.start: Optional[ast.expr] = None
+        """First value of the induction variable, if known."""
+        self.stop: Optional[ast.expr] = None
+        """Upper bound (excluded) of the induction variable, if known."""
+        self.step: Optional[ast.expr] = None
+        """Increment of the induction variable, if known."""
+        self.assigned: set[str] = set()
+        """Names assigned within the loop, including its target and nested loops."""
+
+        if isinstance(node, ast.While):
+            self.assigned.update(_stored_names(node.body))
+            return
+        self.assigned.update(_stored_names([node.target, *node.body]))
+        self.kind = "iter"
+        if not isinstance(node.iter, ast.Call):
+            return
+        name = index.qualified_name(node.iter.func) or ""
+        call_name = name.rsplit(".", 1)[-1] if name.startswith("numba.") else name
+        args = node.iter.args
+        if call_name in ("range", "prange") and isinstance(node.target, ast.Name):
+            self.kind = call_name
+            self.variable = node.target.id
+            if len(args) == 1:
+                self.start, self.stop = ast.Constant(0), args[0]
+            elif len(args) > 1:
+                self.start, self.stop = args[0], args[1]
+            self.step = args[2] if len(args) > 2 else ast.Constant(1)
+        elif call_name == "enumerate" and isinstance(node.target, ast.Tuple):
+            first = node.target.elts[0] if node.target.elts else None
+            if isinstance(first, ast.Name):
+                self.kind = "enumerate"
+                self.variable = first.id
+                self.start, self.step = ast.Constant(0), ast.Constant(1)
+
+    def __repr__(self) -> str:
+        """Represent the loop with its kind, its variable and its line."""
+        return f"Loop({self.kind}, variable={self.variable}, line={self.node.lineno})"
+
+    @property
+    def is_parallel(self) -> bool:
+        return self.kind == "prange"
+
+    @property
+    def trip_count(self) -> Optional[int]:
+        """Number of iterations, if the bounds are constant integers."""
+        bounds = [_constant_int(expr) for expr in (self.start, self.stop, self.step)]
+        start, stop, step = bounds
+        if start is None or stop is None or not step:
+            return None
+        # `len(range(...))` overflows for bounds that do not fit in a C integer
+        return max(0, -((start - stop) // step))
+
+    def ancestors(self) -> Iterator["Loop"]:
+        """Iterate over the loops enclosing this one, from the innermost."""
+        loop = self.parent
+        while loop is not None:
+            yield loop
+            loop = loop.parent
+
+    def induction_variables(self) -> dict[str, "Loop"]:
+        """Get the induction variables in scope within the body of this loop.
+
+        Returns:
+            dict[str, Loop]: Loop that defines each variable. If a variable is defined
+                by several nested loops, the innermost one is used.
+        """
+        variables: dict[str, Loop] = {}
+        for loop in (self, *self.ancestors()):
+            if loop.variable is not None and loop.variable not in variables:
+                variables[loop.variable] = loop
+        return variables
+
+
+class IndexExpression(NamedTuple):
+    """Single index of an array access, such as `i + 1` in `a[i + 1, :]`."""
+
+    expr: ast.expr
+    """Expression used as index. For slices, the `ast.Slice` node."""
+    variables: frozenset[str]
+    """Induction variables of the enclosing loops used within the expression."""
+    coefficients: Optional[Mapping[str, Optional[int]]]
+    """Coefficient of each induction variable if the index is linear in them (e.g.
+    `2 * i + j`). Coefficients that are not integer constants (e.g. `n * i`) are `None`.
+    `None` if the index is not linear or it is a slice.
+    """
+    offset: Optional[int]
+    """Constant term of a linear index (e.g. `1` in `2 * i + 1`). `None` if it is not an
+    integer constant (e.g. `n - i`) or the index is not linear."""
+
+    @property
+    def is_slice(self) -> bool:
+        return isinstance(self.expr, ast.Slice)
+
+
+class ArrayAccess(NamedTuple):
+    """Subscript of an object within a function."""
+
+    node: ast.Subscript
+    """Node representing the subscript."""
+    array: Optional[str]
+    """Name of the subscripted object (e.g. `a` or `self.a`). `None` if it is not a
+    name nor an attribute chain."""
+    indices: tuple[IndexExpression, ...]
+    """Index used for each dimension."""
+    loop: Optional[Loop]
+    """Innermost loop where the access happens. `None` if it is not within a loop."""
+
+    @property
+    def is_store(self) -> bool:
+        return isinstance(self.node.ctx, ast.Store)
+
+
+class LoopNest:
+    """Loops of a single function and arrays accessed within them."""
+
+    def __init__(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
+        """Build the model with a single pass over the function body.
+
+        Args:
+            node (Union[ast.FunctionDef, ast.AsyncFunctionDef]): Node representing the
+                function definition.
+        """
+        self.index = get_module_index(node)
+        self.loops: list[Loop] = []
+        """All loops of the function, in source order."""
+        self.accesses: list[ArrayAccess] = []
+        """All subscripts of the function, in source order."""
+        self._loop_of: dict[ast.AST, Loop] = {}
+        for statement in node.body:
+            self._visit(statement, None)
+
+    @property
+    def roots(self) -> list[Loop]:
+        """Loops that are not nested within any other loop."""
+        return [loop for loop in self.loops if loop.parent is None]
+
+    def loop_of(self, node: ast.AST) -> Optional[Loop]:
+        """Get the innermost loop whose body contains a statement or an expression.
+
+        Args:
+            node (ast.AST): Statement or expression of the function.
+
+        Returns:
+            Optional[Loop]: Innermost loop. `None` if it is not within any loop.
+        """
+        return self._loop_of.get(node)
+
+    def accesses_within(self, loop: Loop) -> Iterator[ArrayAccess]:
+        """Iterate over the array accesses within a loop, including nested loops."""
+        for access in self.accesses:
+            if access.loop is loop or (
+                access.loop is not None and loop in access.loop.ancestors()
+            ):
+                yield access
+
+    def _visit(self, node: ast.AST, loop: Optional[Loop]) -> None:
+        if isinstance(node, _SCOPES):
+            return
+        if loop is not None:
+            self._loop_of[node] = loop
+        if isinstance(node, (ast.For, ast.AsyncFor, ast.While)):
+            self._visit_loop(node, loop)
+            return
+        if isinstance(node, ast.Subscript):
+            self.accesses.append(_array_access(node, loop, self.index))
+        for child in ast.iter_child_nodes(node):
+            self._visit(child, loop)
+
+    def _visit_loop(self, node: LoopNode, parent: Optional[Loop]) -> None:
+        loop = Loop(node, parent, self.index)
+        self.loops.append(loop)
+        if parent is not None:
+            parent.children.append(loop)
+        # The header is evaluated outside of the loop
+        header = [node.test] if isinstance(node, ast.While) else [node.target, node.iter]
+        for child in header:
+            self._visit(child, parent)
+        for statement in node.body:
+            self._visit(statement, loop)
+        for statement in node.orelse:
+            self._visit(statement, parent)
+
+
+def _stored_names(nodes: Iterable[ast.AST]) -> Iterator[str]:
+    for node in nodes:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+                yield child.id
+
+
+def _constant_int(expr: Optional[ast.expr]) -> Optional[int]:
+    if isinstance(expr, ast.UnaryOp) and isinstance(expr.op, ast.USub):
+        value = _constant_int(expr.operand)
+        return -value if value is not None else None
+    if isinstance(expr, ast.Constant) and type(expr.value) is int:
+        return expr.value
+    return None
+
+
+def _linear(
+    expr: ast.expr, variables: Mapping[str, Loop]
+) -> Optional[dict[str, Optional[int]]]:
+    """Get the coefficient of each induction variable in a linear expression.
+
+    Returns:
+        Optional[dict[str, Optional[int]]]: Coefficients. `None` if the expression is
+            not linear in the induction variables.
+    """
+    if isinstance(expr, ast.Name) and expr.id in variables:
+        return {expr.id: 1}
+    if not any(
+        isinstance(child, ast.Name) and child.id in variables for child in ast.walk(expr)
+    ):
+        # Terms that do not depend on the loops (e.g. `n + 1`)
+        return {}
+    if isinstance(expr, ast.UnaryOp) and isinstance(expr.op, (ast.USub, ast.UAdd)):
+        operand = _linear(expr.operand, variables)
+        if operand is None or isinstance(expr.op, ast.UAdd):
+            return operand
+        return {name: -c if c is not None else None for name, c in operand.items()}
+    if not isinstance(expr, ast.BinOp):
+        return None
+
+    left, right = _linear(expr.left, variables), _linear(expr.right, variables)
+    if left is None or right is None:
+        return None
+    if isinstance(expr.op, (ast.Add, ast.Sub)):
+        sign = 1 if isinstance(expr.op, ast.Add) else -1
+        result = dict(left)
+        for name, coefficient in right.items():
+            signed = coefficient * sign if coefficient is not None else None
+            if name not in result:
+                result[name] = signed
+                continue
+            previous = result[name]
+            if previous is None or signed is None:
+                result[name] = None
+            else:
+                result[name] = previous + signed
+        return result
+    if isinstance(expr.op, ast.Mult) and (not left or not right):
+        terms, factor_expr = (left, expr.right) if left else (right, expr.left)
+        factor = _constant_int(factor_expr)
+        return {
+            name: c * factor if c is not None and factor is not None else None
+            for name, c in terms.items()
+        }
+    return None
+
+
+def _offset(expr: ast.expr, variables: Mapping[str, Loop]) -> Optional[int]:
+    """Get the constant term of a linear expression, with induction variables set to 0."""
+    if isinstance(expr, ast.Name) and expr.id in variables:
+        return 0
+    if isinstance(expr, ast.UnaryOp) and isinstance(expr.op, (ast.USub, ast.UAdd)):
+        operand = _offset(expr.operand, variables)
+        if operand is None or isinstance(expr.op, ast.UAdd):
+            return operand
+        return -operand
+    if isinstance(expr, ast.BinOp) and isinstance(expr.op, (ast.Add, ast.Sub, ast.Mult)):
+        left, right = _offset(expr.left, variables), _offset(expr.right, variables)
+        if left is None or right is None:
+            return None
+        if isinstance(expr.op, ast.Mult):
+            # One of the factors is a constant, since the expression is linear
+            return left * right
+        return left + right if isinstance(expr.op, ast.Add) else left - right
+    return _constant_int(expr)
+
+
+def _array_access(
+    node: ast.Subscript, loop: Optional[Loop], index: ModuleIndex
+) -> ArrayAccess:
+    variables = loop.induction_variables() if loop is not None else {}
+    indices = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+    expressions = []
+    for expr in indices:
+        used = frozenset(
+            child.id
+            for child in ast.walk(expr)
+            if isinstance(child, ast.Name) and child.id in variables
+        )
+        coefficients = None if isinstance(expr, ast.Slice) else _linear(expr, variables)
+        offset = _offset(expr, variables) if coefficients is not None else None
+        expressions.append(IndexExpression(expr, used, coefficients, offset))
+    name = index.qualified_name(node.value)
+    return ArrayAccess(node, name, tuple(expressions), loop)
+
+
+def get_loop_nest(node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> LoopNest:
+    """Get the loop nest of a function, building it only the first time.
+
+    Args:
+        node (Union[ast.FunctionDef, ast.AsyncFunctionDef]): Node representing the
+            function definition.
+
+    Returns:
+        LoopNest: Loops and array accesses of the function.
+    """
+    nest = getattr(node, _LOOPS_ATTRIBUTE, None)
+    if nest is None:
+        nest = LoopNest(node)
+        setattr(node, _LOOPS_ATTRIBUTE, nest)
+    return nest
@@ -0,0 +1,185 @@
+"""Index of the NumPy, `math` and builtin functions supported in nopython mode.
+
+Calls to functions that numba can not compile only fail when the jitted function is
+called for the first time. The functions (and array methods) supported by each numba
+version are precomputed and shipped in `data/nopython_support.json`, so that each call
+can be looked up in constant time while linting, without compiling anything.
+
+Each version is stored either with its full lists of supported and unsupported names, or
+only with the names whose support changed with respect to a `base` version. The data of
+the installed numba version can be added with:
+
+```
+python -m flake8_numba.nopython [--base VERSION]
+```
+"""
+
+import argparse
+import importlib.metadata as importlib_metadata
+import json
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Final, Optional
+
+import numpy as np
+from numba.core import types
+from numba.core.registry import cpu_target
+
+DATA_PATH: Final = os.path.join(
+    os.path.dirname(__file__), "data", "nopython_support.json"
+)
+"""Path to the file shipped with the precomputed data."""
+MODULES: Final = ("builtins", "math", "cmath", "numpy", "numpy.linalg", "numpy.random")
+"""Modules whose public functions are indexed."""
+ARRAY_METHODS: Final = "ndarray"
+"""Prefix used for methods and attributes of arrays (e.g. `ndarray.sum`)."""
+
+
+class SupportIndex:
+    """Functions supported in nopython mode by a given numba version."""
+
+    def __init__(self, version: str, support: Mapping[str, bool]) -> None:
+        """Instantiate the index.
+
+        Args:
+            version (str): Numba version, as `major.minor`.
+            support (Mapping[str, bool]): Whether each qualified name (e.g. `numpy.sum`
+                or `ndarray.sum`) is supported.
+        """
+        self.version = version
+        self._support = dict(support)
+
+    def is_supported(self, qualified_name: str) -> Optional[bool]:
+        """Check whether a function or array method is supported in nopython mode.
+
+        Args:
+            qualified_name (str): Name such as `numpy.linalg.norm`, `math.sqrt`, `len`
+                or `ndarray.sum`. Builtins can be given with or without `builtins.`.
+
+        Returns:
+            Optional[bool]: `None` if the name is not indexed.
+        """
+        if "." not in qualified_name:
+            qualified_name = f"builtins.{qualified_name}"
+        return self._support.get(qualified_name)
+
+
+def _version_key(version: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in version.split(".")[:2] if part.isdigit())
+
+
+def _resolve(versions: Mapping[str, Any], version: str) -> dict[str, bool]:
+    """Get the support of each name for a version, applying the changes of its base."""
+    data = versions[version]
+    support = _resolve(versions, data["base"]) if "base" in data else {}
+    support.update((name, True) for name in data.get("supported", ()))
+    support.update((name, False) for name in data.get("unsupported", ()))
+    return support
+
+
+@lru_cache
+def load_support_index(version: str = "", path: str = DATA_PATH) -> SupportIndex:
+    """Load the data of the closest version that is not newer than the given one.
+
+    Args:
+        version (str, optional): Numba version. By default, the installed one.
+        path (str, optional): File with the precomputed data.
+
+    Returns:
+        SupportIndex: Index of the closest version. If all versions are newer, an empty
+            index, since functions supported by them may not be supported yet.
+    """
+    version = version or importlib_metadata.version("numba")
+    with open(path, encoding="utf-8") as f:
+        versions = json.load(f)["versions"]
+    available = sorted(versions, key=_version_key)
+    target = _version_key(version)
+    candidates = [v for v in available if _version_key(v) <= target]
+    if not candidates:
+        return SupportIndex(version, {})
+    return SupportIndex(candidates[-1], _resolve(versions, candidates[-1]))
+
+
+def _public_callables(module: Any) -> Iterable[str]:
+    for name in dir(module):
+        if not name.startswith("_") and callable(getattr(module, name, None)):
+            yield name
+
+
+def generate() -> dict[str, bool]:
+    """Compute the support of each indexed name with the installed numba version.
+
+    A function is supported if numba can resolve its type, which is what happens when a
+    jitted function calling it is compiled.
+
+    Returns:
+        dict[str, bool]: Whether each qualified name is supported.
+    """
+    # Registers all the implementations, some of which are loaded lazily
+    cpu_target.target_context.refresh()
+    context = cpu_target.typing_context
+    context.refresh()
+
+    def resolves(function: Any) -> bool:
+        try:
+            context.resolve_value_type(function)
+        except Exception:  # noqa: BLE001
+            return False
+        return True
+
+    support: dict[str, bool] = {}
+    for module_name in MODULES:
+        module = import_module(module_name)
+        for name in _public_callables(module):
+            support[f"{module_name}.{name}"] = resolves(getattr(module, name))
+
+    array = types.Array(types.float64, 2, "C")
+    for name in dir(np.ndarray):
+        if not name.startswith("_"):
+            try:
+                supported = context.resolve_getattr(array, name) is not None
+            except Exception:  # noqa: BLE001
+                supported = False
+            support[f"{ARRAY_METHODS}.{name}"] = supported
+    return support
+
+
+def _serialize(support: Mapping[str, bool]) -> dict[str, list[str]]:
+    return {
+        "supported": sorted(name for name, value in support.items() if value),
+        "unsupported": sorted(name for name, value in support.items() if not value),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Add the data of the installed numba version to the data file."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base", default="", help="Only store changes from this one.")
+    parser.add_argument("--path", default=DATA_PATH, help="Data file to be updated.")
+    args = parser.parse_args(argv)
+
+    data: dict[str, Any] = {"versions": {}}
+    if os.path.exists(args.path):
+        with open(args.path, encoding="utf-8") as f:
+            data = json.load(f)
+    version = ".".join(importlib_metadata.version("numba").split(".")[:2])
+    support = generate()
+    if args.base:
+        base = _resolve(data["versions"], args.base)
+        changes = {
+            name: value for name, value in support.items() if base.get(name) != value
+        }
+        entry: dict[str, Any] = {"base": args.base, **_serialize(changes)}
+    else:
+        entry = _serialize(support)
+    data["versions"][version] = entry
+    with open(args.path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=0, sort_keys=True)
+        f.write("\n")
+    print(f"Support of {len(support)} names stored for numba {version}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,189 @@
 """Module that implement the main `Plugin` logic class."""
+
+import argparse
 import ast
 import importlib.metadata as importlib_metadata
 from collections.abc import Generator
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
+from flake8_numba import Error
+from flake8_numba.cost import ReportBuffer, estimate_module
+from flake8_numba.deep import DEFAULT_CACHE_DIR, DEFAULT_TIMEOUT, DeepCompiler
+from flake8_numba.project_index import ProjectIndex
+from flake8_numba.rules.nba5 import NBA501, NBA511, NBA512
+from flake8_numba.rules.nba8 import NBA801
+from flake8_numba.runtime import CompileProfile
+from flake8_numba.symbols import ModuleIndex
 from flake8_numba.visitor import Visitor
 
+if TYPE_CHECKING:
+    from flake8.options.manager import OptionManager
+
 
 class Plugin:
     """Class used by Flake8 to find specific issues."""
 
     name = __name__.split(".", 1)[0]
     version = importlib_metadata.version(name)
+    cost_report: ClassVar[Optional[ReportBuffer]] = None
+    """Report where the estimated cost of jitted functions is written."""
+    profile: ClassVar[Optional[CompileProfile]] = None
+    """Compilations measured while running a workload, attached to the findings."""
 
-    def __init__(self, tree: ast.AST):
+    def __init__(self, tree: ast.AST, filename: str = ""):
         """Instantiet the class with the tree object passed by Flake8."""
         self._tree = tree
+        self._filename = filename
+
+    @staticmethod
+    def add_options(option_manager: "OptionManager") -> None:
+        """Register the options of the plugin in Flake8."""
+        option_manager.add_option(
+            "--numba-project-index",
+            default="",
+            parse_from_config=True,
+            help="Path to a SQLite database used to resolve signatures and jitted "
+            "functions imported from other files of the project. It is created and "
+            "updated as needed. Disabled by default.",
+        )
+        option_manager.add_option(
+            "--numba-project-root",
+            default=".",
+            parse_from_config=True,
+            help="Root of the project indexed by `--numba-project-index`. Defaults to "
+            "the current directory.",
+        )
+        option_manager.add_option(
+            "--numba-cost-report",
+            default="",
+            parse_from_config=True,
+            help="Path to a report with the estimated work done by each call to the "
+            "jitted functions, sorted from the most expensive. Written as CSV if the "
+            "path ends with `.csv`, as JSON otherwise. Disabled by default.",
+        )
+        option_manager.add_option(
+            "--numba-profile",
+            default="",
+            parse_from_config=True,
+            help="Path to a compile profile recorded with `flake8_numba.runtime`. The "
+            "measured compile cost of each function is appended to the errors found "
+            "on it and added to the cost report. Disabled by default.",
+        )
+        option_manager.add_option(
+            "--numba-cache-required-paths",
+            default="",
+            comma_separated_list=True,
+            parse_from_config=True,
+            help="Comma-separated directories or glob patterns where jitted functions "
+            "must be compiled with `cache=True` (NBA501). Disabled by default.",
+        )
+        option_manager.add_option(
+            "--numba-latency-paths",
+            default="",
+            comma_separated_list=True,
+            parse_from_config=True,
+            help="Comma-separated directories or glob patterns of latency-sensitive "
+            "modules, where functions must not be compiled on their first call (NBA511 "
+            "and NBA512). Disabled by default.",
+        )
+        option_manager.add_option(
+            "--numba-layout-paths",
+            default="",
+            comma_separated_list=True,
+            parse_from_config=True,
+            help="Comma-separated directories or glob patterns where the layouts of "
+            "the signatures are checked (NBA801). All files by default.",
+        )
+        option_manager.add_option(
+            "--numba-deep",
+            action="store_true",
+            parse_from_config=True,
+            help="Compile the functions with eager signatures in separate processes "
+            "to report the errors that only numba can confirm (NBA411 and NBA412). "
+            "Disabled by default.",
+        )
+        option_manager.add_option(
+            "--numba-deep-cache",
+            default=DEFAULT_CACHE_DIR,
+            parse_from_config=True,
+            help="Directory where the results of `--numba-deep` are cached. Defaults "
+            f"to `{DEFAULT_CACHE_DIR}`.",
+        )
+        option_manager.add_option(
+            "--numba-deep-timeout",
+            default=DEFAULT_TIMEOUT,
+            type=float,
+            parse_from_config=True,
+            help="Seconds given to compile each function with `--numba-deep`. "
+            f"Defaults to {DEFAULT_TIMEOUT}.",
+        )
+
+    @staticmethod
+    def parse_options(options: argparse.Namespace) -> None:
+        """Read the options of the plugin once they were parsed by Flake8."""
+        ModuleIndex.project = None
+        if options.numba_project_index:
+            project = ProjectIndex(
+                options.numba_project_root, options.numba_project_index
+            )
+            project.update()
+            ModuleIndex.project = project
+        Plugin.cost_report = None
+        if options.numba_cost_report:
+            Plugin.cost_report = ReportBuffer(options.numba_cost_report)
+        NBA501.required_paths = tuple(options.numba_cache_required_paths or ())
+        NBA511.paths = NBA512.paths = tuple(options.numba_latency_paths or ())
+        NBA801.paths = tuple(options.numba_layout_paths or ())
+        DeepCompiler.active = None
+        if options.numba_deep:
+            DeepCompiler.active = DeepCompiler(
+                options.numba_deep_cache, options.numba_deep_timeout
+            )
+        Plugin.profile = None
+        if options.numba_profile:
+            Plugin.profile = CompileProfile.load(options.numba_profile)
 
     def run(self) -> Generator[tuple[int, int, str, type[Any]], None, None]:
         """Run and iterate over the tree object to find issues."""
-        visitor = Visitor()
+        visitor = Visitor(self._filename)
         visitor.visit(self._tree)
+        errors = visitor.errors
+        if self.profile is not None:
+            errors = self._attach_profile(visitor, self.profile)
 
-        for line, col, msg in visitor.errors:
+        if self.cost_report is not None and isinstance(self._tree, ast.Module):
+            self._report_costs(self._tree, visitor, self.cost_report)
+
+        for line, col, msg in errors:
             yield line, col, msg, type(self)
+
+    def _attach_profile(self, visitor: Visitor, profile: CompileProfile) -> list[Error]:
+        """Append the measured compile cost of each function to the errors found on it."""
+        errors: list[Error] = []
+        for node, findings in visitor.findings.items():
+            function = profile.lookup(self._filename, node)
+            suffix = f" [{function.describe()}]" if function is not None else ""
+            errors.extend(
+                error._replace(message=f"{error.message}{suffix}") for error in findings
+            )
+        return errors
+
+    def _report_costs(
+        self, module: ast.Module, visitor: Visitor, report: ReportBuffer
+    ) -> None:
+        """Update the cost report with the jitted functions of the module."""
+        nodes = {node.lineno: node for node in visitor.findings}
+        estimates = []
+        for estimate in estimate_module(module, self._filename):
+            node = nodes[estimate.line]
+            function = self.profile.lookup(self._filename, node) if self.profile else None
+            estimates.append(
+                estimate._replace(
+                    compile_time=function.compile_time if function else 0.0,
+                    compilations=function.compilations if function else 0,
+                    findings=tuple(
+                        error.message.split(":", 1)[0] for error in visitor.findings[node]
+                    ),
+                )
+            )
+        report.add(self._filename, estimates)
@@ -0,0 +1,305 @@
+"""Project-wide index of signature constants and jitted functions.
+
+Signatures, layouts and jitted helpers are often defined in a shared module and imported
+everywhere else, so they can not be resolved by looking at a single file. This optional
+index records them for all the files of a project in a small SQLite database. Files are
+only parsed again if their modification time and their content changed.
+
+It is enabled with the `--numba-project-index` option, or updated manually with:
+
+```
+python -m flake8_numba.project_index [ROOT] [--db PATH]
+```
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sqlite3
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any, Final, NamedTuple, Optional
+
+from flake8_numba.symbols import ModuleIndex
+from flake8_numba.utils import is_str_safe
+
+DEFAULT_DB_NAME: Final = ".flake8_numba.sqlite"
+"""Name of the database created in the root of the project if no path is given."""
+EXCLUDED_DIRS: Final = frozenset(
+    {".git", ".hg", ".mypy_cache", ".tox", ".venv", "__pycache__", "build", "venv"}
+)
+"""Directories that are never indexed."""
+
+_SCHEMA: Final = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    module TEXT NOT NULL,
+    mtime INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    module TEXT NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    source TEXT NOT NULL,
+    PRIMARY KEY (module, name)
+);
+"""
+
+
+class JittedFunction(NamedTuple):
+    """Function compiled with numba and defined somewhere in the project."""
+
+    module: str
+    """Module where the function is defined."""
+    name: str
+    """Name of the function."""
+    decorator: str
+    """Decorator used to compile it (e.g. `njit`)."""
+    args: tuple[str, ...]
+    """Positional arguments of the decorator, with module constants resolved."""
+    kwargs: Mapping[str, str]
+    """Keyword arguments of the decorator, with module constants resolved."""
+
+    def option(self, name: str, default: Any = None) -> Any:
+        """Get the value of a keyword argument of the numba decorator.
+
+        Args:
+            name (str): Name of the keyword argument (e.g. `parallel`).
+            default (Any, optional): Returned if it is not given or if its value can not
+                be known statically.
+
+        Returns:
+            Any: Value of the keyword argument.
+        """
+        if name not in self.kwargs:
+            return default
+        try:
+            return ast.literal_eval(self.kwargs[name])
+        except ValueError:
+            return default
+
+
+def module_name(path: str, root: str) -> str:
+    """Get the dotted name of the module stored in a given path.
+
+    Args:
+        path (str): Path to the Python file.
+        root (str): Root of the project, from where modules are imported.
+
+    Returns:
+        str: Name of the module. Empty string if the file is outside `root`.
+    """
+    relative_path = os.path.relpath(os.path.abspath(path), os.path.abspath(root))
+    if relative_path.startswith(os.pardir):
+        return ""
+    parts = os.path.splitext(relative_path)[0].split(os.sep)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def iter_python_files(root: str) -> Iterator[str]:
+    """Iterate over the Python files of a project, skipping `EXCLUDED_DIRS`."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in EXCLUDED_DIRS]
+        for filename in filenames:
+            if filename.endswith(".py"):
+                yield os.path.join(dirpath, filename)
+
+
+def _collect_symbols(module: ast.Module) -> Iterator[tuple[str, str, str]]:
+    """Get the `(name, kind, source)` of all indexable symbols defined in a module."""
+    index = ModuleIndex(module)
+    for name, value in index.constants.items():
+        resolved = index.resolve(value)
+        source = ast.unparse(resolved)
+        if isinstance(resolved, ast.Constant) and isinstance(resolved.value, str):
+            yield name, "layout", source
+        elif is_str_safe(source):
+            yield name, "signature", source
+
+    for function in index.call_graph.functions.values():
+        if function.is_jitted and function.node in module.body:
+            options = {
+                "decorator": function.decorator,
+                "args": [ast.unparse(arg) for arg in function.args],
+                "kwargs": {
+                    name: ast.unparse(value) for name, value in function.options.items()
+                },
+            }
+            yield function.name, "function", json.dumps(options)
+
+
+class ProjectIndex:
+    """On-disk index of the symbols defined in all the files of a project."""
+
+    def __init__(self, root: str = ".", db_path: str = "") -> None:
+        """Instantiate the index. The database is created if it does not exist.
+
+        Args:
+            root (str, optional): Root of the project, from where modules are imported.
+            db_path (str, optional): Path to the SQLite database. By default, it is
+                stored in the root of the project.
+        """
+        self.root = os.path.abspath(root)
+        self.db_path = db_path or os.path.join(self.root, DEFAULT_DB_NAME)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid = 0
+        self._constants: dict[str, Optional[ast.expr]] = {}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection to the database, opened again in forked processes."""
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.db_path)
+            self._connection.executescript(_SCHEMA)
+            self._pid = os.getpid()
+        return self._connection
+
+    def update(self) -> int:
+        """Index all files that changed since the last update.
+
+        Returns:
+            int: Number of files that had to be parsed again.
+        """
+        connection = self.connection
+        known = {
+            path: (mtime, hash_)
+            for path, mtime, hash_ in connection.execute(
+                "SELECT path, mtime, hash FROM files"
+            )
+        }
+        n_parsed = 0
+        with connection:
+            for path in iter_python_files(self.root):
+                mtime = os.stat(path).st_mtime_ns
+                if path in known and known.pop(path)[0] == mtime:
+                    continue
+                if self._update_file(path, mtime):
+                    n_parsed += 1
+            for path in known:
+                self._remove_file(path)
+        self._constants.clear()
+        return n_parsed
+
+    def _update_file(self, path: str, mtime: int) -> bool:
+        """Index a single file. Returns `True` if its content had to be parsed."""
+        with open(path, "rb") as f:
+            content = f.read()
+        hash_ = hashlib.sha1(content).hexdigest()
+        module = module_name(path, self.root)
+        row = self.connection.execute(
+            "SELECT hash FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        self.connection.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+            (path, module, mtime, hash_),
+        )
+        if row is not None and row[0] == hash_:
+            return False
+
+        self.connection.execute("DELETE FROM symbols WHERE module = ?", (module,))
+        try:
+            tree = ast.parse(content, filename=path)
+        except (SyntaxError, ValueError):
+            return True
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO symbols VALUES (?, ?, ?, ?)",
+            [(module, *symbol) for symbol in _collect_symbols(tree)],
+        )
+        return True
+
+    def _remove_file(self, path: str) -> None:
+        row = self.connection.execute(
+            "SELECT module FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+        if row is not None:
+            self.connection.execute("DELETE FROM symbols WHERE module = ?", row)
+
+    def absolute_name(self, qualified_name: str, filename: str) -> str:
+        """Convert a name imported with a relative import into an absolute one.
+
+        Args:
+            qualified_name (str): Name such as `.types.SIGS` or `kernels.types.SIGS`.
+            filename (str): File where the name is imported.
+
+        Returns:
+            str: Absolute name. Empty string if it could not be resolved.
+        """
+        level = len(qualified_name) - len(qualified_name.lstrip("."))
+        if not level:
+            return qualified_name
+        if not filename:
+            return ""
+        package = module_name(filename, self.root).split(".")
+        if os.path.basename(filename) != "__init__.py":
+            package.pop()
+        if level - 1 > len(package):
+            return ""
+        package = package[: len(package) - (level - 1)]
+        return ".".join([*package, qualified_name[level:]]).lstrip(".")
+
+    def _lookup(self, qualified_name: str, filename: str, kinds: Sequence[str]) -> str:
+        module, _, name = self.absolute_name(qualified_name, filename).rpartition(".")
+        row = self.connection.execute(
+            "SELECT kind, source FROM symbols WHERE module = ? AND name = ?",
+            (module, name),
+        ).fetchone()
+        if row is None or row[0] not in kinds:
+            return ""
+        return row[1]  # type: ignore
+
+    def lookup_constant(self, qualified_name: str, filename: str) -> Optional[ast.expr]:
+        """Get the value of a signature or layout constant defined in the project.
+
+        Args:
+            qualified_name (str): Qualified name under which the constant was imported.
+            filename (str): File where the constant is imported.
+
+        Returns:
+            Optional[ast.expr]: Value of the constant. `None` if it is not indexed.
+        """
+        key = f"{filename}:{qualified_name}"
+        if key not in self._constants:
+            source = self._lookup(qualified_name, filename, ("layout", "signature"))
+            self._constants[key] = ast.parse(source, mode="eval").body if source else None
+        return self._constants[key]
+
+    def lookup_function(
+        self, qualified_name: str, filename: str = ""
+    ) -> Optional[JittedFunction]:
+        """Get a jitted function defined in the project.
+
+        Args:
+            qualified_name (str): Qualified name under which the function was imported.
+            filename (str, optional): File where the function is imported.
+
+        Returns:
+            Optional[JittedFunction]: Function with its decorator options. `None` if it is
+                not indexed.
+        """
+        source = self._lookup(qualified_name, filename, ("function",))
+        if not source:
+            return None
+        options = json.loads(source)
+        module, _, name = self.absolute_name(qualified_name, filename).rpartition(".")
+        return JittedFunction(
+            module, name, options["decorator"], tuple(options["args"]), options["kwargs"]
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Update the index of a project from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root", nargs="?", default=".", help="Root of the project.")
+    parser.add_argument("--db", default="", help="Path to the SQLite database.")
+    args = parser.parse_args(argv)
+    n_parsed = ProjectIndex(args.root, args.db).update()
+    print(f"{n_parsed} file(s) indexed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Pytest plugin enforcing numba compilation budgets.
+
+Extra specializations or broken `cache=True` hits only show up as latency regressions.
+This plugin records the compilations triggered by each test and lets tests declare a
+budget with the `numba_budget` marker:
+
+```python
+@pytest.mark.numba_budget("kernels.move_mean", compilations=2)
+def test_move_mean(): ...
+
+
+@pytest.mark.numba_budget("kernels.move_mean", cache=True)
+def test_move_mean_is_cached(): ...
+```
+
+The first one fails if `kernels.move_mean` compiles more than two signatures during the
+test. The second one fails if it is not loaded from the on-disk cache, i.e. if it is
+compiled or if its cache is missed. Without a function, budgets apply to all functions
+compiled during the test. Functions are matched by their qualified name or by any suffix
+of it made of whole names (e.g. `move_mean`).
+
+The plugin is registered automatically when flake8-numba is installed. Tests without a
+`numba_budget` marker are left untouched. The compilations of budgeted tests are shown
+in a `numba` section of the report of failing tests.
+"""
+from collections.abc import Generator, Sequence
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+import pytest
+
+if TYPE_CHECKING:
+    from flake8_numba.runtime import CompileEvent
+
+
+class Budget(NamedTuple):
+    """Budget declared by a `numba_budget` marker."""
+
+    function: Optional[str]
+    """Name of the function it applies to. `None` for all of them."""
+    compilations: Optional[int]
+    """Maximum number of signatures compiled. `None` for no limit."""
+    cache: bool
+    """Whether it must be loaded from the on-disk cache."""
+
+    def matches(self, name: str) -> bool:
+        """Check whether a function with the given qualified name is budgeted."""
+        return self.function is None or f".{name}".endswith(f".{self.function}")
+
+
+def _budget(
+    function: Optional[str] = None,
+    *,
+    compilations: Optional[int] = None,
+    cache: bool = False,
+) -> Budget:
+    return Budget(function, compilations, cache)
+
+
+def _resolve(name: str) -> Any:
+    """Import the object with the given qualified name. `None` if not found."""
+    parts = name.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        try:
+            obj: Any = import_module(".".join(parts[:i]))
+        except ImportError:
+            continue
+        for attribute in parts[i:]:
+            obj = getattr(obj, attribute, None)
+        return obj
+    return None
+
+
+def _cache_stats(dispatcher: Any) -> tuple[int, int]:
+    """Total cache hits and misses of a dispatcher so far."""
+    hits = getattr(dispatcher, "_cache_hits", {})
+    misses = getattr(dispatcher, "_cache_misses", {})
+    return sum(hits.values()), sum(misses.values())
+
+
+def _format(events: Sequence["CompileEvent"]) -> str:
+    return "\n".join(
+        f"  {event.name}{event.signature} in {event.compile_time:.2f}s"
+        + (" (object mode)" if event.object_mode else "")
+        for event in events
+    )
+
+
+def check_budget(
+    budget: Budget,
+    events: Sequence["CompileEvent"],
+    cache_stats: Optional[tuple[int, int]] = None,
+) -> Optional[str]:
+    """Check whether the compilations of a test went over a budget.
+
+    Args:
+        budget (Budget): Budget declared by the test.
+        events (Sequence[CompileEvent]): Compilations triggered by the test.
+        cache_stats (Optional[tuple[int, int]], optional): Cache hits and misses of the
+            budgeted function during the test, if known.
+
+    Returns:
+        Optional[str]: Description of the overrun. `None` if within budget.
+    """
+    events = [event for event in events if budget.matches(event.name)]
+    target = f"`{budget.function}`" if budget.function else "numba functions"
+    if budget.compilations is not None and len(events) > budget.compilations:
+        return (
+            f"{len(events)} compilations of {target} (at most {budget.compilations}):\n"
+            f"{_format(events)}"
+        )
+    if budget.cache and events:
+        return f"{target} compiled instead of loaded from cache:\n{_format(events)}"
+    if budget.cache and cache_stats is not None and cache_stats[1]:
+        return f"{cache_stats[1]} cache misses of {target}."
+    return None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the marker."""
+    config.addinivalue_line(
+        "markers",
+        "numba_budget(function=None, *, compilations=None, cache=False): fail if the "
+        "test compiles the numba function more than `compilations` times or, with "
+        "`cache=True`, if it is not loaded from the on-disk cache.",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, Any, Any]:
+    """Record the compilations of the test and check them against its budgets."""
+    budgets = [_budget(*m.args, **m.kwargs) for m in item.iter_markers("numba_budget")]
+    if not budgets:
+        return (yield)
+    # Imported lazily so that numba is only imported by tests declaring a budget
+    from flake8_numba.runtime import CompileRecorder  # noqa: PLC0415
+
+    dispatchers = {
+        budget: _resolve(budget.function)
+        for budget in budgets
+        if budget.cache and budget.function
+    }
+    before = {budget: _cache_stats(d) for budget, d in dispatchers.items()}
+    with CompileRecorder() as recorder:
+        result = yield
+    events = recorder.events
+    if events:
+        item.add_report_section("call", "numba", _format(events))
+    item.user_properties.append(("numba_compilations", len(events)))
+
+    for budget in budgets:
+        cache_stats = None
+        if budget in dispatchers:
+            hits, misses = _cache_stats(dispatchers[budget])
+            cache_stats = (hits - before[budget][0], misses - before[budget][1])
+        overrun = check_budget(budget, events, cache_stats)
+        if overrun is not None:
+            pytest.fail(f"Numba budget exceeded: {overrun}", pytrace=False)
+    return result
@@ -1,3 +1,10 @@
 from flake8_numba.rules import nba0 as nba0
 from flake8_numba.rules import nba1 as nba1
 from flake8_numba.rules import nba2 as nba2
+from flake8_numba.rules import nba3 as nba3
+from flake8_numba.rules import nba4 as nba4
+from flake8_numba.rules import nba5 as nba5
+from flake8_numba.rules import nba6 as nba6
+from flake8_numba.rules import nba7 as nba7
+from flake8_numba.rules import nba8 as nba8
+from flake8_numba.rules import nba9 as nba9
@@ -1,6 +1,7 @@
 import ast
 from typing import Optional
 
+from flake8_numba.cfg import get_cfg
 from flake8_numba.rule import Error, Rule
 from flake8_numba.utils import is_decorated_with
 
@@ -33,10 +34,10 @@ class NBA102(Rule):
         if not is_decorated_with("vectorize", node):
             return None
 
-        # Check the 'return' statement in the function body
-        for statement in node.body:
-            if isinstance(statement, ast.Return):
-                return None
+        # Every path reaching the end of the function must go through a 'return'
+        if get_cfg(node).on_all_paths(lambda stmt: isinstance(stmt, ast.Return)):
+            return None
 
+        statement = node.body[-1]
         msg = "NBA102: Functions decorated with `vectorize` must have one return value"
         return Error(statement.lineno, statement.col_offset, msg)
@@ -3,6 +3,7 @@ import re
 from collections import Counter
 from typing import Any, Optional, cast
 
+from flake8_numba.cfg import get_cfg
 from flake8_numba.rule import Error, Rule
 from flake8_numba.rules import nba0
 from flake8_numba.utils import (
@@ -241,16 +242,14 @@ class NBA209(Rule):
         right_of_arrow = parts[1].strip()
         n_outputs = Counter(right_of_arrow)["("]
 
-        # Get the function body
-        func_body = node.body
-
         # Get the names of the last N positional arguments of the function
         outputs_to_be_modified = {
             arg.arg for arg in node.args.args[-n_outputs:] if arg.annotation is None
         }
 
-        # Traverse each node in the function body
-        for sub_node in func_body:
+        # Traverse each statement that can be executed, including those within loops
+        # and branches
+        for sub_node in get_cfg(node).reachable_statements():
             # If it is an assignment and the target is a name argument
             if isinstance(sub_node, ast.Assign) and isinstance(
                 sub_node.targets[0], ast.Subscript
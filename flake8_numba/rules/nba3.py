@@ -0,0 +1,94 @@
+import ast
+import importlib.metadata as importlib_metadata
+from typing import Final, Optional
+
+from flake8_numba.loops import get_loop_nest
+from flake8_numba.rule import Error, Rule
+from flake8_numba.symbols import ModuleIndex, get_module_index
+from flake8_numba.utils import walk_function_body
+
+NUMBA_VERSION: Final = tuple(
+    int(part) for part in importlib_metadata.version("numba").split(".")[:2]
+)
+"""Installed numba version, as `(major, minor)`."""
+NOPYTHON_BY_DEFAULT: Final = (0, 59)
+"""First numba version where `@jit` no longer falls back to object mode."""
+
+
+class NBA301(Rule):
+    """`@jit` that can silently fall back to object mode."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        function = get_module_index(node).call_graph.function_of(node)
+        if function is None or function.decorator != "jit":
+            return None
+        if NUMBA_VERSION >= NOPYTHON_BY_DEFAULT:
+            return None
+        if "nopython" in function.options or "forceobj" in function.options:
+            return None
+        msg = (
+            "NBA301: `@jit` without `nopython=True` silently falls back to object mode "
+            "if the function can not be compiled. Use `@njit` instead."
+        )
+        return Error(node.lineno, node.col_offset, msg)
+
+
+class NBA302(Rule):
+    """Function forced to be compiled in object mode."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        function = get_module_index(node).call_graph.function_of(node)
+        if function is None or function.option("forceobj") is not True:
+            return None
+        msg = "NBA302: `forceobj=True` compiles the function in object mode."
+        return Error(node.lineno, node.col_offset, msg)
+
+
+class NBA303(Rule):
+    """Object mode fallback explicitly allowed."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        function = get_module_index(node).call_graph.function_of(node)
+        if function is None or function.option("nopython") is not False:
+            return None
+        msg = (
+            f"NBA303: `@{function.decorator}` with `nopython=False` allows falling back "
+            "to object mode."
+        )
+        return Error(node.lineno, node.col_offset, msg)
+
+
+class NBA311(Rule):
+    """`objmode` block placed within a loop."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        function = index.call_graph.function_of(node)
+        if function is None or not function.is_jitted:
+            return None
+
+        # The most deeply nested block is reported, as it crosses the boundary the most
+        nest = get_loop_nest(node)
+        deepest: Optional[tuple[int, ast.With]] = None
+        for child in walk_function_body(node):
+            if not isinstance(child, ast.With) or not any(
+                self._is_objmode(item.context_expr, index) for item in child.items
+            ):
+                continue
+            loop = nest.loop_of(child)
+            if loop is not None and (deepest is None or loop.depth + 1 > deepest[0]):
+                deepest = (loop.depth + 1, child)
+        if deepest is None:
+            return None
+        depth, block = deepest
+        msg = (
+            f"NBA311: `objmode` block within {depth} nested loop(s) crosses the object "
+            "mode boundary on every iteration. Move it out of the loops."
+        )
+        return Error(block.lineno, block.col_offset, msg)
+
+    @staticmethod
+    def _is_objmode(context: ast.expr, index: ModuleIndex) -> bool:
+        func = context.func if isinstance(context, ast.Call) else context
+        name = index.qualified_name(func) or ""
+        return name.startswith("numba.") and name.endswith(".objmode")
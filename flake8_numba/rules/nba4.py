@@ -0,0 +1,80 @@
+import ast
+from typing import Optional
+
+from flake8_numba.deep import get_deep_result
+from flake8_numba.inference import infer_types
+from flake8_numba.nopython import ARRAY_METHODS, load_support_index
+from flake8_numba.rule import Error, Rule
+from flake8_numba.symbols import get_module_index
+from flake8_numba.utils import walk_function_body
+
+_INDEXED_MODULES = ("numpy", "math", "cmath")
+"""Modules whose functions are looked up in the support index."""
+
+
+class NBA401(Rule):
+    """Function or method not supported in nopython mode."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        function = index.call_graph.function_of(node)
+        if function is None or not function.is_nopython:
+            return None
+
+        support = load_support_index()
+        types_ = infer_types(node)[0]
+        # Names defined within the function or the module shadow builtins
+        local_names = {arg.arg for arg in node.args.args}
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+                local_names.add(child.id)
+            elif isinstance(child, (ast.FunctionDef, ast.ClassDef)) and child is not node:
+                local_names.add(child.name)
+        module_names = index.constants.keys() | index.call_graph.functions.keys()
+
+        for child in walk_function_body(node):
+            if not isinstance(child, ast.Call):
+                continue
+            func = child.func
+            name = index.qualified_name(func) or ""
+            if isinstance(func, ast.Name):
+                if func.id in local_names or func.id in module_names:
+                    continue
+            elif name.split(".", 1)[0] not in _INDEXED_MODULES:
+                if not isinstance(func, ast.Attribute):
+                    continue
+                if not types_.type_of(func.value).is_array:
+                    continue
+                name = f"{ARRAY_METHODS}.{func.attr}"
+            if support.is_supported(name) is False:
+                msg = (
+                    f"NBA401: `{name}` is not supported in nopython mode by numba "
+                    f"{support.version}."
+                )
+                return Error(child.lineno, child.col_offset, msg)
+        return None
+
+
+class NBA411(Rule):
+    """Eager signatures that numba fails to compile. Only with `--numba-deep`."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        result = get_deep_result(node)
+        if result is None or result.status != "error":
+            return None
+        msg = f"NBA411: Numba fails to compile the eager signatures: {result.message}"
+        return Error(node.lineno, node.col_offset, msg)
+
+
+class NBA412(Rule):
+    """Eager signatures compiled in object mode. Only with `--numba-deep`."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        result = get_deep_result(node)
+        if result is None or not result.object_mode:
+            return None
+        function = get_module_index(node).call_graph.function_of(node)
+        if function is not None and function.option("forceobj") is True:
+            return None
+        msg = f"NBA412: Signature `{result.object_mode[0]}` falls back to object mode."
+        return Error(node.lineno, node.col_offset, msg)
@@ -0,0 +1,237 @@
+import ast
+from typing import ClassVar, Optional
+
+from flake8_numba.callgraph import FunctionInfo
+from flake8_numba.cost import ALLOCATIONS
+from flake8_numba.rule import Error, Rule
+from flake8_numba.symbols import ModuleIndex, get_module_index
+from flake8_numba.utils import matches_path, walk_function_body
+
+_MUTABLE_LITERALS = (ast.List, ast.Dict, ast.Set, ast.ListComp, ast.DictComp, ast.SetComp)
+"""Module-level values that can be modified in place."""
+
+
+def _is_cached(function: Optional[FunctionInfo]) -> bool:
+    return function is not None and function.option("cache") is True
+
+
+class NBA501(Rule):
+    """Jitted function without `cache=True` within the paths where caching is required."""
+
+    required_paths: ClassVar[tuple[str, ...]] = ()
+    """Directories or glob patterns where caching is required. Empty by default."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        function = index.call_graph.function_of(node)
+        if function is None or "." in function.name or "cache" in function.options:
+            return None
+        jit = function.decorator in ("jit", "njit")
+        vectorized = function.decorator in ("vectorize", "guvectorize") and function.args
+        if not (jit or vectorized):
+            return None
+        if not matches_path(index.filename, self.required_paths):
+            return None
+        msg = (
+            f"NBA501: `@{function.decorator}` without `cache=True`. The function is "
+            "compiled again by every new process."
+        )
+        return Error(node.lineno, node.col_offset, msg)
+
+
+class NBA502(Rule):
+    """`cache=True` given to a function defined within another function."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        call_graph = get_module_index(node).call_graph
+        function = call_graph.function_of(node)
+        if function is None or not _is_cached(function) or "." not in function.name:
+            return None
+        # Methods are not defined within functions
+        if function.name.rsplit(".", 1)[0] not in call_graph.functions:
+            return None
+        msg = (
+            "NBA502: `cache=True` on a function defined within another function. A new "
+            "dispatcher is created on every call, which reads the cache from disk again, "
+            "and each value captured from the enclosing function adds a new cache entry. "
+            "Move it to the top level of the module."
+        )
+        return Error(node.lineno, node.col_offset, msg)
+
+
+class NBA503(Rule):
+    """Lambda compiled with `cache=True` within a function."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        for child in walk_function_body(node):
+            if isinstance(child, ast.Call) and self._is_cached_lambda(child, index):
+                msg = (
+                    "NBA503: Lambda compiled with `cache=True`. It is compiled again "
+                    "every time the enclosing function runs. Define it with `def` at "
+                    "the top level of the module."
+                )
+                return Error(child.lineno, child.col_offset, msg)
+        return None
+
+    @staticmethod
+    def _is_cached_lambda(call: ast.Call, index: ModuleIndex) -> bool:
+        # Either `njit(lambda ..., cache=True)` or `njit(cache=True)(lambda ...)`
+        decorator = call.func if isinstance(call.func, ast.Call) else call
+        name = index.qualified_name(decorator.func) or ""
+        if not name.startswith("numba.") or name.rsplit(".", 1)[-1] not in (
+            "jit",
+            "njit",
+        ):
+            return False
+        if not call.args or not isinstance(call.args[0], ast.Lambda):
+            return False
+        return any(
+            keyword.arg == "cache"
+            and isinstance(value := index.resolve(keyword.value), ast.Constant)
+            and value.value is True
+            for keyword in decorator.keywords
+        )
+
+
+class NBA504(Rule):
+    """Cached function that reads a mutable global variable."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        if not _is_cached(index.call_graph.function_of(node)):
+            return None
+
+        local = {arg.arg for arg in ast.walk(node.args) if isinstance(arg, ast.arg)}
+        local |= {
+            child.id
+            for child in ast.walk(node)
+            if isinstance(child, ast.Name) and not isinstance(child.ctx, ast.Load)
+        }
+        mutable = self._mutable_globals(index)
+        for child in walk_function_body(node):
+            if (
+                isinstance(child, ast.Name)
+                and isinstance(child.ctx, ast.Load)
+                and child.id not in local
+                and child.id in mutable
+            ):
+                msg = (
+                    f"NBA504: `cache=True` freezes the value of the mutable global "
+                    f"`{child.id}` when the function is compiled. Later changes are "
+                    "ignored, even by other processes loading the cache. Pass it as an "
+                    "argument."
+                )
+                return Error(child.lineno, child.col_offset, msg)
+        return None
+
+    @classmethod
+    def _mutable_globals(cls, index: ModuleIndex) -> set[str]:
+        """Module-level names that are reassigned or bound to mutable values."""
+        module = index.call_graph.module
+        mutable: set[str] = set()
+        for statement in module.body:
+            if not isinstance(statement, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                continue
+            targets = (
+                statement.targets
+                if isinstance(statement, ast.Assign)
+                else [statement.target]
+            )
+            for target in targets:
+                for name_node in ast.walk(target):
+                    if isinstance(name_node, ast.Name) and (
+                        name_node.id not in index.constants
+                        or cls._is_mutable(index.constants[name_node.id], index)
+                    ):
+                        mutable.add(name_node.id)
+        # Names rebound within functions with the `global` statement
+        for child in ast.walk(module):
+            if isinstance(child, ast.Global):
+                mutable.update(child.names)
+        return mutable
+
+    @staticmethod
+    def _is_mutable(value: ast.expr, index: ModuleIndex) -> bool:
+        if isinstance(value, _MUTABLE_LITERALS):
+            return True
+        if not isinstance(value, ast.Call):
+            return False
+        name = index.qualified_name(value.func) or ""
+        return name.startswith("numpy.") and name.rsplit(".", 1)[-1] in ALLOCATIONS
+
+
+class NBA511(Rule):
+    """Function compiled lazily within the paths where latency matters."""
+
+    paths: ClassVar[tuple[str, ...]] = ()
+    """Directories or glob patterns of latency-sensitive modules. Empty by default."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        function = index.call_graph.function_of(node)
+        if function is None or function.decorator not in ("jit", "njit", "vectorize"):
+            return None
+        if not matches_path(index.filename, self.paths):
+            return None
+        if function.args:
+            return None
+        msg = (
+            f"NBA511: `@{function.decorator}` without eager signatures in a "
+            "latency-sensitive module. The function is compiled on its first call with "
+            "each new combination of argument types. Declare its signatures."
+        )
+        return Error(node.lineno, node.col_offset, msg)
+
+
+class NBA512(Rule):
+    """Dynamic gufunc created within the paths where latency matters."""
+
+    paths: ClassVar[tuple[str, ...]] = ()
+    """Directories or glob patterns of latency-sensitive modules. Empty by default."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        if not matches_path(index.filename, self.paths):
+            return None
+        function = index.call_graph.function_of(node)
+        # Signatures come before the layout: `@guvectorize([...], "(n)->(n)")`
+        if (
+            function is not None
+            and function.decorator == "guvectorize"
+            and len(function.args) < 2
+        ):
+            return Error(node.lineno, node.col_offset, self._message())
+        for child in walk_function_body(node):
+            if isinstance(child, ast.Call) and self._is_dynamic_gufunc(child, index):
+                return Error(child.lineno, child.col_offset, self._message())
+        # Module-level `kernel = guvectorize("(n)->(n)")(func)`, reported with `func`
+        if function is None or "." in function.name:
+            return None
+        for call in index.call_graph.callees(None):
+            if (
+                self._is_dynamic_gufunc(call.node, index)
+                and isinstance(call.node.args[0], ast.Name)
+                and call.node.args[0].id == node.name
+            ):
+                return Error(call.node.lineno, call.node.col_offset, self._message())
+        return None
+
+    @staticmethod
+    def _message() -> str:
+        return (
+            "NBA512: Dynamic gufunc created in a latency-sensitive module. It is "
+            "compiled on its first call with each new combination of argument types. "
+            "Give its signatures before the layout: "
+            '`@guvectorize(["void(float64[:], float64[:])"], "(n)->(n)")`.'
+        )
+
+    @staticmethod
+    def _is_dynamic_gufunc(call: ast.Call, index: ModuleIndex) -> bool:
+        # `guvectorize("(n)->(n)")(func)`
+        if not isinstance(call.func, ast.Call) or not call.args:
+            return False
+        name = index.qualified_name(call.func.func) or ""
+        if not name.startswith("numba.") or name.rsplit(".", 1)[-1] != "guvectorize":
+            return False
+        return len(call.func.args) < 2
@@ -0,0 +1,370 @@
+import ast
+from collections.abc import Iterator
+from typing import Final, Optional, Union
+
+from flake8_numba.callgraph import FunctionInfo
+from flake8_numba.inference import FunctionTypes, infer_types
+from flake8_numba.loops import ArrayAccess, Loop, get_loop_nest
+from flake8_numba.rule import Error, Rule
+from flake8_numba.symbols import ModuleIndex, get_module_index
+from flake8_numba.utils import walk_function_body
+
+
+def _first_prange(node: ast.FunctionDef) -> Optional[Loop]:
+    return next((loop for loop in get_loop_nest(node).loops if loop.is_parallel), None)
+
+
+class NBA601(Rule):
+    """`parallel=True` without anything that numba can parallelize."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        function = index.call_graph.function_of(node)
+        if function is None or not function.is_jitted or not function.option("parallel"):
+            return None
+        if _first_prange(node) is not None:
+            return None
+        for types_ in infer_types(node):
+            if any(
+                self._is_parallelizable(child, types_, index)
+                for child in walk_function_body(node)
+            ):
+                return None
+        msg = (
+            "NBA601: `parallel=True` without any `prange` loop or array expression to "
+            "parallelize. It only adds the cost of setting up threads. Use `prange` or "
+            "remove the option."
+        )
+        return Error(node.lineno, node.col_offset, msg)
+
+    @classmethod
+    def _is_parallelizable(
+        cls, node: ast.AST, types_: FunctionTypes, index: ModuleIndex
+    ) -> bool:
+        """Whether a node may be an array expression, a NumPy call or an array method."""
+        if isinstance(node, ast.Call):
+            name = index.qualified_name(node.func) or ""
+            if name.startswith("numpy."):
+                return True
+            return isinstance(node.func, ast.Attribute) and cls._may_be_array(
+                node.func.value, types_
+            )
+        if isinstance(node, ast.BinOp):
+            operands = [node.left, node.right]
+        elif isinstance(node, ast.UnaryOp):
+            operands = [node.operand]
+        elif isinstance(node, ast.Compare):
+            operands = [node.left, *node.comparators]
+        elif isinstance(node, ast.AugAssign):
+            operands = [node.target, node.value]
+        else:
+            return False
+        return any(cls._may_be_array(operand, types_) for operand in operands)
+
+    @staticmethod
+    def _may_be_array(expr: ast.expr, types_: FunctionTypes) -> bool:
+        type_ = types_.type_of(expr)
+        if type_.kind != "unknown":
+            return type_.is_array
+        # Variables of unknown type may be arrays, but elements accessed with integer
+        # indices are assumed to be scalars
+        if isinstance(expr, ast.Subscript):
+            return any(isinstance(child, ast.Slice) for child in ast.walk(expr.slice))
+        return isinstance(expr, (ast.Name, ast.Attribute))
+
+
+class NBA602(Rule):
+    """`prange` loop within a jitted function without `parallel=True`."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        function = get_module_index(node).call_graph.function_of(node)
+        if function is None or not function.is_jitted:
+            return None
+        # Values that can not be known statically are assumed to enable it
+        if "parallel" in function.options and function.option("parallel", True):
+            return None
+        loop = _first_prange(node)
+        if loop is None:
+            return None
+        msg = (
+            f"NBA602: `prange` within `@{function.decorator}` without `parallel=True` "
+            "runs serially."
+        )
+        return Error(loop.node.lineno, loop.node.col_offset, msg)
+
+
+class NBA603(Rule):
+    """`prange` loop within a function that is not jitted."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        function = get_module_index(node).call_graph.function_of(node)
+        if function is None or function.is_jitted or self._is_compiled_later(function):
+            return None
+        loop = _first_prange(node)
+        if loop is None:
+            return None
+        msg = "NBA603: `prange` outside a jitted function runs serially, like `range`."
+        return Error(loop.node.lineno, loop.node.col_offset, msg)
+
+    @staticmethod
+    def _is_compiled_later(function: FunctionInfo) -> bool:
+        """Whether the function is compiled with a call, e.g. `njit(parallel=True)(f)`."""
+        index = get_module_index(function.node)
+        for call in index.call_graph.calls:
+            func = call.node.func
+            # Either `njit(f)` or `njit(parallel=True)(f)`
+            decorator = func.func if isinstance(func, ast.Call) else func
+            if not (index.qualified_name(decorator) or "").startswith("numba."):
+                continue
+            for arg in call.node.args:
+                if isinstance(arg, ast.Name) and arg.id == function.node.name:
+                    return True
+        return False
+
+
+def _parallel_loops(node: ast.FunctionDef) -> Iterator[Loop]:
+    """`prange` loops of a jitted function."""
+    function = get_module_index(node).call_graph.function_of(node)
+    if function is None or not function.is_jitted:
+        return
+    for loop in get_loop_nest(node).loops:
+        if loop.is_parallel and loop.variable is not None:
+            yield loop
+
+
+class NBA611(Rule):
+    """Array element accessed by different iterations of a `prange` loop."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        nest = get_loop_nest(node)
+        for loop in _parallel_loops(node):
+            variable = loop.variable or ""
+            accesses = [a for a in nest.accesses_within(loop) if a.array is not None]
+            for store in accesses:
+                if not store.is_store:
+                    continue
+                for other in accesses:
+                    if other is store or other.array != store.array:
+                        continue
+                    if self._is_carried(store, other, variable):
+                        msg = (
+                            f"NBA611: `{other.array}` is written and accessed at "
+                            f"different offsets of the `prange` variable `{variable}`. "
+                            "Iterations depend on each other but run in parallel."
+                        )
+                        return Error(other.node.lineno, other.node.col_offset, msg)
+        return None
+
+    @staticmethod
+    def _is_carried(store: ArrayAccess, other: ArrayAccess, variable: str) -> bool:
+        """Whether two accesses may refer to the same element in different iterations."""
+        if len(store.indices) != len(other.indices):
+            return False
+        carried = False
+        for first, second in zip(store.indices, other.indices):
+            same = ast.dump(first.expr) == ast.dump(second.expr)
+            if same and variable in first.variables:
+                # Both are always within the same iteration
+                return False
+            coefficient = (first.coefficients or {}).get(variable)
+            other_coefficient = (second.coefficients or {}).get(variable)
+            if not coefficient or not other_coefficient:
+                continue
+            if coefficient != other_coefficient:
+                # E.g. `a[i]` and `a[n - 1 - i]` meet in different iterations
+                carried = True
+            elif first.offset is None or second.offset is None:
+                carried = carried or not same
+            else:
+                # `c * i + o1 == c * j + o2` only if `o1 - o2` is a multiple of `c`
+                difference = first.offset - second.offset
+                if not difference or difference % coefficient:
+                    return False
+                carried = True
+        return carried
+
+
+class NBA612(Rule):
+    """Write to a location shared by all iterations of a `prange` loop."""
+
+    _REDUCTIONS: Final = (ast.Add, ast.Sub, ast.Mult, ast.Div)
+    """Operators of the reductions supported by numba."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        nest = get_loop_nest(node)
+        index = get_module_index(node)
+        for loop in _parallel_loops(node):
+            accumulated: set[ast.expr] = {
+                statement.target
+                for statement in ast.walk(loop.node)
+                if isinstance(statement, ast.AugAssign)
+            }
+            writes: list[tuple[Union[ast.expr, ast.stmt], str]] = [
+                (access.node, self._shared_array(access, loop, accumulated))
+                for access in nest.accesses_within(loop)
+                if access.is_store
+            ]
+            writes.extend(
+                (statement, self._shared_scalar(statement, loop, node, index))
+                for statement in ast.walk(loop.node)
+                if isinstance(statement, (ast.Assign, ast.AugAssign))
+            )
+            for child, description in sorted(
+                writes, key=lambda item: (item[0].lineno, item[0].col_offset)
+            ):
+                if description:
+                    msg = f"NBA612: {description}"
+                    return Error(child.lineno, child.col_offset, msg)
+        return None
+
+    @staticmethod
+    def _shared_array(access: ArrayAccess, loop: Loop, accumulated: set[ast.expr]) -> str:
+        """Describe the race if iterations may write the same element, or return ''."""
+        if access.array is None or access.array.split(".")[0] in loop.assigned:
+            # Arrays created within the loop are private to each iteration
+            return ""
+        variable = loop.variable or ""
+        if any((i.coefficients or {}).get(variable) for i in access.indices):
+            return ""
+        names = {
+            child.id
+            for i in access.indices
+            for child in ast.walk(i.expr)
+            if isinstance(child, ast.Name)
+        }
+        if variable in names or names & loop.assigned:
+            # Indirect indices (e.g. `hist[b[i]]`) only race when accumulating
+            if access.node not in accumulated:
+                return ""
+            return (
+                f"`{ast.unparse(access.node)}` is accumulated with an index that may "
+                f"repeat across iterations of the `prange` loop over `{variable}`, which "
+                "race to update it."
+            )
+        return (
+            f"`{ast.unparse(access.node)}` is written by every iteration of the `prange` "
+            f"loop over `{variable}`, which race to write it."
+        )
+
+    @classmethod
+    def _shared_scalar(
+        cls,
+        statement: Union[ast.Assign, ast.AugAssign],
+        loop: Loop,
+        node: ast.FunctionDef,
+        index: ModuleIndex,
+    ) -> str:
+        """Describe the race if the variable is shared and not reduced, or return ''."""
+        targets = (
+            statement.targets if isinstance(statement, ast.Assign) else [statement.target]
+        )
+        if len(targets) != 1 or not isinstance(targets[0], ast.Name):
+            return ""
+        name = targets[0].id
+        end = loop.node.end_lineno or loop.node.lineno
+        arguments = {arg.arg for arg in node.args.args}
+        read_after = any(
+            isinstance(child, ast.Name)
+            and child.id == name
+            and isinstance(child.ctx, ast.Load)
+            and child.lineno > end
+            for child in walk_function_body(node)
+        )
+        if name not in arguments and not read_after:
+            # Variables only used within the body are private to each iteration
+            return ""
+        if cls._is_reduction(statement, name, index):
+            return ""
+        return (
+            f"`{name}` is shared by the iterations of the `prange` loop over "
+            f"`{loop.variable}`, but it is not assigned with a supported reduction "
+            "(`+=`, `-=`, `*=`, `/=`, `min` or `max`)."
+        )
+
+    @classmethod
+    def _is_reduction(
+        cls, statement: Union[ast.Assign, ast.AugAssign], name: str, index: ModuleIndex
+    ) -> bool:
+        """Whether it is `s += x`, `s = s + x`, `s = min(s, x)` or alike."""
+        if isinstance(statement, ast.AugAssign):
+            return isinstance(statement.op, cls._REDUCTIONS)
+        value = statement.value
+        operands: list[ast.expr] = []
+        if isinstance(value, ast.BinOp) and isinstance(value.op, cls._REDUCTIONS):
+            operands = [value.left, value.right]
+        elif isinstance(value, ast.Call) and index.qualified_name(value.func) in (
+            "min",
+            "max",
+        ):
+            operands = value.args
+        return any(isinstance(o, ast.Name) and o.id == name for o in operands)
+
+
+class NBA621(Rule):
+    """Internally parallel call within a parallel region."""
+
+    _PARALLEL_CALLS: Final = frozenset({"numpy.dot", "numpy.vdot", "numpy.matmul"})
+    """NumPy functions that numba runs with multithreaded BLAS. Also `numpy.linalg`."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        function = index.call_graph.function_of(node)
+        if function is None or not function.is_jitted:
+            return None
+        whole_body = function.option("target") == "parallel"
+        nest = get_loop_nest(node)
+        for child in walk_function_body(node):
+            if not isinstance(child, (ast.Call, ast.BinOp)):
+                continue
+            if not whole_body:
+                loop = nest.loop_of(child)
+                if loop is None or not any(
+                    outer.is_parallel for outer in (loop, *loop.ancestors())
+                ):
+                    continue
+            reason = self._reason(child, index, {function.name})
+            if reason:
+                region = (
+                    f"`target='parallel'` kernel `{function.name}`"
+                    if whole_body
+                    else "`prange` loop"
+                )
+                msg = (
+                    f"NBA621: {reason} within a {region}. Nested parallel regions "
+                    "start cores x cores threads."
+                )
+                return Error(child.lineno, child.col_offset, msg)
+        return None
+
+    @classmethod
+    def _reason(cls, node: ast.AST, index: ModuleIndex, seen: set[str]) -> str:
+        """Describe why a node runs in parallel, or return ''."""
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.MatMult):
+            return "`@` runs multithreaded BLAS"
+        if not isinstance(node, ast.Call):
+            return ""
+        name = index.qualified_name(node.func) or ""
+        if name in cls._PARALLEL_CALLS or name.startswith("numpy.linalg."):
+            return f"`{name}` runs multithreaded BLAS"
+        if isinstance(node.func, ast.Attribute) and node.func.attr == "dot":
+            return "`.dot` runs multithreaded BLAS"
+        call = index.call_graph.call_site(node)
+        callee = call.callee if call is not None else None
+        if callee is None:
+            # Jitted functions imported from other modules of the project
+            external = index.external_function(node.func)
+            if external is not None and (
+                external.option("parallel") or external.option("target") == "parallel"
+            ):
+                return f"`{name}` runs in parallel"
+            return ""
+        if callee.name in seen or not callee.is_jitted:
+            return ""
+        if callee.option("parallel") or callee.option("target") == "parallel":
+            return f"`{callee.name}` runs in parallel"
+        # Functions called through other jitted functions
+        seen.add(callee.name)
+        for child in walk_function_body(callee.node):  # type: ignore
+            if cls._reason(child, index, seen):
+                return f"`{callee.name}` calls code that runs in parallel"
+        return ""
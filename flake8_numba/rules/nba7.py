@@ -0,0 +1,162 @@
+import ast
+from typing import Final, Optional
+
+from flake8_numba.cost import ALLOCATING_METHODS, ALLOCATIONS
+from flake8_numba.inference import FunctionTypes, infer_types
+from flake8_numba.loops import Loop, LoopNest, get_loop_nest
+from flake8_numba.rule import Error, Rule
+from flake8_numba.symbols import ModuleIndex, get_module_index
+from flake8_numba.utils import walk_function_body
+
+_PURE_MODULES: Final = ("numpy.", "math.", "cmath.")
+"""Modules whose functions always return the same value given the same arguments,
+except for `numpy.random`."""
+
+
+def _names(node: ast.AST) -> set[str]:
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+
+
+def _invariant_levels(node: ast.AST, loop: Loop, nest: LoopNest) -> int:
+    """Number of enclosing loops, from the innermost, where the node does not change."""
+    names = _names(node)
+    levels = 0
+    for enclosing in (loop, *loop.ancestors()):
+        written = {
+            access.array.split(".")[0]
+            for access in nest.accesses_within(enclosing)
+            if access.is_store and access.array is not None
+        }
+        if names & (enclosing.assigned | written):
+            break
+        levels += 1
+    return levels
+
+
+class NBA701(Rule):
+    """Array or list allocated within a loop of a jitted function."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        function = index.call_graph.function_of(node)
+        if function is None or not function.is_jitted:
+            return None
+
+        types_ = infer_types(node)[0]
+        lists = self._list_names(node, index)
+        nest = get_loop_nest(node)
+        # The most deeply nested allocation is reported, as it runs the most times
+        deepest: Optional[tuple[int, ast.expr, str, Loop]] = None
+        for child in walk_function_body(node):
+            loop = nest.loop_of(child)
+            if loop is None or not isinstance(child, ast.expr):
+                continue
+            if deepest is not None and loop.depth + 1 <= deepest[0]:
+                continue
+            description = self._allocation(child, types_, index, lists)
+            if description:
+                deepest = (loop.depth + 1, child, description, loop)
+        if deepest is None:
+            return None
+
+        depth, expr, description, loop = deepest
+        if _invariant_levels(expr, loop, nest):
+            hint = "Hoist it out of the loop."
+        else:
+            hint = "Preallocate it before the loops and write into it."
+        msg = (
+            f"NBA701: {description} within {depth} nested loop(s) allocates on every "
+            f"iteration. {hint}"
+        )
+        return Error(expr.lineno, expr.col_offset, msg)
+
+    @staticmethod
+    def _list_names(node: ast.FunctionDef, index: ModuleIndex) -> set[str]:
+        """Variables of the function bound to lists."""
+        lists: set[str] = set()
+        for child in walk_function_body(node):
+            if not isinstance(child, ast.Assign):
+                continue
+            value = child.value
+            if isinstance(value, (ast.List, ast.ListComp)) or (
+                isinstance(value, ast.Call) and index.qualified_name(value.func) == "list"
+            ):
+                lists.update(t.id for t in child.targets if isinstance(t, ast.Name))
+        return lists
+
+    @staticmethod
+    def _allocation(
+        expr: ast.expr, types_: FunctionTypes, index: ModuleIndex, lists: set[str]
+    ) -> str:
+        """Describe the allocation made by an expression, or return ''."""
+        if isinstance(expr, ast.Call):
+            name = index.qualified_name(expr.func) or ""
+            module, _, short_name = name.rpartition(".")
+            if module == "numpy" and (
+                short_name in ALLOCATIONS or short_name == "append"
+            ):
+                return f"`{name}`"
+            if not isinstance(expr.func, ast.Attribute) or module.startswith("numpy"):
+                return ""
+            owner, method = expr.func.value, expr.func.attr
+            if method in ALLOCATING_METHODS:
+                return f"`.{method}()`"
+            if method in ("append", "extend") and isinstance(owner, ast.Name):
+                if owner.id in lists:
+                    return f"Growing list `{owner.id}`"
+            return ""
+        if isinstance(expr, ast.Subscript) and isinstance(expr.ctx, ast.Load):
+            indices = (
+                expr.slice.elts if isinstance(expr.slice, ast.Tuple) else [expr.slice]
+            )
+            if any(
+                isinstance(i, ast.Compare) or types_.type_of(i).is_array for i in indices
+            ):
+                return f"Mask or fancy indexing `{ast.unparse(expr)}`"
+            return ""
+        if isinstance(expr, ast.BinOp) and types_.type_of(expr).is_array:
+            return f"Array expression `{ast.unparse(expr)}`"
+        return ""
+
+
+class NBA702(Rule):
+    """Loop-invariant call or transpose within a loop of a jitted function."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        function = index.call_graph.function_of(node)
+        if function is None or not function.is_jitted:
+            return None
+
+        nest = get_loop_nest(node)
+        for child in walk_function_body(node):
+            loop = nest.loop_of(child)
+            if loop is None or not self._is_candidate(child, index):
+                continue
+            levels = _invariant_levels(child, loop, nest)
+            if levels and isinstance(child, ast.expr):
+                msg = (
+                    f"NBA702: `{ast.unparse(child)}` does not change within "
+                    f"{levels} loop(s) and is computed on every iteration. Compute it "
+                    "once before them."
+                )
+                return Error(child.lineno, child.col_offset, msg)
+        return None
+
+    @staticmethod
+    def _is_candidate(node: ast.AST, index: ModuleIndex) -> bool:
+        """Whether the node is a pure call or a transpose, such as `np.sqrt(n)`."""
+        if isinstance(node, ast.Attribute):
+            return node.attr == "T" and isinstance(node.ctx, ast.Load)
+        if not isinstance(node, ast.Call) or not node.args:
+            return False
+        for call in ast.walk(node):
+            if not isinstance(call, ast.Call):
+                continue
+            name = index.qualified_name(call.func) or ""
+            if not name.startswith(_PURE_MODULES) or name.startswith("numpy.random."):
+                return False
+            # Allocations are reported by NBA701
+            if name.rsplit(".", 1)[-1] in ALLOCATIONS:
+                return False
+        return True
@@ -0,0 +1,99 @@
+import ast
+from typing import ClassVar, Optional
+
+from numba.core import types as nb_types
+
+from flake8_numba.inference import from_numba_type, get_signatures, infer_types
+from flake8_numba.loops import IndexExpression, get_loop_nest
+from flake8_numba.rule import Error, Rule
+from flake8_numba.symbols import get_module_index
+from flake8_numba.utils import matches_path
+
+
+class NBA801(Rule):
+    """Array of any layout declared in the eager signature of a jitted function."""
+
+    paths: ClassVar[tuple[str, ...]] = ()
+    """Directories or glob patterns where the rule is checked. All files if empty."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        index = get_module_index(node)
+        function = index.call_graph.function_of(node)
+        # Core dimensions of gufuncs are given as strided views, so they are not included
+        if function is None or function.decorator not in ("jit", "njit", "cfunc"):
+            return None
+        if self.paths and not matches_path(index.filename, self.paths):
+            return None
+
+        # Signatures that can not be evaluated safely are not parsed
+        for signature in get_signatures(node):
+            args = getattr(signature, "args", signature)
+            for position, type_ in enumerate(args):
+                if not isinstance(type_, nb_types.Array) or type_.layout != "A":
+                    continue
+                name = (
+                    node.args.args[position].arg
+                    if position < len(node.args.args)
+                    else str(position)
+                )
+                inferred = from_numba_type(type_)
+                msg = (
+                    f"NBA801: Argument `{name}` is declared as `{inferred}`, which "
+                    "accepts any layout and prevents SIMD vectorization. Declare it as "
+                    f"`{inferred._replace(layout='C')}` if it is C-contiguous."
+                )
+                return Error(node.lineno, node.col_offset, msg)
+        return None
+
+
+class NBA802(Rule):
+    """Nested loops whose order goes against the memory order of an array."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        function = get_module_index(node).call_graph.function_of(node)
+        if function is None or not function.is_jitted:
+            return None
+
+        inferred = infer_types(node)
+        for access in get_loop_nest(node).accesses:
+            if access.loop is None or len(access.indices) < 2:
+                continue
+            if any(index.is_slice for index in access.indices):
+                continue
+            # Variable of the innermost loop used by the subscript
+            inner = next(
+                (
+                    loop
+                    for loop in (access.loop, *access.loop.ancestors())
+                    if any(loop.variable in index.variables for index in access.indices)
+                ),
+                None,
+            )
+            if inner is None or inner.variable is None:
+                continue
+            layouts = {types_.type_of(access.node.value).layout for types_ in inferred}
+            order = "F" if layouts == {"F"} else "C"
+            fastest = access.indices[0 if order == "F" else -1]
+            if not self._strides(access.indices, fastest, inner.variable):
+                continue
+            outer = sorted(fastest.variables - {inner.variable})[0]
+            axis = "first" if order == "C" else "last"
+            msg = (
+                f"NBA802: `{ast.unparse(access.node)}` goes through the {axis} axis of "
+                f"an array in {order} order in the innermost loop over "
+                f"`{inner.variable}`. Swap the loops so that `{outer}` is innermost."
+            )
+            return Error(access.node.lineno, access.node.col_offset, msg)
+        return None
+
+    @staticmethod
+    def _strides(
+        indices: tuple[IndexExpression, ...], fastest: IndexExpression, variable: str
+    ) -> bool:
+        """Whether an outer loop indexes the fastest axis and the inner one a slow one."""
+        if variable in fastest.variables or not fastest.variables:
+            return False
+        return any(
+            index is not fastest and (index.coefficients or {}).get(variable)
+            for index in indices
+        )
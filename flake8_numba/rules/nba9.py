@@ -0,0 +1,222 @@
+import ast
+from collections.abc import Iterator
+from typing import Final, Optional, Union
+
+import numpy as np
+
+from flake8_numba.inference import (
+    UNKNOWN,
+    FunctionTypes,
+    InferredType,
+    infer_types,
+    promote,
+)
+from flake8_numba.rule import Error, Rule
+from flake8_numba.symbols import get_module_index
+
+_CATEGORIES: Final = {"b": "bool", "u": "int", "i": "int", "f": "float", "c": "complex"}
+"""Kinds of dtypes that numba can not unify without converting values."""
+_PROMOTIONS: Final = {"float32": "float64", "complex64": "complex128"}
+"""Single-precision dtypes and the double-precision dtypes they are promoted to."""
+
+
+def _is_jitted(node: ast.FunctionDef) -> bool:
+    function = get_module_index(node).call_graph.function_of(node)
+    return function is not None and function.is_jitted
+
+
+def _conflict(first: InferredType, second: InferredType) -> bool:
+    """Whether unifying two types converts values or changes their dimensions."""
+    if not first.is_known or not second.is_known:
+        return False
+    if first.kind != second.kind or first.ndim != second.ndim:
+        return True
+    first_kind, second_kind = np.dtype(first.dtype).kind, np.dtype(second.dtype).kind
+    return _CATEGORIES[first_kind] != _CATEGORIES[second_kind]
+
+
+def _statement_lists(node: ast.FunctionDef) -> dict[ast.stmt, int]:
+    """Identify the list of statements (body of an `if`, a loop...) of each statement."""
+    lists: dict[ast.stmt, int] = {}
+    for child in ast.walk(node):
+        for field in ("body", "orelse", "finalbody"):
+            statements = getattr(child, field, None)
+            if isinstance(statements, list):
+                lists.update((statement, id(statements)) for statement in statements)
+    return lists
+
+
+def _updates(statement: ast.stmt, name: str) -> bool:
+    """Whether the statement updates the variable from its own value (`s += x`)."""
+    if isinstance(statement, ast.AugAssign):
+        return True
+    return isinstance(statement, ast.Assign) and any(
+        isinstance(child, ast.Name) and child.id == name
+        for child in ast.walk(statement.value)
+    )
+
+
+def _int_accumulators(
+    types_: FunctionTypes,
+) -> Iterator[tuple[str, int, ast.stmt, InferredType]]:
+    """Find accumulators initialized with an integer and updated with floats.
+
+    Yields:
+        tuple[str, int, ast.stmt, InferredType]: Name of the accumulator, initial value,
+            first update with a float or complex value and type of that value.
+    """
+    for name, assignments in types_.assignments.items():
+        first, _ = assignments[0]
+        value = first.value if isinstance(first, ast.Assign) else None
+        if not isinstance(value, ast.Constant) or type(value.value) is not int:
+            continue
+        for statement, type_ in assignments[1:]:
+            if not type_.is_known or type_.is_array:
+                continue
+            if np.dtype(type_.dtype).kind in "fc" and _updates(statement, name):
+                yield name, value.value, statement, type_
+                break
+
+
+class NBA901(Rule):
+    """Variable assigned values of different types that numba has to unify."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        if not _is_jitted(node):
+            return None
+        lists = _statement_lists(node)
+        for types_ in infer_types(node):
+            # Accumulators are reported on their own by NBA902
+            accumulators = {name for name, *_ in _int_accumulators(types_)}
+            for name, assignments in types_.assignments.items():
+                if name in accumulators:
+                    continue
+                for i, (statement, type_) in enumerate(assignments):
+                    for previous, previous_type in assignments[:i]:
+                        # Reassignments in the same block define a new variable
+                        if lists.get(previous) == lists.get(statement):
+                            continue
+                        if not _conflict(previous_type, type_):
+                            continue
+                        msg = (
+                            f"NBA901: `{name}` is assigned `{type_}` here and "
+                            f"`{previous_type}` at line {previous.lineno}, which numba "
+                            "has to unify across branches or iterations."
+                        )
+                        return Error(statement.lineno, statement.col_offset, msg)
+        return None
+
+
+class NBA902(Rule):
+    """Accumulator initialized as an integer and updated with floats."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        if not _is_jitted(node):
+            return None
+        for types_ in infer_types(node):
+            for name, initial, statement, type_ in _int_accumulators(types_):
+                suggestion = f"{initial}.0" if type_.dtype[0] == "f" else f"{initial}j"
+                msg = (
+                    f"NBA902: `{name}` is initialized as `{initial}` but updated with "
+                    f"`{type_}` values. Initialize it as `{suggestion}`."
+                )
+                return Error(statement.lineno, statement.col_offset, msg)
+        return None
+
+
+class NBA911(Rule):
+    """Single-precision values promoted to double precision."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        if not _is_jitted(node):
+            return None
+        for types_ in infer_types(node):
+            if not any(t.dtype in _PROMOTIONS for t in types_.arguments.values()):
+                continue
+            promotions = list(self._promotions(types_))
+            # Report where the double-precision value comes from, not what it spreads to
+            promoted = {expr for expr, _, _ in promotions}
+            causes = [p for p in promotions if p[2] not in promoted]
+            if not causes:
+                continue
+            expr, narrow, cause = min(
+                causes, key=lambda p: (p[0].lineno, p[0].col_offset)
+            )
+            reason = f"`{ast.unparse(cause)}`"
+            if not isinstance(expr, ast.Call):
+                reason += f" (`{types_.type_of(cause)}`)"
+            msg = (
+                f"NBA911: `{ast.unparse(expr)}` promotes `{narrow}` values to "
+                f"`{_PROMOTIONS[narrow]}` because of {reason}. Keep it in single "
+                "precision (e.g. with `np.float32(...)`)."
+            )
+            return Error(expr.lineno, expr.col_offset, msg)
+        return None
+
+    @staticmethod
+    def _promotions(
+        types_: FunctionTypes,
+    ) -> Iterator[tuple[Union[ast.expr, ast.stmt], str, ast.expr]]:
+        """Find operations on single-precision values that return double precision.
+
+        Yields:
+            tuple[Union[ast.expr, ast.stmt], str, ast.expr]: Operation, single-precision
+                dtype and what promotes it (the called function or the other operand).
+        """
+        for child in ast.walk(types_.node):
+            if isinstance(child, ast.BinOp):
+                operands = [(e, types_.type_of(e)) for e in (child.left, child.right)]
+                result = types_.type_of(child)
+            elif isinstance(child, ast.AugAssign):
+                target = NBA911._target_type(types_, child)
+                value = types_.type_of(child.value)
+                operands = [(child.target, target), (child.value, value)]
+                result = promote(target, value)
+            elif isinstance(child, ast.Call):
+                operands = [(e, types_.type_of(e)) for e in child.args]
+                result = types_.type_of(child)
+            else:
+                continue
+            narrow = next((t.dtype for _, t in operands if t.dtype in _PROMOTIONS), "")
+            if not narrow or result.dtype != _PROMOTIONS[narrow]:
+                continue
+            if isinstance(child, ast.Call):
+                yield child, narrow, child.func
+                continue
+            yield child, narrow, next(
+                e for e, t in operands if t.dtype not in _PROMOTIONS
+            )
+
+    @staticmethod
+    def _target_type(types_: FunctionTypes, statement: ast.AugAssign) -> InferredType:
+        """Type of the target of an augmented assignment before it is updated."""
+        if not isinstance(statement.target, ast.Name):
+            return types_.type_of(statement.target)
+        name = statement.target.id
+        before = types_.arguments.get(name, UNKNOWN)
+        for assignment, type_ in types_.assignments.get(name, []):
+            if assignment is statement:
+                break
+            before = type_
+        return before
+
+
+class NBA912(Rule):
+    """Double-precision value returned as single precision."""
+
+    def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+        if not _is_jitted(node):
+            return None
+        for types_ in infer_types(node):
+            narrow = types_.return_type.dtype
+            if narrow not in _PROMOTIONS:
+                continue
+            for statement, type_ in types_.returns:
+                if type_.dtype != _PROMOTIONS[narrow]:
+                    continue
+                msg = (
+                    f"NBA912: The returned value is computed as `{type_.dtype}` and "
+                    f"truncated to the declared `{narrow}`."
+                )
+                return Error(statement.lineno, statement.col_offset, msg)
+        return None
@@ -0,0 +1,254 @@
+"""Record the compilations triggered while running a workload.
+
+Static checks can not know how often a dispatcher compiles in practice. This module
+listens to the `numba:compile` events of numba while a local workload runs and stores,
+for each jitted function, the time spent compiling it, the signatures that were compiled
+and those that fell back to object mode. The profile can then be given to the linter
+with `--numba-profile`, so that findings are annotated with the measured compile cost of
+the function where they are found.
+
+```python
+from flake8_numba.runtime import CompileRecorder
+
+with CompileRecorder("numba_profile.json"):
+    run_workload()
+```
+
+Or, for a script: `python -m flake8_numba.runtime -o numba_profile.json script.py ARGS`.
+
+Compile times include the compilation of other jitted functions called for the first
+time from within the compiled one.
+"""
+
+import argparse
+import ast
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any, Final, NamedTuple, Optional
+
+from numba.core import event
+
+PROFILE_VERSION: Final = 1
+"""Version of the format of the profile file."""
+
+
+class FunctionProfile(NamedTuple):
+    """Compilations measured for a single jitted function."""
+
+    file: str
+    """File where the function is defined, relative to the working directory."""
+    line: int
+    """First line of the function, including its decorators."""
+    name: str
+    """Qualified name of the function."""
+    compile_time: float
+    """Seconds spent compiling it."""
+    signatures: tuple[str, ...]
+    """Signatures compiled, in order."""
+    object_mode: tuple[str, ...]
+    """Signatures compiled in object mode."""
+
+    @property
+    def compilations(self) -> int:
+        return len(self.signatures)
+
+    def describe(self) -> str:
+        """Short description of the measured cost, appended to findings."""
+        text = f"measured: {self.compilations} compilation(s), {self.compile_time:.2f}s"
+        if self.object_mode:
+            text += f", {len(self.object_mode)} in object mode"
+        return text
+
+
+def _normalize_path(path: str) -> str:
+    return os.path.relpath(os.path.abspath(path)).replace(os.sep, "/")
+
+
+def first_line(node: ast.FunctionDef) -> int:
+    """First line of a function, as reported by Python for its code object."""
+    return min([node.lineno, *(decorator.lineno for decorator in node.decorator_list)])
+
+
+class CompileProfile:
+    """Compilations recorded for all jitted functions of a workload."""
+
+    def __init__(self, functions: Sequence[FunctionProfile] = ()) -> None:
+        """Instantiate the profile.
+
+        Args:
+            functions (Sequence[FunctionProfile], optional): Recorded functions.
+        """
+        self._functions = {(f.file, f.line): f for f in functions}
+
+    @property
+    def functions(self) -> list[FunctionProfile]:
+        """Recorded functions, from the one that took the longest to compile."""
+        return sorted(self._functions.values(), key=lambda f: -f.compile_time)
+
+    def add(self, function: FunctionProfile) -> None:
+        """Add the compilations of a function, merging them with those recorded."""
+        key = (function.file, function.line)
+        previous = self._functions.get(key)
+        if previous is not None:
+            function = function._replace(
+                compile_time=previous.compile_time + function.compile_time,
+                signatures=previous.signatures + function.signatures,
+                object_mode=previous.object_mode + function.object_mode,
+            )
+        self._functions[key] = function
+
+    def lookup(self, filename: str, node: ast.FunctionDef) -> Optional[FunctionProfile]:
+        """Get the compilations recorded for a function definition.
+
+        Args:
+            filename (str): File where the function is defined.
+            node (ast.FunctionDef): Node representing the function definition.
+
+        Returns:
+            Optional[FunctionProfile]: Recorded compilations. `None` if there are none.
+        """
+        return self._functions.get((_normalize_path(filename), first_line(node)))
+
+    @classmethod
+    def load(cls, path: str) -> "CompileProfile":
+        """Read a profile file. An empty profile is returned if it does not exist."""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            [
+                FunctionProfile(
+                    file,
+                    line,
+                    name,
+                    compile_time,
+                    tuple(signatures),
+                    tuple(object_mode),
+                )
+                for file, line, name, compile_time, signatures, object_mode in data[
+                    "functions"
+                ]
+            ]
+        )
+
+    def save(self, path: str) -> None:
+        """Write the profile, storing each function as a compact list."""
+        data = {
+            "version": PROFILE_VERSION,
+            "functions": [list(function) for function in self.functions],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+class CompileEvent(NamedTuple):
+    """Single compilation of a dispatcher."""
+
+    dispatcher: Any
+    """Dispatcher that compiled a new signature."""
+    name: str
+    """Qualified name of the function, including its module (e.g. `kernels.move`)."""
+    signature: str
+    """Types of the arguments, such as `(int64, float64)`."""
+    compile_time: float
+    """Seconds spent compiling it."""
+    object_mode: bool
+    """Whether it was compiled in object mode."""
+
+
+class CompileRecorder(event.Listener):
+    """Listener of numba compile events, used as a context manager."""
+
+    def __init__(self, path: str = "", append: bool = False) -> None:
+        """Instantiate the recorder.
+
+        Args:
+            path (str, optional): File where the profile is written when the context
+                exits. Nothing is written if empty.
+            append (bool, optional): Merge the compilations with those already stored
+                in `path` instead of replacing them.
+        """
+        self.path = path
+        self.profile = CompileProfile.load(path) if path and append else CompileProfile()
+        """Compilations recorded so far."""
+        self.events: list[CompileEvent] = []
+        """Compilations recorded so far, in the order they finished."""
+        self._starts = threading.local()
+
+    def on_start(self, event_: event.Event) -> None:  # noqa: ARG002
+        if not hasattr(self._starts, "stack"):
+            self._starts.stack = []
+        self._starts.stack.append(time.perf_counter())
+
+    def on_end(self, event_: event.Event) -> None:
+        # Compilations started before the recorder was registered are ignored
+        stack = getattr(self._starts, "stack", None)
+        if not stack:
+            return
+        elapsed = time.perf_counter() - stack.pop()
+        data = event_.data or {}
+        dispatcher = data.get("dispatcher")
+        py_func = getattr(dispatcher, "py_func", None)
+        if py_func is None or not hasattr(py_func, "__code__"):
+            return
+        code = py_func.__code__
+        args = tuple(data.get("args") or ())
+        signature = f"({', '.join(str(arg) for arg in args)})"
+        result = getattr(dispatcher, "overloads", {}).get(args)
+        object_mode = bool(getattr(result, "objectmode", False))
+        name = f"{py_func.__module__}.{py_func.__qualname__}"
+        self.events.append(
+            CompileEvent(dispatcher, name, signature, elapsed, object_mode)
+        )
+        function = FunctionProfile(
+            _normalize_path(code.co_filename),
+            code.co_firstlineno,
+            py_func.__qualname__,
+            elapsed,
+            (signature,),
+            (signature,) if object_mode else (),
+        )
+        self.profile.add(function)
+
+    def __enter__(self) -> "CompileRecorder":  # noqa: PYI034
+        """Start listening to compile events."""
+        event.register("numba:compile", self)  # type: ignore[no-untyped-call]
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop listening and write the profile."""
+        event.unregister("numba:compile", self)  # type: ignore[no-untyped-call]
+        if self.path:
+            self.profile.save(self.path)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run a script while recording the compilations it triggers."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default="numba_profile.json")
+    parser.add_argument("--append", action="store_true", help="Merge with the output.")
+    parser.add_argument("script", help="Script running the workload.")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Its arguments.")
+    args = parser.parse_args(argv)
+
+    sys.argv = [args.script, *args.args]
+    globals_: dict[str, Any] = {}
+    with CompileRecorder(args.output, append=args.append):
+        globals_ = runpy.run_path(args.script, run_name="__main__")
+    del globals_
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,552 @@
+"""Long-lived language server that keeps `flake8-numba` warm for editors.
+
+It speaks the subset of the Language Server Protocol (JSON-RPC over stdio) needed to
+publish diagnostics: documents are opened, updated (fully or incrementally) and closed,
+and after each update the diagnostics of the whole document are published again.
+
+Only those functions whose code changed are checked again. Errors found for a function
+are cached by its fingerprint, so moving a function around or editing an unrelated one
+reuses the previous results. Fingerprints also cover what rules read elsewhere in the
+module (decorators, called functions, calls to numba taking the function), and only
+those of the functions within open documents are kept.
+
+The options of the plugin are read from the flake8 configuration (`setup.cfg`, `tox.ini`
+or `.flake8`) at the root of the workspace. Relative paths are relative to that root.
+
+Run it with `python -m flake8_numba.server` or `flake8-numba-server`.
+"""
+import argparse
+import ast
+import configparser
+import hashlib
+import json
+import os
+import re
+import sys
+import urllib.parse
+import urllib.request
+from collections.abc import Mapping
+from typing import Any, BinaryIO, Final, NamedTuple, Optional
+
+from flake8_numba.plugin import Plugin
+from flake8_numba.rule import Error
+from flake8_numba.symbols import ModuleIndex, get_module_index, index_module
+from flake8_numba.visitor import check_function, get_rule_plan
+
+SOURCE: Final = "flake8-numba"
+"""Name used as source for all published diagnostics."""
+METHOD_NOT_FOUND: Final = -32601
+"""JSON-RPC error code for unknown requests."""
+DIAGNOSTIC_SEVERITY_WARNING: Final = 2
+"""LSP severity assigned to all diagnostics."""
+TEXT_DOCUMENT_SYNC_INCREMENTAL: Final = 2
+"""LSP sync kind. Clients send only the changed ranges of a document."""
+POSITION_ENCODING: Final = "utf-16"
+"""LSP position encoding. Characters within a line are counted as UTF-16 code units."""
+CONFIG_FILES: Final = ("setup.cfg", "tox.ini", ".flake8")
+"""Files where the flake8 configuration is looked for, in the same order as flake8."""
+PATH_OPTIONS: Final = (
+    "numba_project_index",
+    "numba_project_root",
+    "numba_cost_report",
+    "numba_profile",
+    "numba_cache_required_paths",
+    "numba_latency_paths",
+    "numba_layout_paths",
+    "numba_deep_cache",
+)
+"""Options holding paths, which are resolved against the root of the workspace."""
+
+
+def read_message(reader: BinaryIO) -> Optional[dict[str, Any]]:
+    """Read a single JSON-RPC message framed with `Content-Length` headers.
+
+    Args:
+        reader (BinaryIO): Stream the message is read from.
+
+    Returns:
+        Optional[dict[str, Any]]: Decoded message. `None` if the stream was closed.
+    """
+    content_length = 0
+    while True:
+        line = reader.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.strip().lower() == "content-length":
+            content_length = int(value.strip())
+    return json.loads(reader.read(content_length))  # type: ignore
+
+
+def write_message(writer: BinaryIO, message: Mapping[str, Any]) -> None:
+    """Write a single JSON-RPC message framed with `Content-Length` headers.
+
+    Args:
+        writer (BinaryIO): Stream the message is written to.
+        message (Mapping[str, Any]): Message to be sent.
+    """
+    body = json.dumps(message).encode("utf-8")
+    writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    writer.flush()
+
+
+def uri_to_path(uri: str) -> str:
+    """Get the path of a document from its URI.
+
+    Args:
+        uri (str): Identifier of the document (e.g. `file:///src/a.py`).
+
+    Returns:
+        str: Path of the document. Empty if it is not a file.
+    """
+    parsed = urllib.parse.urlparse(uri)
+    if parsed.scheme != "file":
+        return ""
+    return urllib.request.url2pathname(parsed.path)
+
+
+class _OptionParser:
+    """Stand-in for the option manager of flake8 that `Plugin.add_options` expects."""
+
+    def __init__(self) -> None:
+        self.parser = argparse.ArgumentParser(add_help=False)
+        self.config_options: dict[str, argparse.Action] = {}
+        """Options that can be given in the configuration, indexed by destination."""
+        self.comma_separated: set[str] = set()
+        """Destination of the options given as comma-separated lists."""
+
+    def add_option(
+        self,
+        *args: str,
+        parse_from_config: bool = False,
+        comma_separated_list: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        action = self.parser.add_argument(*args, **kwargs)
+        if parse_from_config:
+            self.config_options[action.dest] = action
+        if comma_separated_list:
+            self.comma_separated.add(action.dest)
+
+
+def load_options(root: str) -> argparse.Namespace:
+    """Read the options of the plugin from the flake8 configuration of a workspace.
+
+    Args:
+        root (str): Root directory of the workspace.
+
+    Returns:
+        argparse.Namespace: Options as `Plugin.parse_options` expects them. Defaults
+            are used for those that are not configured.
+    """
+    option_parser = _OptionParser()
+    Plugin.add_options(option_parser)
+    options = option_parser.parser.parse_args([])
+    for name in CONFIG_FILES:
+        config = configparser.RawConfigParser()
+        config.read(os.path.join(root, name), encoding="utf-8")
+        if config.has_section("flake8"):
+            break
+    else:
+        config = configparser.RawConfigParser()
+        config.add_section("flake8")
+
+    section = config["flake8"]
+    for key, value in section.items():
+        dest = key.replace("-", "_")
+        action = option_parser.config_options.get(dest)
+        if action is None:
+            continue
+        if dest in option_parser.comma_separated:
+            setattr(options, dest, [item for item in re.split(r"[,\s]+", value) if item])
+        elif action.nargs == 0:
+            setattr(options, dest, section.getboolean(key))
+        elif callable(action.type):
+            setattr(options, dest, action.type(value))
+        else:
+            setattr(options, dest, value)
+
+    for dest in PATH_OPTIONS:
+        value = getattr(options, dest)
+        if isinstance(value, list):
+            setattr(options, dest, [os.path.join(root, path) for path in value])
+        elif value:
+            setattr(options, dest, os.path.join(root, value))
+    return options
+
+
+class ModuleContext(NamedTuple):
+    """Facts of a module that rules read besides the function itself."""
+
+    digest: str
+    """Hash of the facts that any function may depend on."""
+    numba_calls: Mapping[str, tuple[str, ...]]
+    """Calls to numba taking a function by name (e.g. `njit(func)`), indexed by name."""
+
+
+def module_context(index: ModuleIndex) -> ModuleContext:
+    """Get the facts of a module that rules read besides the function itself.
+
+    These are the path of the module, the module-level symbols, the numba decorators of
+    all functions and the constants and jitted functions imported from other modules if a
+    project index is enabled. Calls to numba that take a function (e.g. `njit(func)`) are
+    kept apart, as they only matter to the function they take.
+
+    Args:
+        index (ModuleIndex): Index of the module.
+
+    Returns:
+        ModuleContext: Context that only changes if any of those facts changes.
+    """
+    digest = hashlib.sha1(f"{index.filename}:{index.digest}".encode())
+    call_graph = index.call_graph
+    for function in call_graph.functions.values():
+        options = sorted(
+            (name, ast.dump(value)) for name, value in function.options.items()
+        )
+        facts = (function.name, function.decorator, [ast.dump(a) for a in function.args])
+        digest.update(repr((*facts, options)).encode("utf-8"))
+    for name in sorted(index.imports):
+        external = index.external_constant(ast.Name(id=name))
+        if external is not None:
+            digest.update(f"{name}={ast.dump(external)}".encode())
+        jitted = index.external_function(ast.Name(id=name))
+        if jitted is not None:
+            digest.update(f"{name}={jitted!r}".encode())
+
+    numba_calls: dict[str, list[str]] = {}
+    for call in call_graph.calls:
+        func = call.node.func
+        # Either `njit(f)` or `njit(parallel=True)(f)`
+        decorator = func.func if isinstance(func, ast.Call) else func
+        if not (index.qualified_name(decorator) or "").startswith("numba."):
+            continue
+        for arg in call.node.args:
+            if isinstance(arg, ast.Name):
+                numba_calls.setdefault(arg.id, []).append(ast.dump(call.node))
+    return ModuleContext(
+        digest.hexdigest(),
+        {name: tuple(calls) for name, calls in numba_calls.items()},
+    )
+
+
+def function_fingerprint(
+    node: ast.FunctionDef, context: Optional[ModuleContext] = None
+) -> str:
+    """Get a fingerprint of a function that does not depend on its location.
+
+    The code of the functions it calls within the module (e.g. whether they run in
+    parallel), the calls to numba that take it and the context of the module are taken
+    into account, as rules read them. Calls made by other functions are not.
+
+    Args:
+        node (ast.FunctionDef): Node representing the function definition.
+        context (Optional[ModuleContext], optional): Context of the module, as given by
+            `module_context`. Computed if not given.
+
+    Returns:
+        str: Hash that only changes if the code of the function, of the functions it
+            calls, the calls to numba that take it or the context of the module change.
+    """
+    index = get_module_index(node)
+    context = context or module_context(index)
+    digest = hashlib.sha1(context.digest.encode("utf-8"))
+    digest.update(ast.dump(node).encode("utf-8"))
+    for numba_call in context.numba_calls.get(node.name, ()):
+        digest.update(numba_call.encode("utf-8"))
+    pending = [index.call_graph.function_of(node)]
+    seen: set[str] = set()
+    while pending:
+        function = pending.pop()
+        if function is None or function.name in seen:
+            continue
+        seen.add(function.name)
+        for call in index.call_graph.callees(function):
+            callee = call.callee.name if call.callee else ""
+            digest.update(repr((function.name, call.callee_name, callee)).encode())
+            if call.callee is not None and call.callee.name not in seen:
+                digest.update(ast.dump(call.callee.node).encode("utf-8"))
+                pending.append(call.callee)
+    return digest.hexdigest()
+
+
+def split_lines(text: str) -> list[str]:
+    r"""Split a document into lines as the LSP does, keeping the line breaks.
+
+    Only `\n`, `\r\n` and `\r` end a line, the same as for Python itself.
+
+    Args:
+        text (str): Content of the document.
+
+    Returns:
+        list[str]: Lines of the document.
+    """
+    return re.findall(r"[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+\Z", text)
+
+
+def _to_code_points(line: str, character: int) -> int:
+    """Convert a position within a line from UTF-16 code units to code points."""
+    units = 0
+    for index, char in enumerate(line.rstrip("\r\n")):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line.rstrip("\r\n"))
+
+
+def _to_utf16(line: str, column: int) -> int:
+    """Convert a column of the AST (UTF-8 bytes) to UTF-16 code units within a line."""
+    prefix = line.encode("utf-8")[:column].decode("utf-8", errors="ignore")
+    return len(prefix.encode("utf-16-le")) // 2
+
+
+def apply_change(text: str, change: Mapping[str, Any]) -> str:
+    """Apply a single LSP content change to a document.
+
+    Characters within a line are counted as UTF-16 code units.
+
+    Args:
+        text (str): Current content of the document.
+        change (Mapping[str, Any]): Change with the new `text` and an optional `range`.
+            If no range is given, the whole document is replaced.
+
+    Returns:
+        str: New content of the document.
+    """
+    if "range" not in change:
+        return change["text"]  # type: ignore
+
+    lines = split_lines(text)
+
+    def to_offset(position: Mapping[str, int]) -> int:
+        line = position["line"]
+        if line >= len(lines):
+            return len(text)
+        character = _to_code_points(lines[line], position["character"])
+        return sum(len(line_) for line_ in lines[:line]) + character
+
+    start = to_offset(change["range"]["start"])
+    end = to_offset(change["range"]["end"])
+    return text[:start] + str(change["text"]) + text[end:]
+
+
+class _CachedError(NamedTuple):
+    """Error stored relative to the function where it was found."""
+
+    line_offset: int
+    """Line of the error relative to the line of the function."""
+    column_offset: int
+    """Column of the error relative to the column of the function."""
+    message: str
+    """Message of the error."""
+
+
+class Server:
+    """Language server that publishes `flake8-numba` diagnostics."""
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO) -> None:
+        """Instantiate the server over the given streams.
+
+        Args:
+            reader (BinaryIO): Stream where client messages are read from.
+            writer (BinaryIO): Stream where server messages are written to.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.documents: dict[str, str] = {}
+        """Content of all open documents indexed by URI."""
+        self.cache: dict[str, tuple[_CachedError, ...]] = {}
+        """Errors of the functions checked so far indexed by fingerprint."""
+        self.fingerprints: dict[str, set[str]] = {}
+        """Fingerprints of the functions of each open document, indexed by URI."""
+        self.running = True
+        # Plan is built once so that the first diagnostics are already fast
+        get_rule_plan()
+
+    def serve(self) -> None:
+        """Process messages until the client asks to exit or closes the stream."""
+        while self.running:
+            message = read_message(self.reader)
+            if message is None:
+                return
+            self.handle(message)
+
+    def handle(self, message: Mapping[str, Any]) -> None:
+        """Process a single message coming from the client.
+
+        Args:
+            message (Mapping[str, Any]): Decoded JSON-RPC message.
+        """
+        method = message.get("method", "")
+        params = message.get("params", {})
+        if method == "initialize":
+            root = params.get("rootPath") or ""
+            if params.get("rootUri"):
+                root = uri_to_path(params["rootUri"])
+            if root:
+                Plugin.parse_options(load_options(root))
+            self.respond(
+                message,
+                {
+                    "capabilities": {
+                        "positionEncoding": POSITION_ENCODING,
+                        "textDocumentSync": {
+                            "openClose": True,
+                            "change": TEXT_DOCUMENT_SYNC_INCREMENTAL,
+                        },
+                    },
+                    "serverInfo": {"name": SOURCE},
+                },
+            )
+        elif method == "textDocument/didOpen":
+            document = params["textDocument"]
+            self.documents[document["uri"]] = document["text"]
+            self.publish(document["uri"])
+        elif method == "textDocument/didChange":
+            uri = params["textDocument"]["uri"]
+            text = self.documents.get(uri, "")
+            for change in params["contentChanges"]:
+                text = apply_change(text, change)
+            self.documents[uri] = text
+            self.publish(uri)
+        elif method == "textDocument/didClose":
+            uri = params["textDocument"]["uri"]
+            self.documents.pop(uri, None)
+            self.fingerprints.pop(uri, None)
+            self._prune()
+            self.notify(
+                "textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []}
+            )
+        elif method == "shutdown":
+            self.respond(message, None)
+        elif method == "exit":
+            self.running = False
+        elif "id" in message:
+            self.respond_error(message, METHOD_NOT_FOUND, f"Unknown method: {method}")
+
+    def check(self, text: str, uri: Optional[str] = None) -> Optional[list[Error]]:
+        """Check a whole document reusing the errors of unchanged functions.
+
+        Args:
+            text (str): Source code of the document.
+            uri (Optional[str], optional): Identifier of the document. If given, rules
+                see the path of the document, and the errors of functions that are no
+                longer in any open document are dropped.
+
+        Returns:
+            Optional[list[Error]]: Errors found. `None` if the code could not be parsed.
+        """
+        try:
+            tree = ast.parse(text)
+        except SyntaxError:
+            return None
+        context = module_context(index_module(tree, uri_to_path(uri) if uri else ""))
+
+        errors: list[Error] = []
+        fingerprints: set[str] = set()
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.FunctionDef):
+                continue
+            fingerprint = function_fingerprint(node, context)
+            fingerprints.add(fingerprint)
+            if fingerprint not in self.cache:
+                self.cache[fingerprint] = tuple(
+                    _CachedError(
+                        error.line - node.lineno,
+                        error.column - node.col_offset,
+                        error.message,
+                    )
+                    for error in check_function(node)
+                )
+            errors.extend(
+                Error(
+                    node.lineno + cached.line_offset,
+                    node.col_offset + cached.column_offset,
+                    cached.message,
+                )
+                for cached in self.cache[fingerprint]
+            )
+        if uri is not None:
+            self.fingerprints[uri] = fingerprints
+            self._prune()
+        return sorted(errors)
+
+    def _prune(self) -> None:
+        """Drop the errors of functions that are not within any open document."""
+        alive: set[str] = set().union(*self.fingerprints.values())
+        self.cache = {key: value for key, value in self.cache.items() if key in alive}
+
+    def publish(self, uri: str) -> None:
+        """Publish the diagnostics of a given document.
+
+        If the document can not be parsed, previous diagnostics are kept.
+
+        Args:
+            uri (str): Identifier of the document.
+        """
+        text = self.documents[uri]
+        errors = self.check(text, uri)
+        if errors is None:
+            return
+        lines = split_lines(text)
+        diagnostics = [
+            to_diagnostic(
+                error, lines[error.line - 1] if error.line <= len(lines) else None
+            )
+            for error in errors
+        ]
+        self.notify(
+            "textDocument/publishDiagnostics", {"uri": uri, "diagnostics": diagnostics}
+        )
+
+    def respond(self, request: Mapping[str, Any], result: Any) -> None:
+        write_message(
+            self.writer, {"jsonrpc": "2.0", "id": request["id"], "result": result}
+        )
+
+    def respond_error(self, request: Mapping[str, Any], code: int, message: str) -> None:
+        write_message(
+            self.writer,
+            {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": code, "message": message},
+            },
+        )
+
+    def notify(self, method: str, params: Mapping[str, Any]) -> None:
+        write_message(self.writer, {"jsonrpc": "2.0", "method": method, "params": params})
+
+
+def to_diagnostic(error: Error, line: Optional[str] = None) -> dict[str, Any]:
+    """Convert an error into an LSP diagnostic.
+
+    Args:
+        error (Error): Error found by any of the rules.
+        line (Optional[str], optional): Text of the line of the error, used to convert
+            its column from UTF-8 bytes to UTF-16 code units. Kept as is if not given.
+
+    Returns:
+        dict[str, Any]: Diagnostic as expected by the LSP specification.
+    """
+    character = error.column if line is None else _to_utf16(line, error.column)
+    position = {"line": max(error.line - 1, 0), "character": character}
+    return {
+        "range": {"start": position, "end": position},
+        "severity": DIAGNOSTIC_SEVERITY_WARNING,
+        "source": SOURCE,
+        "code": error.message.split(":", 1)[0],
+        "message": error.message,
+    }
+
+
+def main() -> None:
+    """Run the language server over stdio."""
+    Server(sys.stdin.buffer, sys.stdout.buffer).serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""Module-level index of the symbols that decorators can refer to.
+
+Signatures and layouts are often defined once at module level and reused by several
+decorators, while numba decorators and types can be imported under any alias. The index
+is built in a single pass over the top-level statements of a module, followed by a
+single pass over the whole module that builds its call graph. It is shared by all
+functions defined within it.
+"""
+
+import ast
+import copy
+import hashlib
+from typing import TYPE_CHECKING, ClassVar, Final, Optional, Protocol, Union
+
+from flake8_numba.callgraph import CallGraph
+
+if TYPE_CHECKING:
+    from flake8_numba.project_index import JittedFunction
+
+_INDEX_ATTRIBUTE: Final = "_flake8_numba_index"
+"""Attribute used to link nodes to the index of the module where they are defined."""
+_NUMBA_TYPES_MODULES: Final = ("numba.core.types.", "numba.types.")
+"""Modules whose types are also exported directly by `numba`."""
+
+
+class ExternalSymbols(Protocol):
+    """Source of constants and jitted functions defined in other project modules."""
+
+    def lookup_constant(self, qualified_name: str, filename: str) -> Optional[ast.expr]:
+        """Get the value of a constant given its fully qualified name."""
+
+    def lookup_function(
+        self, qualified_name: str, filename: str
+    ) -> Optional["JittedFunction"]:
+        """Get a jitted function given its fully qualified name."""
+
+
+class ModuleIndex:
+    """Index of the names defined at the top level of a module."""
+
+    project: ClassVar[Optional[ExternalSymbols]] = None
+    """Used to resolve constants and functions imported from other modules. Disabled by
+    default."""
+
+    def __init__(self, module: ast.Module, filename: str = "") -> None:
+        """Build the index with a single pass over the top-level statements.
+
+        Args:
+            module (ast.Module): Module to be indexed.
+            filename (str, optional): Path of the file where the module is defined.
+        """
+        self.filename = filename
+        """Path of the file where the module is defined."""
+        self.constants: dict[str, ast.expr] = {}
+        """Value of all names that are assigned only once at module level."""
+        self.imports: dict[str, str] = {}
+        """Fully qualified name of each imported name. E.g. `nb` -> `numba`."""
+        self._resolved: dict[str, ast.expr] = {}
+        self._external: dict[str, Optional[ast.expr]] = {}
+        self._external_functions: dict[str, Optional[JittedFunction]] = {}
+
+        reassigned: set[str] = set()
+        digest = hashlib.sha1()
+        for statement in module.body:
+            if isinstance(statement, (ast.Import, ast.ImportFrom)):
+                self._add_import(statement)
+            elif isinstance(statement, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                self._add_assignment(statement, reassigned)
+            else:
+                continue
+            digest.update(ast.dump(statement).encode("utf-8"))
+        for name in reassigned:
+            self.constants.pop(name, None)
+        self.digest = digest.hexdigest()
+        """Hash that only changes if any of the indexed statements changes."""
+        self.call_graph = CallGraph(module, self)
+        """Functions of the module, their numba decorators and the calls between them."""
+
+    def _add_import(self, statement: Union[ast.Import, ast.ImportFrom]) -> None:
+        if isinstance(statement, ast.Import):
+            for alias in statement.names:
+                if alias.asname:
+                    self.imports[alias.asname] = alias.name
+                else:
+                    head = alias.name.split(".", 1)[0]
+                    self.imports[head] = head
+            return
+
+        module = "." * statement.level + (statement.module or "")
+        for alias in statement.names:
+            qualified_name = (
+                f"{module}{alias.name}"
+                if module.endswith(".")
+                else f"{module}.{alias.name}"
+            )
+            self.imports[alias.asname or alias.name] = qualified_name
+
+    def _add_assignment(
+        self,
+        statement: Union[ast.Assign, ast.AnnAssign, ast.AugAssign],
+        reassigned: set[str],
+    ) -> None:
+        targets = (
+            statement.targets if isinstance(statement, ast.Assign) else [statement.target]
+        )
+        for target in targets:
+            for name_node in ast.walk(target):
+                if not isinstance(name_node, ast.Name):
+                    continue
+                name = name_node.id
+                if (
+                    name in self.constants
+                    or target is not name_node
+                    or statement.value is None
+                    or isinstance(statement, ast.AugAssign)
+                ):
+                    reassigned.add(name)
+                else:
+                    self.constants[name] = statement.value
+
+    def qualified_name(self, expr: ast.expr) -> Optional[str]:
+        """Get the fully qualified name of a name or an attribute chain.
+
+        Import aliases are resolved, so that `nb.guvectorize` becomes
+        `numba.guvectorize` if `numba` was imported as `nb`.
+
+        Args:
+            expr (ast.expr): Expression to be resolved.
+
+        Returns:
+            Optional[str]: Qualified name. `None` if the expression is not a name nor an
+                attribute chain.
+        """
+        parts: list[str] = []
+        while isinstance(expr, ast.Attribute):
+            parts.append(expr.attr)
+            expr = expr.value
+        if not isinstance(expr, ast.Name):
+            return None
+        parts.append(self.imports.get(expr.id, expr.id))
+        return ".".join(reversed(parts))
+
+    def resolve(self, expr: ast.expr) -> ast.expr:
+        """Inline module-level constants and numba aliases used within an expression.
+
+        Args:
+            expr (ast.expr): Expression to be resolved. It is not modified.
+
+        Returns:
+            ast.expr: New expression where constants are replaced by their values and
+                names imported from `numba` are written as `numba.<name>`.
+        """
+        return _Resolver(self).visit(copy.deepcopy(expr))  # type: ignore
+
+    def external_constant(self, expr: ast.expr) -> Optional[ast.expr]:
+        """Get the value of a constant imported from another module of the project.
+
+        Args:
+            expr (ast.expr): Name or attribute chain referring to the constant.
+
+        Returns:
+            Optional[ast.expr]: Value of the constant. `None` if it could not be found or
+                no project index is enabled.
+        """
+        if self.project is None:
+            return None
+        qualified_name = self.qualified_name(expr)
+        if qualified_name is None or "." not in qualified_name:
+            return None
+        if qualified_name not in self._external:
+            self._external[qualified_name] = self.project.lookup_constant(
+                qualified_name, self.filename
+            )
+        return self._external[qualified_name]
+
+    def external_function(self, expr: ast.expr) -> Optional["JittedFunction"]:
+        """Get a jitted function imported from another module of the project.
+
+        Args:
+            expr (ast.expr): Name or attribute chain referring to the function.
+
+        Returns:
+            Optional[JittedFunction]: Function with its decorator options. `None` if it
+                could not be found or no project index is enabled.
+        """
+        if self.project is None:
+            return None
+        qualified_name = self.qualified_name(expr)
+        if qualified_name is None or "." not in qualified_name:
+            return None
+        if qualified_name not in self._external_functions:
+            self._external_functions[qualified_name] = self.project.lookup_function(
+                qualified_name, self.filename
+            )
+        return self._external_functions[qualified_name]
+
+    def _resolve_constant(self, name: str, resolver: "_Resolver") -> ast.expr:
+        if name not in self._resolved:
+            self._resolved[name] = resolver.visit(copy.deepcopy(self.constants[name]))
+        return self._resolved[name]
+
+
+class _Resolver(ast.NodeTransformer):
+    """Replace constants and numba aliases within an expression."""
+
+    def __init__(self, index: ModuleIndex) -> None:
+        self.index = index
+        self.stack: set[str] = set()
+        """Constants being resolved. Used to avoid infinite recursion."""
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:
+        if node.id in self.index.constants and node.id not in self.stack:
+            self.stack.add(node.id)
+            try:
+                return self.index._resolve_constant(node.id, self)  # noqa: SLF001
+            finally:
+                self.stack.remove(node.id)
+        return self._numba_attribute(node) or self.index.external_constant(node) or node
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.expr:
+        return (
+            self._numba_attribute(node)
+            or self.index.external_constant(node)
+            or self.generic_visit(node)  # type: ignore
+        )
+
+    def _numba_attribute(self, node: ast.expr) -> Optional[ast.expr]:
+        qualified_name = self.index.qualified_name(node)
+        if qualified_name is None or qualified_name.split(".", 1)[0] != "numba":
+            return None
+        for types_module in _NUMBA_TYPES_MODULES:
+            if qualified_name.startswith(types_module):
+                qualified_name = "numba." + qualified_name[len(types_module) :]
+        return ast.copy_location(ast.parse(qualified_name, mode="eval").body, node)
+
+
+def index_module(module: ast.Module, filename: str = "") -> ModuleIndex:
+    """Build the index of a module and link it to all functions defined within.
+
+    Args:
+        module (ast.Module): Module to be indexed.
+        filename (str, optional): Path of the file where the module is defined.
+
+    Returns:
+        ModuleIndex: Index of the module.
+    """
+    index = ModuleIndex(module, filename)
+    setattr(module, _INDEX_ATTRIBUTE, index)
+    for node in index.call_graph.scopes:
+        setattr(node, _INDEX_ATTRIBUTE, index)
+    return index
+
+
+def get_module_index(node: ast.AST) -> ModuleIndex:
+    """Get the index of the module where a node is defined.
+
+    Args:
+        node (ast.AST): Module or function linked by `index_module`.
+
+    Returns:
+        ModuleIndex: Index of the module. An empty index if the node was never linked.
+    """
+    index = getattr(node, _INDEX_ATTRIBUTE, None)
+    if index is None:
+        return _EMPTY_INDEX
+    return index  # type: ignore
+
+
+_EMPTY_INDEX: Final = ModuleIndex(ast.Module(body=[], type_ignores=[]))
+"""Index used for those nodes whose module is unknown."""
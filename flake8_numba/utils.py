@@ -1,10 +1,15 @@
 import ast
-from collections.abc import Iterable, Mapping, Sequence
+import fnmatch
+import os
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from functools import lru_cache
 from typing import Any, Literal, NamedTuple, Optional, Union, overload
 
 import numba  # noqa: F401
 
+from flake8_numba.callgraph import JIT_DECORATORS as JIT_DECORATORS
+from flake8_numba.symbols import get_module_index
+
 
 class Location(NamedTuple):
     """Define the location for a given error."""
@@ -13,6 +18,24 @@ class Location(NamedTuple):
     column: int = 0
 
 
+def get_decorator_name(decorator: ast.expr, node: ast.FunctionDef) -> str:
+    """Get the name of a decorator, resolving the aliases used to import it.
+
+    Args:
+        decorator (ast.expr): Decorator of the function, with or without arguments.
+        node (ast.FunctionDef): Node representing the function definition.
+
+    Returns:
+        str: Name of the decorator (e.g. `guvectorize` for `nb.guvectorize(...)`).
+            Empty string if it is not a name nor an attribute.
+    """
+    func = decorator.func if isinstance(decorator, ast.Call) else decorator
+    qualified_name = get_module_index(node).qualified_name(func)
+    if qualified_name is None:
+        return ""
+    return qualified_name.rsplit(".", 1)[-1]
+
+
 def get_decorator_location(
     decorator_names: Union[Iterable[str], str], node: ast.FunctionDef
 ) -> Optional[Location]:
@@ -31,19 +54,7 @@ def get_decorator_location(
     )
     if node.decorator_list:
         for decorator in node.decorator_list:
-            if isinstance(decorator, ast.Call):
-                name = (
-                    decorator.func.attr
-                    if isinstance(decorator.func, ast.Attribute)
-                    else decorator.func.id  # type: ignore
-                )
-            else:
-                name = (
-                    decorator.attr
-                    if isinstance(decorator, ast.Attribute)
-                    else decorator.id  # type: ignore
-                )
-            if name in decorator_names_:
+            if get_decorator_name(decorator, node) in decorator_names_:
                 return Location(decorator.lineno, decorator.col_offset)
 
     return None
@@ -66,19 +77,7 @@ def is_decorated_with(
     )
     if node.decorator_list:
         for decorator in node.decorator_list:
-            if isinstance(decorator, ast.Call):
-                name = (
-                    decorator.func.attr
-                    if isinstance(decorator.func, ast.Attribute)
-                    else decorator.func.id  # type: ignore
-                )
-            else:
-                name = (
-                    decorator.attr
-                    if isinstance(decorator, ast.Attribute)
-                    else decorator.id  # type: ignore
-                )
-            if name in decorator_names_:
+            if get_decorator_name(decorator, node) in decorator_names_:
                 return True
 
     return False
@@ -100,24 +99,76 @@ def has_return_value(func_ast: ast.FunctionDef) -> tuple[bool, Location]:
     return False, Location()
 
 
-def decorator_has_arguments(node: ast.FunctionDef) -> bool:
-    """Check whether a function has a decortor with arguments.
+def matches_path(filename: str, patterns: Iterable[str]) -> bool:
+    """Check whether a file is within any of the given directories or glob patterns.
 
     Args:
-        node (ast.FunctionDef): Node representing the function definition.
+        filename (str): Path of the file. Relative paths are relative to the current
+            working directory.
+        patterns (Iterable[str]): Directories (e.g. `src/services`) or glob patterns
+            (e.g. `src/*/kernels.py`), either relative or absolute.
 
     Returns:
-        bool: `True` if the function is decorated AND it uses arguments. `False`
-            otherwise.
+        bool: `True` if the file is within any directory or matches any pattern.
     """
-    if not node.decorator_list:
+    if not filename:
         return False
+    path = os.path.abspath(filename)
+    relative_path = os.path.relpath(path).replace(os.sep, "/")
+    for pattern in patterns:
+        if fnmatch.fnmatch(relative_path, pattern) or fnmatch.fnmatch(path, pattern):
+            return True
+        if path.startswith(os.path.join(os.path.abspath(pattern), "")):
+            return True
+    return False
+
+
+def walk_function_body(node: ast.FunctionDef) -> Iterator[ast.AST]:
+    """Iterate over all nodes of a function body, except those of nested functions.
+
+    Args:
+        node (ast.FunctionDef): Node representing the function definition.
+
+    Yields:
+        ast.AST: Nodes of the body, in source order.
+    """
+    pending: list[ast.AST] = list(reversed(node.body))
+    while pending:
+        child = pending.pop()
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            continue
+        yield child
+        pending.extend(reversed(list(ast.iter_child_nodes(child))))
 
+
+def get_numba_decorator(node: ast.FunctionDef) -> Optional[ast.expr]:
+    """Get the numba decorator of a function, wherever it is within the decorators.
+
+    Args:
+        node (ast.FunctionDef): Node representing the function definition.
+
+    Returns:
+        Optional[ast.expr]: First decorator that compiles the function with numba (e.g.
+            `@njit(...)`). None if the function is not compiled with numba.
+    """
     for decorator in node.decorator_list:
-        if isinstance(decorator, ast.Call) and decorator.args:
-            return True
+        if get_decorator_name(decorator, node) in JIT_DECORATORS:
+            return decorator
+    return None
 
-    return False
+
+def decorator_has_arguments(node: ast.FunctionDef) -> bool:
+    """Check whether a function has a numba decorator with arguments.
+
+    Args:
+        node (ast.FunctionDef): Node representing the function definition.
+
+    Returns:
+        bool: `True` if the function is decorated AND it uses arguments. `False`
+            otherwise.
+    """
+    decorator = get_numba_decorator(node)
+    return isinstance(decorator, ast.Call) and bool(decorator.args)
 
 
 @overload
@@ -136,7 +187,7 @@ def get_decorator_n_args(node: ast.FunctionDef, arg_type: Literal[""] = "") -> i
 
 
 def get_decorator_n_args(node: ast.FunctionDef, arg_type: str = "") -> int:
-    """Get number of arguments in decorator.
+    """Get number of arguments in the numba decorator.
 
     Args:
         node (ast.FunctionDef): Node representing the function definition.
@@ -146,21 +197,15 @@ def get_decorator_n_args(node: ast.FunctionDef, arg_type: str = "") -> int:
     Returns:
         int: Count of positional arguments for the decorator.
     """
-    if not node.decorator_list:
+    decorator = get_numba_decorator(node)
+    if not isinstance(decorator, ast.Call):
         return 0
 
     args_count: int = 0
-    for decorator in node.decorator_list:
-        if isinstance(decorator, ast.Call) and decorator.args:
-            if arg_type in ("args", ""):
-                for arg in decorator.args:
-                    if isinstance(arg, ast.AST):
-                        args_count += 1
-        if isinstance(decorator, ast.Call) and decorator.keywords:
-            if arg_type in ("kwargs", ""):
-                for keyword in decorator.keywords:
-                    if isinstance(keyword, ast.keyword):
-                        args_count += 1
+    if arg_type in ("args", ""):
+        args_count += len(decorator.args)
+    if arg_type in ("kwargs", ""):
+        args_count += len(decorator.keywords)
     return args_count
 
 
@@ -209,6 +254,8 @@ def is_str_safe(string: str) -> bool:
     """Returns `True` if the string representation is safe to be evaluated."""
     string = string.replace("numba.", "")
     string = string.replace("nb.", "")
+    # Contiguous layouts (e.g. `float32[::1]`)
+    string = string.replace("::1", "")
     keywords = set(_dct_custom_alias_to_standard_numba().keys())
     keywords.update("-", ">")
     separators = {"[", "]", " ", "(", ")", ",", '"', "'", ":"}
@@ -248,6 +295,16 @@ def get_numba_signature_info(signature: Any, *, mode: Literal["n_args", "args"])
     raise ValueError(f"Not recognized mode: {mode}")
 
 
+@lru_cache(maxsize=4096)
+def _evaluate_signature(string: str) -> Any:
+    """Evaluate a safe string representation of a signature.
+
+    Results are cached so that signatures repeated across functions or files (or
+    re-checked after an edit) are only built once by `numba`.
+    """
+    return eval(string)  # noqa: PGH001
+
+
 class ObjectRepr(NamedTuple):
     numba_signature: Optional[object]
     """Numba signature of the object. As a string if object is not safe."""
@@ -258,7 +315,10 @@ class ObjectRepr(NamedTuple):
 
 
 def get_pos_arg_from_decorator(at: int, node: ast.FunctionDef) -> ObjectRepr:
-    """Get the indicated positional argument.
+    """Get the indicated positional argument of the numba decorator.
+
+    Names assigned at module level (e.g. `SIGS = [...]`) and aliases of numba types
+    are resolved before the argument is evaluated.
 
     Args:
         at (int): Index of the positional argument
@@ -269,14 +329,14 @@ def get_pos_arg_from_decorator(at: int, node: ast.FunctionDef) -> ObjectRepr:
             could be evaluated (including `numba` library), string representation
             otherwise.
     """
-    if not node.decorator_list or not decorator_has_arguments(node):
-        return ObjectRepr(None, None, Location())
-
-    if at >= get_decorator_n_args(node, "args"):
+    decorator = get_numba_decorator(node)
+    if not isinstance(decorator, ast.Call) or at >= len(decorator.args):
         return ObjectRepr(None, None, Location())
 
-    arg = node.decorator_list[0].args[at]  # type: ignore
+    arg = decorator.args[at]
     location = Location(line=arg.lineno, column=arg.col_offset)
+    # Module-level constants and aliases are replaced by what they refer to
+    arg = get_module_index(node).resolve(arg)
     original_str = ast.unparse(arg)
     custom_to_standard = _dct_custom_alias_to_standard_numba()
     new_str = original_str
@@ -288,7 +348,11 @@ def get_pos_arg_from_decorator(at: int, node: ast.FunctionDef) -> ObjectRepr:
     while True:
         try:
             if is_str_safe(new_str):
-                return ObjectRepr(eval(new_str), arg, location)  # noqa: PGH001
+                evaluated = _evaluate_signature(new_str)
+                # Cached lists are shared, so each caller gets its own copy
+                if isinstance(evaluated, list):
+                    evaluated = list(evaluated)
+                return ObjectRepr(evaluated, arg, location)
             return ObjectRepr(original_str, arg, location)
         except NameError as name_error:
             not_found_variable_name = name_error.args[0].split()[1].strip("'")
@@ -4,43 +4,108 @@ This logic is in charge of executing specific code whenever some specific nodes
 the code are detected.
 """
 import ast
+from functools import lru_cache
 
 from flake8_numba import Error, Rule
 
+# To perform init_subclass. Not imported by the package, so that its pytest plugin does
+# not import numba
+from flake8_numba import rules as rules
+from flake8_numba.symbols import index_module
+
+
+@lru_cache
+def _rule_plan(n_rules: int) -> tuple[Rule, ...]:
+    """Sort the first `n_rules` rules so that dependencies are always checked first.
+
+    Args:
+        n_rules (int): Number of rules registered so far. Used as cache key so that the
+            plan is rebuilt whenever a new rule is registered.
+
+    Returns:
+        tuple[Rule, ...]: Rules in the order they have to be checked.
+    """
+    rules_by_type = {type(rule): rule for rule in Rule.all_rules[:n_rules]}
+    plan: list[Rule] = []
+    visited: set[type[Rule]] = set()
+
+    def add(rule_type: type[Rule]) -> None:
+        if rule_type in visited or rule_type not in rules_by_type:
+            return
+        visited.add(rule_type)
+        for dependency in sorted(rules_by_type[rule_type].depends_on, key=str):
+            add(dependency)
+        plan.append(rules_by_type[rule_type])
+
+    for rule_type in rules_by_type:
+        add(rule_type)
+    return tuple(plan)
+
+
+def get_rule_plan() -> tuple[Rule, ...]:
+    """Get all registered rules sorted so that dependencies are checked first.
+
+    The plan is computed once and reused for every function that is checked.
+
+    Returns:
+        tuple[Rule, ...]: Rules in the order they have to be checked.
+    """
+    return _rule_plan(len(Rule.all_rules))
+
+
+def check_function(node: ast.FunctionDef) -> list[Error]:
+    """Check all rules over a single function definition.
+
+    A rule is skipped if any of the rules it depends on was raised.
+
+    Args:
+        node (ast.FunctionDef): Node containing all the information relative to the
+            function definition.
+
+    Returns:
+        list[Error]: Errors found for the given function.
+    """
+    errors: list[Error] = []
+    raised: set[type[Rule]] = set()
+    for rule in get_rule_plan():
+        if raised & rule.depends_on:
+            continue
+        # Rules are appended internally within .check
+        if not rule.check(node, errors):
+            raised.add(type(rule))
+    return errors
+
 
 class Visitor(ast.NodeVisitor):
     """Visitor class in charge of parsing one entire file."""
 
-    def __init__(self) -> None:
-        """Insantiate a list of empty errors just after being declared."""
+    def __init__(self, filename: str = "") -> None:
+        """Insantiate a list of empty errors just after being declared.
+
+        Args:
+            filename (str, optional): Path of the file being parsed.
+        """
         self.errors: list[Error] = []
-        self.pending_rules: set[Rule] = set(Rule.all_rules)
-        self.rules_raised: set[type[Rule]] = set()
+        self.filename = filename
+        self.findings: dict[ast.FunctionDef, list[Error]] = {}
+        """Errors found in each function definition, in the order they were visited."""
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
+    def visit_Module(self, node: ast.Module) -> None:
+        """Called once per file, before any function is visited.
+
+        Args:
+            node (ast.Module): Node representing the whole file.
+        """
+        index_module(node, self.filename)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Called whenever a function definition is found.
 
         Args:
             node (ast.FunctionDef): Node containing all the information relative to
                 the function definition.
         """
-        for rule in Rule.all_rules:
-            self.process_rule(rule, node)
+        self.findings[node] = check_function(node)
+        self.errors.extend(self.findings[node])
         self.generic_visit(node)
-
-    def process_rule(self, rule: Rule, node: ast.FunctionDef) -> None:
-        # Process dependencies
-        if rule.depends_on:
-            for pre_rule in rule.depends_on:
-                self.process_rule(pre_rule(), node)
-        # Process rules with dependencies solved
-        if rule in self.pending_rules:
-            # Skip if the rule that depends on was already raised.
-            if self.rules_raised & rule.depends_on:
-                self.pending_rules.remove(rule)
-                return
-            # Rules are appended internally within .check
-            is_ok = rule.check(node, self.errors)
-            if not is_ok:
-                self.rules_raised.add(type(rule))
-            self.pending_rules.remove(rule)
@@ -0,0 +1,230 @@
+"""Manifest of the jitted functions of a project, used to warm up the numba cache.
+
+Functions are compiled lazily the first time they are called, which services pay for at
+startup. This module lists statically all jitted functions defined at the top level of
+the modules of a project, with the signatures given to their decorators and their
+`cache`, `parallel` and `nogil` options. It writes them to a JSON manifest together with
+a standalone warm-up script, which imports the modules and compiles the functions in a
+process pool so that deployment images can pre-populate the numba cache:
+
+```
+python -m flake8_numba.warmup [ROOT] [--manifest PATH] [--script PATH]
+python numba_warmup.py [--workers N]
+```
+
+Signatures are stored as the Python source of the decorator argument, with module
+constants resolved, and are evaluated by the script within the module of the function.
+Functions without signatures can not be compiled ahead of time; they are listed with an
+empty list, which can be filled in by hand (e.g. `"'float64(float64)'"`). Only functions
+with `cache=True` are warmed up, since compilations are lost otherwise when the workers
+exit.
+"""
+import argparse
+import ast
+import json
+import os
+from collections.abc import Sequence
+from typing import Any, Final, NamedTuple, Optional
+
+from flake8_numba.callgraph import FunctionInfo
+from flake8_numba.project_index import iter_python_files, module_name
+from flake8_numba.symbols import ModuleIndex
+
+MANIFEST_VERSION: Final = 1
+"""Version of the format of the manifest."""
+DEFAULT_MANIFEST: Final = "numba_manifest.json"
+"""Name of the manifest written if no path is given."""
+DEFAULT_SCRIPT: Final = "numba_warmup.py"
+"""Name of the warm-up script written if no path is given."""
+
+_SCRIPT_TEMPLATE: Final = '''"""Pre-populate the numba cache with a manifest.
+
+Generated by `python -m flake8_numba.warmup`.
+Usage: python SCRIPT [MANIFEST] [--workers N]
+"""
+import argparse
+import importlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), MANIFEST_NAME)
+LAZY_DECORATORS = ("jit", "njit")
+
+
+class Namespace(dict):
+    """Names of a module, falling back to top-level packages (e.g. `numba`)."""
+
+    def __missing__(self, name):
+        return importlib.import_module(name)
+
+
+def warm_up(module_name, functions):
+    """Import a module and compile the signatures of its cached functions."""
+    module = importlib.import_module(module_name)
+    compiled, errors = 0, []
+    for function in functions:
+        # Signatures given to the decorator are compiled when the module is imported
+        if function["eager"] or function["decorator"] not in LAZY_DECORATORS:
+            compiled += len(function["signatures"])
+            continue
+        dispatcher = getattr(module, function["name"])
+        for source in function["signatures"]:
+            try:
+                dispatcher.compile(eval(source, {}, Namespace(vars(module))))
+                compiled += 1
+            except Exception as error:
+                errors.append(f"{module_name}.{function['name']}{source}: {error}")
+    return compiled, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("manifest", nargs="?", default=MANIFEST)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    with open(args.manifest, encoding="utf-8") as f:
+        functions = json.load(f)["functions"]
+
+    by_module = {}
+    for function in functions:
+        if function["cache"] and function["signatures"]:
+            by_module.setdefault(function["module"], []).append(function)
+    with ProcessPoolExecutor(args.workers) as executor:
+        results = executor.map(warm_up, by_module, by_module.values())
+        total, errors = 0, []
+        for compiled, module_errors in results:
+            total += compiled
+            errors.extend(module_errors)
+    for error in errors:
+        print(error, file=sys.stderr)
+    print(f"{total} signature(s) compiled from {len(by_module)} module(s).")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
+'''
+"""Source of the warm-up script. `SCRIPT` and `MANIFEST_NAME` are replaced by the
+name of the script and the path to the manifest relative to it."""
+
+
+class ManifestEntry(NamedTuple):
+    """Jitted function listed in the manifest."""
+
+    module: str
+    """Module where the function is defined."""
+    name: str
+    """Name of the function."""
+    decorator: str
+    """Decorator used to compile it (e.g. `njit`)."""
+    signatures: tuple[str, ...]
+    """Python source of each signature given to the decorator."""
+    eager: bool
+    """Whether the signatures are given to the decorator, so that they are compiled as
+    soon as the module is imported."""
+    cache: Optional[bool]
+    """Value of the `cache` option. `None` if it can not be known statically."""
+    parallel: Optional[bool]
+    """Value of the `parallel` option. `None` if it can not be known statically."""
+    nogil: Optional[bool]
+    """Value of the `nogil` option. `None` if it can not be known statically."""
+    file: str
+    """File where the function is defined, relative to the root of the project."""
+    line: int
+    """Line where the function is defined."""
+
+
+def get_signatures(function: FunctionInfo) -> tuple[str, ...]:
+    """Get the source of the signatures given to the decorator of a function."""
+    if not function.args:
+        return ()
+    first = function.args[0]
+    signatures = first.elts if isinstance(first, (ast.List, ast.Tuple)) else [first]
+    return tuple(ast.unparse(signature) for signature in signatures)
+
+
+def collect_manifest(root: str = ".") -> list[ManifestEntry]:
+    """List the jitted functions defined at the top level of all modules of a project.
+
+    Args:
+        root (str, optional): Root of the project, from where modules are imported.
+
+    Returns:
+        list[ManifestEntry]: Jitted functions, sorted by module and in source order.
+    """
+    entries: list[ManifestEntry] = []
+    for path in sorted(iter_python_files(root)):
+        with open(path, encoding="utf-8") as f:
+            try:
+                module = ast.parse(f.read())
+            except (SyntaxError, ValueError):
+                continue
+        index = ModuleIndex(module)
+        for function in index.call_graph.functions.values():
+            if not function.is_jitted or function.node not in module.body:
+                continue
+            signatures = get_signatures(function)
+            options = {
+                name: function.option(name, None if name in function.options else False)
+                for name in ("cache", "parallel", "nogil")
+            }
+            entries.append(
+                ManifestEntry(
+                    module=module_name(path, root),
+                    name=function.name,
+                    decorator=function.decorator,
+                    signatures=signatures,
+                    eager=bool(signatures),
+                    file=os.path.relpath(path, root).replace(os.sep, "/"),
+                    line=function.node.lineno,
+                    **options,
+                )
+            )
+    return entries
+
+
+def write_manifest(
+    entries: Sequence[ManifestEntry], manifest_path: str, script_path: str = ""
+) -> None:
+    """Write the manifest and, optionally, the warm-up script that reads it.
+
+    Args:
+        entries (Sequence[ManifestEntry]): Functions listed in the manifest.
+        manifest_path (str): Path to the JSON manifest.
+        script_path (str, optional): Path to the warm-up script. Not written if empty.
+            It looks for the manifest relative to its own location.
+    """
+    data: dict[str, Any] = {
+        "version": MANIFEST_VERSION,
+        "functions": [entry._asdict() for entry in entries],
+    }
+    os.makedirs(os.path.dirname(manifest_path) or ".", exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    if script_path:
+        relative_path = os.path.relpath(
+            os.path.abspath(manifest_path), os.path.dirname(os.path.abspath(script_path))
+        )
+        script = _SCRIPT_TEMPLATE.replace("SCRIPT", os.path.basename(script_path))
+        with open(script_path, "w", encoding="utf-8") as f:
+            f.write(script.replace("MANIFEST_NAME", repr(relative_path)))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Write the manifest and warm-up script of a project from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root", nargs="?", default=".", help="Root of the project.")
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST, help="JSON manifest.")
+    parser.add_argument("--script", default=DEFAULT_SCRIPT, help="Warm-up script.")
+    args = parser.parse_args(argv)
+    entries = collect_manifest(args.root)
+    write_manifest(entries, args.manifest, args.script)
+    n_cached = sum(bool(entry.cache and entry.signatures) for entry in entries)
+    print(f"{len(entries)} jitted function(s) listed, {n_cached} to be warmed up.")
+
+
+if __name__ == "__main__":
+    main()
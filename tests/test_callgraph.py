@@ -0,0 +1,136 @@
+import ast
+
+import pytest
+
+from flake8_numba.callgraph import CallGraph
+from flake8_numba.symbols import get_module_index, index_module
+
+CODE = """
+import numba as nb
+from numba import njit, prange
+from .kernels import external
+
+PARALLEL = True
+
+
+@njit(parallel=PARALLEL, cache=True)
+def kernel(x):
+    return helper(x) + external(x)
+
+
+@nb.njit
+def helper(x):
+    return x
+
+
+def driver(x):
+    def inner(y):
+        return kernel(y)
+
+    return inner(x) + helper(x)
+
+
+class Model:
+    @nb.vectorize(["float64(float64)"], nopython=flag)
+    def method(self, x):
+        return driver(x)
+
+
+result = kernel(1)
+callback = lambda x: kernel(x)
+"""
+
+
+class TestCallGraph:
+    """Test class CallGraph."""
+
+    @pytest.fixture
+    def graph(self) -> CallGraph:
+        """Call graph of the code sample."""
+        return index_module(ast.parse(CODE)).call_graph
+
+    def test_functions(self, graph: CallGraph) -> None:
+        """Test that all functions are recorded with their numba decorator."""
+        decorators = {name: f.decorator for name, f in graph.functions.items()}
+        assert decorators == {
+            "kernel": "njit",
+            "helper": "njit",
+            "driver": "",
+            "driver.inner": "",
+            "Model.method": "vectorize",
+        }
+
+    def test_options(self, graph: CallGraph) -> None:
+        """Test that decorator options are resolved when possible."""
+        kernel, method = graph.functions["kernel"], graph.functions["Model.method"]
+        assert kernel.option("parallel") is True
+        assert kernel.option("cache") is True
+        assert kernel.option("nogil", False) is False
+        assert method.option("nopython", "unknown") == "unknown"
+        assert [ast.unparse(arg) for arg in method.args] == ["['float64(float64)']"]
+
+    def test_calls(self, graph: CallGraph) -> None:
+        """Test that calls are linked to their caller and callee."""
+        edges = {
+            (call.caller.name if call.caller else None, call.callee_name)
+            for call in graph.calls
+            if call.callee is not None
+        }
+        assert edges == {
+            ("kernel", "helper"),
+            ("driver.inner", "kernel"),
+            ("driver", "inner"),
+            ("driver", "helper"),
+            ("Model.method", "driver"),
+            (None, "kernel"),
+        }
+        external = next(c for c in graph.calls if c.callee_name == ".kernels.external")
+        assert external.callee is None
+
+    def test_queries(self, graph: CallGraph) -> None:
+        """Test the queries over callers and callees."""
+        kernel = graph.functions["kernel"]
+        callers = [
+            call.caller.name if call.caller else None for call in graph.callers(kernel)
+        ]
+        assert callers == ["driver.inner", None, None]
+        assert [call.callee_name for call in graph.callees(kernel)] == [
+            "helper",
+            ".kernels.external",
+        ]
+        from_python = [call.callee_name for call in graph.calls_from_python()]
+        assert from_python == ["kernel", "helper", "kernel", "kernel"]
+
+    def test_class_scopes(self) -> None:
+        """Test that class bodies are not enclosing scopes of their methods."""
+        code = (
+            "def helper(x):\n    return x\n\n"
+            "class Model:\n"
+            "    def helper(self, x):\n        return x\n\n"
+            "    def method(self, x):\n        return helper(x)\n\n"
+            "    value = helper(None, 1)\n"
+        )
+        graph = index_module(ast.parse(code)).call_graph
+        callees = {
+            call.caller.name if call.caller else None: call.callee.name
+            for call in graph.calls
+            if call.callee is not None
+        }
+        assert callees == {"Model.method": "helper", None: "Model.helper"}
+
+    def test_call_site(self, graph: CallGraph) -> None:
+        """Test that calls are looked up by their node."""
+        for call in graph.calls:
+            assert graph.call_site(call.node) is call
+        assert graph.call_site(graph.module) is None
+
+    def test_function_of(self) -> None:
+        """Test that functions and lambdas are linked to the index of the module."""
+        module = ast.parse(CODE)
+        index = index_module(module)
+        kernel = module.body[4]
+        assert (
+            index.call_graph.function_of(kernel) is index.call_graph.functions["kernel"]
+        )
+        lambda_node = next(n for n in ast.walk(module) if isinstance(n, ast.Lambda))
+        assert get_module_index(lambda_node) is index
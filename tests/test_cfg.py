@@ -0,0 +1,92 @@
+import ast
+import sys
+
+import pytest
+
+from flake8_numba.cfg import get_cfg
+
+
+def _function(code: str) -> ast.FunctionDef:
+    node = ast.parse(code).body[0]
+    assert isinstance(node, ast.FunctionDef)
+    return node
+
+
+def _is_return(statement: ast.stmt) -> bool:
+    return isinstance(statement, ast.Return)
+
+
+class TestControlFlowGraph:
+    """Test class ControlFlowGraph."""
+
+    @pytest.mark.parametrize(
+        "code, expected",
+        [
+            ("def f(x):\n    return x", True),
+            ("def f(x):\n    x = 1", False),
+            ("def f(x):\n    if x:\n        return x", False),
+            (
+                "def f(x):\n    if x:\n        return x\n    else:\n        return 0",
+                True,
+            ),
+            ("def f(x):\n    for i in x:\n        return i", False),
+            ("def f(x):\n    for i in x:\n        return i\n    return 0", True),
+            ("def f(x):\n    while True:\n        return x", True),
+            ("def f(x):\n    while True:\n        break\n    x = 1", False),
+            (
+                (
+                    "def f(x):\n    try:\n        return x\n    except ValueError:\n"
+                    "        pass"
+                ),
+                False,
+            ),
+            (
+                (
+                    "def f(x):\n    try:\n        return x\n    except ValueError:\n"
+                    "        return 0"
+                ),
+                True,
+            ),
+            ("def f(x):\n    if x:\n        raise ValueError\n    return x", True),
+            ("def f(x):\n    with x:\n        return x", True),
+        ],
+    )
+    def test_on_all_paths(self, code: str, expected: bool) -> None:
+        """Test that a condition is only met if every path goes through it."""
+        assert get_cfg(_function(code)).on_all_paths(_is_return) == expected
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="`match` requires 3.10")
+    @pytest.mark.parametrize(
+        "case, expected",
+        [
+            ("case _:", True),
+            ("case y:", True),
+            ("case _ if x > 2:", False),
+            ("case 2:", False),
+        ],
+    )
+    def test_match(self, case: str, expected: bool) -> None:
+        """Test that a `match` only falls through if its last case is not irrefutable."""
+        code = (
+            "def f(x):\n    match x:\n        case 1:\n            return 1\n"
+            f"        {case}\n            return 2"
+        )
+        assert get_cfg(_function(code)).on_all_paths(_is_return) == expected
+
+    def test_dead_code(self) -> None:
+        """Test that statements after a return are not reachable."""
+        node = _function(
+            "def f(x):\n    for i in x:\n        continue\n        x = 1\n    return x"
+        )
+        cfg = get_cfg(node)
+        loop = node.body[0]
+        assert isinstance(loop, ast.For)
+        assert cfg.is_reachable(loop.body[0])
+        assert not cfg.is_reachable(loop.body[1])
+        assert cfg.is_reachable(node.body[1])
+        assert not cfg.on_any_path(lambda statement: isinstance(statement, ast.Assign))
+
+    def test_memoized(self) -> None:
+        """Test that the graph is only built once per function."""
+        node = _function("def f(x):\n    return x")
+        assert get_cfg(node) is get_cfg(node)
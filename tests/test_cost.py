@@ -0,0 +1,180 @@
+import ast
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from flake8_numba.cost import (
+    ALLOCATION_WEIGHT,
+    DEFAULT_TRIP_COUNT,
+    TRANSCENDENTAL_WEIGHT,
+    CostEstimate,
+    estimate_function,
+    estimate_module,
+    read_report,
+    ReportBuffer,
+    update_report,
+)
+from flake8_numba.symbols import index_module
+
+CODE = """
+import math
+import numpy as np
+from numba import njit, float64
+
+
+@njit
+def scalar(x):
+    return x + 1
+
+
+@njit
+def fixed_loop(a):
+    acc = 0.0
+    for i in range(10):
+        acc += math.exp(a[i])
+    return acc
+
+
+@njit([float64[:](float64[:])])
+def nested_loops(a):
+    out = np.empty_like(a)
+    for i in range(a.shape[0]):
+        for j in range(4):
+            tmp = np.zeros(3)
+            out[i] = tmp[0] / 2
+    return out
+
+
+def not_jitted(x):
+    return x
+"""
+
+
+@pytest.fixture
+def module() -> ast.Module:
+    """Module of the code sample, linked to its index."""
+    module = ast.parse(CODE)
+    index_module(module, "module.py")
+    return module
+
+
+def _estimates(module: ast.Module) -> dict[str, CostEstimate]:
+    return {estimate.function: estimate for estimate in estimate_module(module)}
+
+
+class TestEstimate:
+    """Test functions `estimate_function` and `estimate_module`."""
+
+    def test_only_jitted_functions(self, module: ast.Module) -> None:
+        """Test that functions without numba decorators are not estimated."""
+        assert list(_estimates(module)) == ["scalar", "fixed_loop", "nested_loops"]
+
+    def test_scalar(self, module: ast.Module) -> None:
+        """Test a function without loops."""
+        estimate = _estimates(module)["scalar"]
+        assert estimate.work == 1
+        assert estimate.loop_depth == 0
+        assert estimate.operations_per_level == (1,)
+        assert (estimate.file, estimate.line, estimate.decorator) == (
+            "module.py",
+            8,
+            "njit",
+        )
+
+    def test_fixed_loop(self, module: ast.Module) -> None:
+        """Test that constant trip counts multiply the cost of the loop body."""
+        estimate = _estimates(module)["fixed_loop"]
+        assert estimate.transcendentals == 10
+        assert estimate.allocations == 0
+        assert estimate.loop_depth == 1
+        # Addition, subscript and exponential
+        assert estimate.operations_per_level == (0, 2 + TRANSCENDENTAL_WEIGHT)
+        assert estimate.work == 10 * (2 + TRANSCENDENTAL_WEIGHT)
+
+    def test_nested_loops(self, module: ast.Module) -> None:
+        """Test that allocations within nested loops are multiplied by all loops."""
+        estimate = _estimates(module)["nested_loops"]
+        assert estimate.loop_depth == 2
+        assert estimate.allocations == 1 + 4 * DEFAULT_TRIP_COUNT
+        assert estimate.operations_per_level[2] > ALLOCATION_WEIGHT
+        assert estimate.work > estimate.operations_per_level[2] * 4 * DEFAULT_TRIP_COUNT
+
+    def test_estimate_function(self) -> None:
+        """Test that nested functions are not taken into account."""
+        code = "def f(x):\n    def g(y):\n        return y + 1\n    return x * 2"
+        estimate = estimate_function(ast.parse(code).body[0])  # type: ignore
+        assert estimate.work == 1
+        assert estimate.function == "f"
+
+
+class TestReport:
+    """Test functions `update_report` and `read_report`."""
+
+    @pytest.mark.parametrize("extension", [".json", ".csv"])
+    def test_update_report(
+        self, module: ast.Module, tmp_path: Path, extension: str
+    ) -> None:
+        """Test that rows are merged per file and sorted by work."""
+        path = str(tmp_path / f"report{extension}")
+        estimates = estimate_module(module)
+        update_report(path, {"module.py": estimates})
+        update_report(path, {"other.py": [estimates[0]._replace(file="other.py")]})
+        update_report(path, {"module.py": estimates[:2]})
+
+        rows = read_report(path)
+        assert [(row["file"], row["function"]) for row in rows] == [
+            ("module.py", "fixed_loop"),
+            ("module.py", "scalar"),
+            ("other.py", "scalar"),
+        ]
+        assert rows[0] == estimates[1].as_row()
+        assert not os.path.exists(f"{path}.lock")
+
+    def test_stale_lock(self, module: ast.Module, tmp_path: Path) -> None:
+        """Test that locks left behind by killed processes are broken."""
+        path = str(tmp_path / "report.json")
+        Path(f"{path}.lock").touch()
+        os.utime(f"{path}.lock", (0, 0))
+        update_report(path, {"module.py": estimate_module(module)})
+        assert len(read_report(path)) == 3
+        assert not os.path.exists(f"{path}.lock")
+
+    def test_buffer(self, module: ast.Module, tmp_path: Path) -> None:
+        """Test that estimates are only written when the buffer is flushed."""
+        path = str(tmp_path / "report.json")
+        buffer = ReportBuffer(path)
+        buffer.add("module.py", estimate_module(module))
+        buffer.add("other.py", [])
+        assert not os.path.exists(path)
+        buffer.flush()
+        assert len(read_report(path)) == 3
+        buffer.flush()
+        assert len(read_report(path)) == 3
+
+    def test_read_missing_report(self, tmp_path: Path) -> None:
+        """Test that a missing report has no rows."""
+        assert read_report(str(tmp_path / "report.json")) == []
+
+
+def test_cost_report_option(tmp_path: Path) -> None:
+    """Test that Flake8 writes the report when the option is given."""
+    (tmp_path / "module.py").write_text(CODE)
+    (tmp_path / "other.py").write_text(CODE)
+    report = tmp_path / "report.json"
+    # Files checked in several processes
+    subprocess.run(
+        [sys.executable, "-m", "flake8", "--numba-cost-report", str(report), "-j", "2"],
+        cwd=tmp_path,
+        check=False,
+    )
+    with open(report) as f:
+        rows = json.load(f)
+    assert [(row["file"], row["function"]) for row in rows] == [
+        (os.path.join(".", file), function)
+        for function in ("nested_loops", "fixed_loop", "scalar")
+        for file in ("module.py", "other.py")
+    ]
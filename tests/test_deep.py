@@ -0,0 +1,204 @@
+import ast
+import os
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from flake8_numba.deep import (
+    DeepCompiler,
+    DeepResult,
+    build_snippet,
+    compile_snippet,
+    get_deep_result,
+)
+from flake8_numba.symbols import index_module
+
+CODE = """
+import numba as nb
+import numpy as np
+from numba import njit
+
+from .other import relative
+
+SIGNATURE = nb.float64(nb.float64[::1])
+DATA = np.load("data.npy")
+UNUSED = 1
+
+
+@njit(SIGNATURE)
+def kernel(a):
+    return helper(a)
+
+
+@njit
+def helper(a):
+    return np.sum(a)
+
+
+@njit(SIGNATURE)
+def with_data(a):
+    return a[0] + DATA[0]
+
+
+@njit(SIGNATURE)
+def with_relative(a):
+    return relative(a)
+
+
+class Model:
+    @njit(SIGNATURE)
+    def method(a):
+        return a[0]
+"""
+
+
+@pytest.fixture
+def workers(monkeypatch: pytest.MonkeyPatch) -> list[subprocess.Popen[str]]:
+    """Worker processes started by the tests."""
+    started: list[subprocess.Popen[str]] = []
+    popen = subprocess.Popen
+
+    def start(*args: Any, **kwargs: Any) -> subprocess.Popen[str]:
+        started.append(popen(*args, **kwargs))
+        return started[-1]
+
+    monkeypatch.setattr(subprocess, "Popen", start)
+    return started
+
+
+@pytest.fixture
+def module() -> ast.Module:
+    """Indexed module of the code sample."""
+    module = ast.parse(CODE)
+    index_module(module)
+    return module
+
+
+def _snippet(module: ast.Module, name: str) -> Any:
+    index = index_module(module)
+    return build_snippet(index.call_graph.functions[name], index)
+
+
+def test_build_snippet(module: ast.Module) -> None:
+    """Test that only the reproducible statements needed are kept, in order."""
+    assert _snippet(module, "kernel") == (
+        "import numba as nb\n"
+        "import numpy as np\n"
+        "from numba import njit\n"
+        "SIGNATURE = nb.float64(nb.float64[::1])\n"
+        "@njit\n"
+        "def helper(a):\n"
+        "    return np.sum(a)\n"
+        "@njit(SIGNATURE)\n"
+        "def kernel(a):\n"
+        "    return helper(a)"
+    )
+    assert _snippet(module, "with_data") is None
+    assert _snippet(module, "with_relative") is None
+
+
+class TestCompileSnippet:
+    """Test function `compile_snippet`."""
+
+    def test_ok(self, module: ast.Module) -> None:
+        """Test that the function is compiled together with its dependencies."""
+        snippet = _snippet(module, "kernel")
+        assert compile_snippet(snippet, "kernel") == DeepResult("ok", "", ())
+
+    def test_error(self) -> None:
+        """Test that typing errors are described by their most relevant line."""
+        source = "import numba\n@numba.njit('int64(int64[:])')\ndef f(a):\n    return a.x"
+        assert compile_snippet(source, "f") == DeepResult(
+            "error", "Unknown attribute 'x' of type array(int64, 1d, A)", ()
+        )
+
+    def test_object_mode(self) -> None:
+        """Test that signatures compiled in object mode are reported."""
+        source = (
+            "import numba\n"
+            "@numba.jit('int64(int64)', forceobj=True)\n"
+            "def f(a):\n"
+            "    return a"
+        )
+        assert compile_snippet(source, "f") == DeepResult("ok", "", ("(int64)",))
+
+    def test_skipped(self) -> None:
+        """Test that errors unrelated to numba are not reported as errors."""
+        assert compile_snippet("import missing\ndef f(a):\n    pass", "f").status == (
+            "skipped"
+        )
+        assert compile_snippet("def f(a):\n    pass\nf()", "f").status == "skipped"
+
+
+class TestDeepCompiler:
+    """Test class `DeepCompiler`."""
+
+    SOURCE = "import numba\n@numba.njit('int64(int64)')\ndef f(a):\n    return a.x"
+
+    def test_cache(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that results are cached on disk, so workers only run once."""
+        compiler = DeepCompiler(str(tmp_path))
+        result = compiler.submit(self.SOURCE, "f").result()
+        assert result.status == "error"
+        assert len(os.listdir(tmp_path)) == 1
+
+        def fail(*_args: Any, **_kwargs: Any) -> None:
+            raise AssertionError("Worker started")
+
+        monkeypatch.setattr(subprocess, "Popen", fail)
+        assert compiler.compile(self.SOURCE, "f") == result
+        assert DeepCompiler(str(tmp_path)).compile(self.SOURCE, "f") == result
+
+    def test_timeout(self, tmp_path: Path) -> None:
+        """Test that workers are killed after the timeout."""
+        compiler = DeepCompiler(str(tmp_path), timeout=0.01)
+        assert compiler.compile(self.SOURCE, "f").status == "timeout"
+
+    def test_workers_are_reused(
+        self, tmp_path: Path, workers: list[subprocess.Popen[str]]
+    ) -> None:
+        """Test that the same worker compiles several snippets until it is closed."""
+        compiler = DeepCompiler(str(tmp_path))
+        assert compiler.compile(self.SOURCE, "f").status == "error"
+        source = "import numba\nprint('no newline', end='')\n" + self.SOURCE
+        assert compiler.compile(source, "f").status == "error"
+        assert len(workers) == 1
+        assert workers[0].poll() is None
+
+        compiler.close()
+        assert workers[0].returncode == 0
+
+    def test_crash(self, tmp_path: Path, workers: list[subprocess.Popen[str]]) -> None:
+        """Test that crashed workers are replaced and their results are not cached."""
+        compiler = DeepCompiler(str(tmp_path))
+        assert compiler.compile(self.SOURCE, "f").status == "error"
+        source = "import os\nos.write(2, b'crashed')\nos._exit(1)\ndef f(a):\n    pass"
+        assert compiler.compile(source, "f") == DeepResult("skipped", "crashed", ())
+        assert len(os.listdir(tmp_path)) == 1
+        assert compiler.compile(self.SOURCE.replace("a.x", "a.y"), "f").status == "error"
+        assert [worker.returncode for worker in workers] == [1, None]
+        compiler.close()
+
+
+def test_get_deep_result(module: ast.Module, tmp_path: Path) -> None:
+    """Test that only top-level functions with eager signatures are compiled."""
+    assert get_deep_result(module.body[5]) is None  # type: ignore
+    DeepCompiler.active = DeepCompiler(str(tmp_path))
+    try:
+        results = [
+            get_deep_result(statement)
+            for statement in module.body
+            if isinstance(statement, ast.FunctionDef)
+        ]
+        method = module.body[-1].body[0]  # type: ignore
+        assert get_deep_result(method) is None
+    finally:
+        DeepCompiler.active = None
+    assert [result.status if result else None for result in results] == [
+        "ok",
+        None,
+        None,
+        None,
+    ]
@@ -0,0 +1,151 @@
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from flake8_numba.fix import FIXES, Edit, fix_file, fix_source, main
+
+CODE = """import numba as nb
+from numba import float64, guvectorize, jit, njit
+
+
+@njit
+def bare(x):
+    return x
+
+
+@njit()
+def empty(x):
+    return x
+
+
+@nb.njit(
+    ["float64(float64[:])", "float64(float64[::1])", float64(float64[:, :])],  # Kernel
+    fastmath=True,
+)
+def kernel(a):
+    def inner(y):
+        return y
+
+    return inner(a[0])
+
+
+@jit("void(float64[:])", forceobj=True, cache=False)
+def objmode(a):
+    pass
+
+
+@guvectorize(["void(float64[:], float64[:])"], "(n)->(n)")
+def gufunc(a, out):
+    out[:] = a
+
+
+def plain(a):
+    return a[:]
+"""
+
+FIXED = """import numba as nb
+from numba import float64, guvectorize, jit, njit
+
+
+@njit(cache=True, nogil=True)
+def bare(x):
+    return x
+
+
+@njit(cache=True, nogil=True)
+def empty(x):
+    return x
+
+
+@nb.njit(
+    ["float64(float64[::1])", float64(float64[:, ::1])],  # Kernel
+    fastmath=True, cache=True, nogil=True,
+)
+def kernel(a):
+    def inner(y):
+        return y
+
+    return inner(a[0])
+
+
+@jit("void(float64[::1])", forceobj=True, cache=False)
+def objmode(a):
+    pass
+
+
+@guvectorize(["void(float64[:], float64[:])"], "(n)->(n)", cache=True)
+def gufunc(a, out):
+    out[:] = a
+
+
+def plain(a):
+    return a[:]
+"""
+
+
+def test_fix_source() -> None:
+    """Test that all fixes are applied at once, preserving the rest of the source."""
+    assert fix_source(CODE, FIXES) == FIXED
+
+
+def test_idempotent() -> None:
+    """Test that fixed sources are not changed again."""
+    assert fix_source(FIXED, FIXES) == FIXED
+
+
+def test_default_fixes() -> None:
+    """Test that layouts are not changed by default, but duplicates still are."""
+    code = (
+        '@njit(["f8(f8[:])", "f8( f8[:] )"], cache=True, nogil=True)\ndef f(a):\n    pass'
+    )
+    assert (
+        fix_source(code)
+        == '@njit(["f8(f8[:])"], cache=True, nogil=True)\ndef f(a):\n    pass'
+    )
+
+
+def test_nested_functions() -> None:
+    """Test that caching is only added to top-level functions."""
+    code = "def f():\n    @njit\n    def g(a):\n        pass\n    return g"
+    assert fix_source(code, ["cache"]) == code
+
+
+def test_unpacked_options() -> None:
+    """Test that options are not added to decorators given `**kwargs`."""
+    code = 'OPTS = dict(cache=True)\n\n@njit(["f8(f8[:])"], **OPTS)\ndef f(a):\n    pass'
+    assert fix_source(code, FIXES) == code.replace("f8[:]", "f8[::1]")
+
+
+@pytest.mark.parametrize("line", ["\x0c", "# Comment with \u2028 and \x85"])
+def test_line_breaks(line: str) -> None:
+    """Test that only Python line breaks are used to locate the decorators."""
+    code = f"import numba\n{line}\n@njit('f8(f8)')\ndef f(a):\n    return a\n"
+    assert fix_source(code, ["cache"]) == code.replace("(f8)'", "(f8)', cache=True")
+
+
+def test_invalid_fix(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the source is kept if the fixed source does not parse."""
+
+    def broken_edits(*_args: Any) -> Iterator[Edit]:
+        yield Edit(0, 0, "(")
+
+    monkeypatch.setattr("flake8_numba.fix._function_edits", broken_edits)
+    assert fix_source(CODE, FIXES) == CODE
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that the command line checks or fixes files and directories."""
+    (tmp_path / "kernels.py").write_text(CODE)
+    (tmp_path / "broken.py").write_text("def f(:\n")
+    with pytest.raises(SystemExit):
+        main([str(tmp_path), "--check", "--select", "layout"])
+    assert "1 file(s) would be fixed." in capsys.readouterr().out
+    assert (tmp_path / "kernels.py").read_text() == CODE
+
+    main([str(tmp_path / "kernels.py"), "--select", ",".join(FIXES)])
+    assert (tmp_path / "kernels.py").read_text() == FIXED
+    assert not fix_file(str(tmp_path / "kernels.py"), FIXES)
+    with pytest.raises(SystemExit):
+        main(["--select", "unknown"])
@@ -0,0 +1,141 @@
+import ast
+
+import pytest
+
+from flake8_numba.inference import (
+    UNKNOWN,
+    array,
+    infer_types,
+    parse_dtype,
+    promote,
+    scalar,
+)
+from flake8_numba.symbols import index_module
+
+_HEADER = "import math\nimport numpy as np\nfrom numba import njit, float32, prange\n"
+
+
+def _function(code: str) -> ast.FunctionDef:
+    module = ast.parse(_HEADER + code)
+    index_module(module)
+    node = module.body[-1]
+    assert isinstance(node, ast.FunctionDef)
+    return node
+
+
+def _last_assignment(code: str, name: str) -> str:
+    (types_,) = infer_types(_function(code))
+    return str(types_.assignments[name][-1][1])
+
+
+_SIGNATURE = "@njit([float32(float32[::1], float32[:, :])])\ndef f(a, b):\n"
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ("    x = a", "float32[::1]"),
+        ("    x = a[0]", "float32"),
+        ("    x = a[0] * 2.0", "float64"),
+        ("    x = a * 2.0", "float32[::1]"),
+        ("    x = a * 2", "float32[::1]"),
+        ("    x = b[0, :]", "float32[:]"),
+        ("    x = b[0]", "float32[:]"),
+        ("    x = a[a > 0]", "float32[::1]"),
+        ("    x = b.T", "float32[:, :]"),
+        ("    x = a.shape[0]", "int64"),
+        ("    x = np.zeros((3, 4), dtype=np.float32)", "float32[:, ::1]"),
+        ("    x = np.zeros(3)", "float64[::1]"),
+        ("    x = np.empty((3, 4), order='F')", "float64[::1, :]"),
+        ("    x = np.empty_like(a)", "float32[::1]"),
+        ("    x = np.sqrt(a)", "float32[::1]"),
+        ("    x = math.sqrt(a[0])", "float64"),
+        ("    x = float32(a[0] * 2.0)", "float32"),
+        ("    x = np.float32(1.0)", "float32"),
+        ("    x = a.astype(np.float64)", "float64[::1]"),
+        ("    x = a.astype(np.complex64).real", "float32[:]"),
+        ("    x = a.astype(np.clongdouble).imag", "unknown"),
+        ("    x = a.sum()", "float32"),
+        ("    x = b.sum(axis=0)", "float32[::1]"),
+        ("    x = b.mean()", "float32"),
+        ("    x = a.argmax()", "int64"),
+        ("    x = len(a) / 2", "float64"),
+        ("    x = unknown_function(a)", "unknown"),
+        ("    for x in prange(10):\n        pass", "int64"),
+        ("    for x in b:\n        pass", "float32[:]"),
+        ("    x = 0\n    for i in range(3):\n        x += a[i] * 0.5", "float64"),
+    ],
+)
+def test_infer_types(body: str, expected: str) -> None:
+    """Test function `infer_types` with a declared signature."""
+    assert _last_assignment(_SIGNATURE + body + "\n    return 0", "x") == expected
+
+
+def test_infer_types_without_signature() -> None:
+    """Test that arguments are unknown if no signature is declared."""
+    (types_,) = infer_types(_function("@njit\ndef f(a):\n    x = a * 2\n    y = 1.0"))
+    assert types_.arguments == {}
+    assert types_.assignments["x"][0][1] == UNKNOWN
+    assert types_.assignments["y"][0][1] == scalar("float64")
+
+
+def test_infer_types_one_per_signature() -> None:
+    """Test that types are inferred once per signature and memoized."""
+    node = _function("@njit([float32(float32), f8(f8)])\ndef f(a):\n    return a + a")
+    inferred = infer_types(node)
+    assert [str(types_.returns[0][1]) for types_ in inferred] == ["float32", "float64"]
+    assert [str(types_.return_type) for types_ in inferred] == ["float32", "float64"]
+    assert infer_types(node) is inferred
+
+
+def test_infer_types_string_signatures() -> None:
+    """Test that signatures given as strings within a list are also supported."""
+    code = "@njit(['f4(f4[::1])', 'float64(int64)', 'f4(('])\ndef f(a):\n    return a"
+    inferred = infer_types(_function(code))
+    assert [str(types_.return_type) for types_ in inferred] == ["float32", "float64"]
+    assert inferred[0].arguments["a"] == array("float32", 1, "C")
+
+
+def test_infer_types_guvectorize() -> None:
+    """Test that signatures given as tuples of types are also supported."""
+    code = (
+        "from numba import guvectorize, float32\n"
+        "@guvectorize([(float32[:], float32[:])], '(n)->(n)')\n"
+        "def f(a, out):\n    x = a[0]"
+    )
+    (types_,) = infer_types(_function(code))
+    assert types_.arguments["out"] == array("float32", 1, "A")
+    assert types_.assignments["x"][0][1] == scalar("float32")
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("float32", "float32"),
+        ("np.float64", "float64"),
+        ("f4", "float32"),
+        ("double", "float64"),
+        ("boolean", "bool"),
+        ("intp", "int64"),
+        ("object", ""),
+        ("not_a_dtype", ""),
+    ],
+)
+def test_parse_dtype(name: str, expected: str) -> None:
+    """Test function `parse_dtype`."""
+    assert parse_dtype(name) == expected
+
+
+@pytest.mark.parametrize(
+    "left, right, expected",
+    [
+        (array("float32", 1), scalar("float64"), array("float32", 1)),
+        (array("int32", 1), scalar("float64"), array("float64", 1)),
+        (scalar("float32"), scalar("float64"), scalar("float64")),
+        (array("float32", 2), array("float64", 2), array("float64", 2)),
+        (array("float32", 1), UNKNOWN, UNKNOWN),
+    ],
+)
+def test_promote(left: object, right: object, expected: object) -> None:
+    """Test function `promote`."""
+    assert promote(left, right) == expected  # type: ignore
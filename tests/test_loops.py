@@ -0,0 +1,157 @@
+import ast
+from typing import Optional
+
+import pytest
+
+from flake8_numba.loops import get_loop_nest
+from flake8_numba.symbols import index_module
+
+
+def _function(code: str) -> ast.FunctionDef:
+    module = ast.parse("import numba as nb\nfrom numba import prange\n" + code)
+    index_module(module)
+    node = module.body[-1]
+    assert isinstance(node, ast.FunctionDef)
+    return node
+
+
+class TestLoop:
+    """Test class Loop."""
+
+    @pytest.mark.parametrize(
+        "header, kind, variable, trip_count",
+        [
+            ("for i in range(10):", "range", "i", 10),
+            ("for i in range(2, 10, 2):", "range", "i", 4),
+            ("for i in range(10, 0, -1):", "range", "i", 10),
+            ("for i in range(10, 0):", "range", "i", 0),
+            ("for i in range(0, 10, 3):", "range", "i", 4),
+            ("for i in range(10**23):", "range", "i", None),
+            (f"for i in range({10**23}):", "range", "i", 10**23),
+            ("for i in range(n):", "range", "i", None),
+            ("for i in prange(10):", "prange", "i", 10),
+            ("for i in nb.prange(n):", "prange", "i", None),
+            ("for i, x in enumerate(a):", "enumerate", "i", None),
+            ("for x in a:", "iter", None, None),
+            ("while n > 0:", "while", None, None),
+        ],
+    )
+    def test_header(
+        self, header: str, kind: str, variable: Optional[str], trip_count: Optional[int]
+    ) -> None:
+        """Test that the induction variable and bounds are parsed from the header."""
+        nest = get_loop_nest(_function(f"def f(a, n):\n    {header}\n        pass"))
+        (loop,) = nest.loops
+        assert loop.kind == kind
+        assert loop.variable == variable
+        assert loop.trip_count == trip_count
+        assert loop.is_parallel == (kind == "prange")
+
+    def test_nesting(self) -> None:
+        """Test that parents, depths and assigned names are recorded."""
+        code = (
+            "def f(a, n):\n"
+            "    for i in range(n):\n"
+            "        x = 0\n"
+            "        for j in range(n):\n"
+            "            y = a[i, j]\n"
+            "    for k in range(n):\n"
+            "        pass\n"
+        )
+        nest = get_loop_nest(_function(code))
+        outer, inner, other = nest.loops
+        assert nest.roots == [outer, other]
+        assert outer.children == [inner]
+        assert inner.parent is outer
+        assert (outer.depth, inner.depth) == (0, 1)
+        assert list(inner.ancestors()) == [outer]
+        assert outer.assigned == {"i", "x", "j", "y"}
+        assert inner.assigned == {"j", "y"}
+        assert set(inner.induction_variables()) == {"i", "j"}
+
+
+class TestLoopNest:
+    """Test class LoopNest."""
+
+    @pytest.mark.parametrize(
+        "subscript, expected",
+        [
+            ("a[i]", [{"i": 1}]),
+            ("a[i, j]", [{"i": 1}, {"j": 1}]),
+            ("a[j, i]", [{"j": 1}, {"i": 1}]),
+            ("a[2 * j + 1]", [{"j": 2}]),
+            ("a[i - j]", [{"i": 1, "j": -1}]),
+            ("a[j + j]", [{"j": 2}]),
+            ("a[n * i + j]", [{"i": None, "j": 1}]),
+            ("a[-i]", [{"i": -1}]),
+            ("a[i * j]", [None]),
+            ("a[idx[j]]", [None]),
+            ("a[n]", [{}]),
+            ("a[:, j]", [None, {"j": 1}]),
+        ],
+    )
+    def test_index_coefficients(
+        self, subscript: str, expected: list[Optional[dict[str, int]]]
+    ) -> None:
+        """Test that indices are described relative to the induction variables."""
+        code = (
+            "def f(a, idx, n):\n"
+            "    for i in range(n):\n"
+            "        for j in range(n):\n"
+            f"            {subscript} = 0\n"
+        )
+        nest = get_loop_nest(_function(code))
+        access = nest.accesses[0]
+        assert access.array == "a"
+        assert access.is_store
+        assert access.loop is nest.loops[1]
+        assert [index.coefficients for index in access.indices] == expected
+
+    @pytest.mark.parametrize(
+        "subscript, expected",
+        [
+            ("a[i]", 0),
+            ("a[2 * i + 1]", 1),
+            ("a[2 * (i - 1)]", -2),
+            ("a[-i - 3]", -3),
+            ("a[n - i]", None),
+            ("a[i * j]", None),
+        ],
+    )
+    def test_index_offset(self, subscript: str, expected: Optional[int]) -> None:
+        """Test that the constant term of linear indices is computed."""
+        code = (
+            "def f(a, n):\n"
+            "    for i in range(n):\n"
+            "        for j in range(n):\n"
+            f"            {subscript} = 0\n"
+        )
+        (index,) = get_loop_nest(_function(code)).accesses[0].indices
+        assert index.offset == expected
+
+    def test_accesses(self) -> None:
+        """Test that accesses are linked to their innermost loop."""
+        code = (
+            "def f(a, n):\n"
+            "    x = a[0]\n"
+            "    for i in range(a[1]):\n"
+            "        y = a[i]\n"
+            "        for j in range(n):\n"
+            "            z = a[j]\n"
+            "    def g(b):\n"
+            "        return b[0]\n"
+        )
+        node = _function(code)
+        nest = get_loop_nest(node)
+        outer, inner = nest.loops
+        assert [access.loop for access in nest.accesses] == [None, None, outer, inner]
+        assert [a.node.lineno for a in nest.accesses_within(outer)] == [6, 8]
+        assert nest.loop_of(node.body[1].body[0]) is outer  # type: ignore
+        assert nest.loop_of(node.body[0]) is None
+        assert not nest.accesses[2].is_store
+        assert nest.accesses[2].indices[0].variables == {"i"}
+
+    def test_memoization(self) -> None:
+        """Test that the nest is only built once per function."""
+        node = _function("def f(a):\n    for x in a:\n        pass")
+        assert get_loop_nest(node) is get_loop_nest(node)
@@ -0,0 +1,22 @@
+from typing import Optional
+
+import pytest
+
+from flake8_numba.nopython import load_support_index
+
+
+@pytest.mark.parametrize(
+    "version, expected_version, expected_support",
+    [
+        ("0.68.1", "0.68", True),
+        ("0.70", "0.68", True),
+        ("0.58", "0.58", None),
+    ],
+)
+def test_load_support_index(
+    version: str, expected_version: str, expected_support: Optional[bool]
+) -> None:
+    """Test that the closest version that is not newer than the given one is used."""
+    support = load_support_index(version)
+    assert support.version == expected_version
+    assert support.is_supported("numpy.sum") is expected_support
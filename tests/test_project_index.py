@@ -0,0 +1,173 @@
+import ast
+import os
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from numba import float32
+
+from flake8_numba import utils
+from flake8_numba.project_index import ProjectIndex, module_name
+from flake8_numba.rule import Error
+from flake8_numba.rules.nba6 import NBA621
+from flake8_numba.symbols import ModuleIndex, index_module
+
+TYPES = """
+from numba import float32
+
+ARRAY = float32[:]
+SIGS = [(ARRAY, ARRAY)]
+LAYOUT = "(n) -> (n)"
+N_ITEMS = 3
+
+
+@guvectorize(SIGS, LAYOUT, nopython=True)
+def kernel(val, out):
+    out[:] = val
+"""
+
+KERNELS = """
+from .types import SIGS
+from kernels import types
+
+
+@guvectorize(SIGS, types.LAYOUT)
+def func(val, out) -> None:
+    out[:] = val
+"""
+
+PARALLEL = """
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def total(row):
+    result = 0.0
+    for j in prange(row.shape[0]):
+        result += row[j]
+    return result
+"""
+
+CALLER = """
+from numba import njit, prange
+
+from kernels.parallel import total
+
+
+@njit(parallel=True)
+def func(a, out):
+    for i in prange(a.shape[0]):
+        out[i] = total(a[i])
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Generator[ProjectIndex, None, None]:
+    """Project with a module defining signatures and another one importing them."""
+    (tmp_path / "kernels").mkdir()
+    (tmp_path / "kernels" / "__init__.py").write_text("")
+    (tmp_path / "kernels" / "types.py").write_text(TYPES)
+    (tmp_path / "kernels" / "moving.py").write_text(KERNELS)
+    (tmp_path / "kernels" / "parallel.py").write_text(PARALLEL)
+    (tmp_path / "kernels" / "caller.py").write_text(CALLER)
+    project = ProjectIndex(str(tmp_path))
+    yield project
+    project.connection.close()
+
+
+class TestProjectIndex:
+    """Test class ProjectIndex."""
+
+    def test_update_is_incremental(self, project: ProjectIndex) -> None:
+        """Test that only new or modified files are parsed again."""
+        types_path = os.path.join(project.root, "kernels", "types.py")
+        assert project.update() == 5
+        assert project.update() == 0
+
+        # Same content but different modification time
+        os.utime(types_path, ns=(0, 0))
+        assert project.update() == 0
+
+        with open(types_path, "a") as f:
+            f.write("\nOTHER = float32\n")
+        assert project.update() == 1
+        assert project.lookup_constant("kernels.types.OTHER", "") is not None
+
+    def test_removed_files(self, project: ProjectIndex) -> None:
+        """Test that symbols of removed files are forgotten."""
+        project.update()
+        os.remove(os.path.join(project.root, "kernels", "types.py"))
+        project.update()
+        assert project.lookup_constant("kernels.types.SIGS", "") is None
+
+    def test_lookup_constant(self, project: ProjectIndex) -> None:
+        """Test that constants are resolved within the module defining them."""
+        project.update()
+        filename = os.path.join(project.root, "kernels", "moving.py")
+        sigs = project.lookup_constant(".types.SIGS", filename)
+        assert sigs is not None
+        assert ast.unparse(sigs) == "[(numba.float32[:], numba.float32[:])]"
+        assert project.lookup_constant("kernels.types.N_ITEMS", "") is None
+
+    def test_lookup_function(self, project: ProjectIndex) -> None:
+        """Test that jitted functions are stored with their decorator options."""
+        project.update()
+        function = project.lookup_function("kernels.types.kernel")
+        assert function is not None
+        assert function.decorator == "guvectorize"
+        assert function.args[1] == "'(n) -> (n)'"
+        assert function.kwargs == {"nopython": "True"}
+        assert project.lookup_function("kernels.types.SIGS") is None
+
+    def test_imported_parallel_callee(
+        self, project: ProjectIndex, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that NBA621 sees parallel functions imported from other files."""
+        project.update()
+        filename = os.path.join(project.root, "kernels", "caller.py")
+        with open(filename) as f:
+            module = ast.parse(f.read())
+        node = module.body[-1]
+        assert isinstance(node, ast.FunctionDef)
+
+        index_module(module, filename)
+        errors: list[Error] = []
+        NBA621().check(node, errors)
+        assert not errors
+
+        monkeypatch.setattr(ModuleIndex, "project", project)
+        index_module(module, filename)
+        NBA621().check(node, errors)
+        assert len(errors) == 1
+        assert "`kernels.parallel.total` runs in parallel" in errors[0].message
+
+    def test_rules_use_the_index(
+        self, project: ProjectIndex, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that decorator arguments imported from other files are resolved."""
+        project.update()
+        monkeypatch.setattr(ModuleIndex, "project", project)
+        filename = os.path.join(project.root, "kernels", "moving.py")
+        with open(filename) as f:
+            module = ast.parse(f.read())
+        index_module(module, filename)
+        node = module.body[-1]
+        assert isinstance(node, ast.FunctionDef)
+
+        signatures = utils.get_pos_arg_from_decorator(0, node).numba_signature
+        assert signatures == [(float32[:], float32[:])]
+        layout = utils.get_pos_arg_from_decorator(1, node).numba_signature
+        assert layout == "'(n) -> (n)'"
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("pkg/module.py", "pkg.module"),
+        ("pkg/__init__.py", "pkg"),
+        ("../module.py", ""),
+    ],
+)
+def test_module_name(path: str, expected: str) -> None:
+    """Test that paths are converted into module names."""
+    assert module_name(os.path.join("root", path), "root") == expected
@@ -0,0 +1,121 @@
+import pytest
+
+from flake8_numba.pytest_plugin import Budget, check_budget
+from flake8_numba.runtime import CompileEvent
+
+pytest_plugins = ["pytester"]
+
+KERNELS = """
+from numba import njit
+
+
+@njit(cache=True)
+def move_mean(a, b):
+    return (a + b) / 2
+
+
+@njit
+def add(a, b):
+    return a + b
+"""
+
+TESTS = """
+import pytest
+
+import kernels
+
+
+@pytest.mark.numba_budget("kernels.move_mean", compilations=1)
+def test_within_budget():
+    kernels.move_mean(1, 2)
+    kernels.add(1.0, 2.0)
+    kernels.add(1, 2)
+
+
+@pytest.mark.numba_budget("add", compilations=1)
+def test_over_budget():
+    kernels.add(1j, 2j)
+    kernels.add(1.0, 2j)
+
+
+@pytest.mark.numba_budget(compilations=0)
+def test_already_compiled():
+    kernels.add(1, 2)
+"""
+
+CACHED = """
+import pytest
+
+import kernels
+
+
+@pytest.mark.numba_budget("kernels.move_mean", cache=True)
+def test_cached():
+    kernels.move_mean(1.0, 2.0)
+"""
+
+
+def _event(name: str, signature: str = "(int64,)") -> CompileEvent:
+    return CompileEvent(None, name, signature, 0.5, False)
+
+
+class TestCheckBudget:
+    """Test function `check_budget`."""
+
+    def test_compilations(self) -> None:
+        """Test that only the compilations of the budgeted function are counted."""
+        events = [_event("kernels.move_mean"), _event("kernels.mean", "(float64,)")]
+        assert check_budget(Budget("move_mean", 1, False), events) is None
+        assert check_budget(Budget("mean", 1, False), events) is None
+        overrun = check_budget(Budget(None, 1, False), events)
+        assert overrun == (
+            "2 compilations of numba functions (at most 1):\n"
+            "  kernels.move_mean(int64,) in 0.50s\n"
+            "  kernels.mean(float64,) in 0.50s"
+        )
+
+    def test_cache(self) -> None:
+        """Test that cached functions can not be compiled nor miss the cache."""
+        budget = Budget("kernels.mean", None, True)
+        assert check_budget(budget, [], (1, 0)) is None
+        assert check_budget(budget, [], (0, 1)) == "1 cache misses of `kernels.mean`."
+        overrun = check_budget(budget, [_event("kernels.mean")])
+        assert overrun is not None
+        assert overrun.startswith("`kernels.mean` compiled instead of loaded from cache")
+
+
+def test_plugin(pytester: pytest.Pytester) -> None:
+    """Test that tests over their budget fail, reporting the signatures compiled."""
+    pytester.makepyfile(kernels=KERNELS, test_kernels=TESTS)
+    result = pytester.runpytest_subprocess("-p", "flake8_numba.pytest_plugin")
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*Numba budget exceeded: 2 compilations of `add` (at most 1):",
+            "*kernels.add(complex128, complex128) in *s",
+            "*kernels.add(float64, complex128) in *s",
+        ]
+    )
+
+    pytester.makepyfile(test_cached=CACHED)
+    options = ("-p", "flake8_numba.pytest_plugin", "test_cached.py")
+    pytester.runpytest_subprocess(*options).assert_outcomes(failed=1)
+    pytester.runpytest_subprocess(*options).assert_outcomes(passed=1)
+
+
+def test_plugin_without_budget(pytester: pytest.Pytester) -> None:
+    """Test that tests without a budget import nothing and record nothing."""
+    pytester.makepyfile(
+        test_plain="""
+import sys
+
+
+def test_plain(record_property):
+    assert "numba" not in sys.modules
+"""
+    )
+    result = pytester.runpytest_subprocess(
+        "-p", "flake8_numba.pytest_plugin", "--junitxml=report.xml"
+    )
+    result.assert_outcomes(passed=1)
+    assert "numba_compilations" not in (pytester.path / "report.xml").read_text()
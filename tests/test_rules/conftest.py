@@ -7,11 +7,14 @@ from typing import Any
 import pytest
 
 from flake8_numba.rule import Error
+from flake8_numba.symbols import index_module
 
 
 @pytest.fixture
 def node(file_name: str) -> ast.FunctionDef:
-    """Node representing the ast conversion of the function.
+    """Node representing the ast conversion of the first function within a file.
+
+    Module-level statements (imports, signature constants...) are indexed as well.
 
     Args:
         file_name (str): File where the function is loaded.
@@ -22,7 +25,11 @@ def node(file_name: str) -> ast.FunctionDef:
     path = os.path.join(os.path.dirname(__file__), "data", file_name) + ".py"
     with open(path) as f:
         string = f.read()
-    return ast.parse(string).body[0]  # type: ignore
+    module = ast.parse(string)
+    index_module(module, path)
+    return next(
+        statement for statement in module.body if isinstance(statement, ast.FunctionDef)
+    )
 
 
 @pytest.fixture
@@ -0,0 +1,7 @@
+@vectorize
+def func(val: int) -> int:
+    match val:
+        case 1:
+            return 1
+        case 2:
+            return 2
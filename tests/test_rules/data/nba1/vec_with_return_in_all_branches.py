@@ -0,0 +1,6 @@
+@vectorize
+def func(val: int) -> int:
+    if val > 0:
+        return val
+    else:
+        return -val
@@ -0,0 +1,5 @@
+@vectorize
+def func(val: int) -> int:
+    if val > 0:
+        return val
+    val = -val
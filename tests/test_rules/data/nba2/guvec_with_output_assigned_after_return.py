@@ -0,0 +1,4 @@
+@guvectorize([(float32[:], float32[:]), (int64[:], int64[:])], "(n) -> (n)")
+def func(val, output) -> None:
+    return
+    output[0] = val[0]
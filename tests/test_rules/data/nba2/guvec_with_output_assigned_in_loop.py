@@ -0,0 +1,4 @@
+@guvectorize([(float32[:], float32[:]), (int64[:], int64[:])], "(n) -> (n)")
+def func(val, output) -> None:
+    for i in range(val.shape[0]):
+        output[i] = val[i]
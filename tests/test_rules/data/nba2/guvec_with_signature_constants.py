@@ -0,0 +1,7 @@
+SIGS = [(float32[:], float32[:]), (int64[:], int64[:])]
+LAYOUT = "(n) -> ()"
+
+
+@guvectorize(SIGS, LAYOUT)
+def func(val, output) -> None:
+    output[0] = 1
@@ -0,0 +1,7 @@
+from numba import objmode
+
+
+def func(n):
+    for i in range(n):
+        with objmode():
+            pass
@@ -0,0 +1,6 @@
+import numba as nb
+
+
+@nb.jit(forceobj=True)
+def func(a):
+    return a
@@ -0,0 +1,6 @@
+from numba import jit
+
+
+@jit(nopython=True)
+def func(a):
+    return a
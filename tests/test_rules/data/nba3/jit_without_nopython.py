@@ -0,0 +1,6 @@
+from numba import jit
+
+
+@jit
+def func(a):
+    return a
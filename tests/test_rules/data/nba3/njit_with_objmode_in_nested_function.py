@@ -0,0 +1,11 @@
+from numba import njit, objmode
+
+
+@njit
+def func(a):
+    def inner(n):
+        for i in range(n):
+            with objmode():
+                pass
+
+    return a
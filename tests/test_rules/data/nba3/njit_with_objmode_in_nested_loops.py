@@ -0,0 +1,14 @@
+import numpy as np
+from numba import njit, objmode
+
+
+@njit
+def func(a):
+    for i in range(a.shape[0]):
+        with objmode(value="float64"):
+            value = float(np.random.rand())
+        for j in range(a.shape[1]):
+            with objmode(value="float64"):
+                value = float(np.random.rand())
+            a[i, j] = value
+    return a
@@ -0,0 +1,9 @@
+import numba
+
+
+@numba.njit
+def func(n):
+    while n > 0:
+        with numba.objmode():
+            print(n)
+        n -= 1
@@ -0,0 +1,11 @@
+import numba
+from numba import objmode
+
+
+@numba.njit
+def func(a):
+    with objmode(start="float64"):
+        start = 0.0
+    for i in range(a.shape[0]):
+        a[i] += start
+    return a
@@ -0,0 +1,8 @@
+from numba import vectorize
+
+NOPYTHON = False
+
+
+@vectorize(["float64(float64)"], nopython=NOPYTHON)
+def func(a):
+    return a
@@ -0,0 +1,6 @@
+from numba import vectorize
+
+
+@vectorize(["float64(float64)"], nopython=True)
+def func(a):
+    return a
@@ -0,0 +1,6 @@
+from numba import jit
+
+
+@jit(["int64(int64)"], forceobj=True)
+def func(a):
+    return len(str(a))
@@ -0,0 +1,14 @@
+import numba as nb
+import numpy as np
+
+SIGNATURE = nb.float64(nb.float64[::1])
+
+
+@nb.njit(SIGNATURE)
+def func(a):
+    return helper(a) + np.sum(a)
+
+
+@nb.njit
+def helper(a):
+    return a[0]
@@ -0,0 +1,8 @@
+from numba import njit
+
+from .helpers import helper
+
+
+@njit(["int64(int64[:])"])
+def func(a):
+    return helper(a.real_part)
@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit(["int64(int64[:])"])
+def func(a):
+    return a.real_part
@@ -0,0 +1,7 @@
+import numpy as np
+from numba import jit
+
+
+@jit(forceobj=True)
+def func(a):
+    return np.pad(a, 1)
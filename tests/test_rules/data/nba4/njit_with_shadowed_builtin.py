@@ -0,0 +1,9 @@
+from numba import njit
+
+
+@njit
+def func(a):
+    def open(x):
+        return x
+
+    return open(a)
@@ -0,0 +1,12 @@
+import math
+
+import numpy as np
+from numba import float64, njit
+
+
+@njit([float64(float64[:])])
+def func(a):
+    acc = 0.0
+    for i in range(len(a)):
+        acc += math.sqrt(abs(a[i]))
+    return acc + np.sum(a) + a.mean() + np.linalg.norm(a)
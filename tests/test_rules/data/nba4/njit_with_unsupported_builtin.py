@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit
+def func(path):
+    return open(path)
@@ -0,0 +1,8 @@
+from math import fsum
+
+from numba import njit
+
+
+@njit
+def func(a):
+    return fsum(a)
@@ -0,0 +1,7 @@
+from numba import float64, njit
+
+
+@njit([float64(float64[:])])
+def func(a):
+    values = a.tolist()
+    return values[0]
@@ -0,0 +1,8 @@
+import math
+
+from numba import vectorize
+
+
+@vectorize(["float64(float64)"])
+def func(x):
+    return math.factorial(x)
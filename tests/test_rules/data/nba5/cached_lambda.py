@@ -0,0 +1,6 @@
+import numba as nb
+
+
+def func(a):
+    square = nb.njit(lambda b: b * b, cache=True)
+    return square(a)
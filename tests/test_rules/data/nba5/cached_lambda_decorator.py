@@ -0,0 +1,8 @@
+from numba import jit
+
+CACHE = True
+
+
+def func(a):
+    square = jit(cache=CACHE)(lambda b: b * b)
+    return square(a)
@@ -0,0 +1,10 @@
+from numba import njit
+
+
+def func():
+    class Model:
+        @njit(cache=True)
+        def method(b):
+            return b
+
+    return Model
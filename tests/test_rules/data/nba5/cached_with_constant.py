@@ -0,0 +1,10 @@
+import numpy as np
+from numba import njit
+
+SCALE = np.float64(2.0)
+LIMITS = (0, 1)
+
+
+@njit(cache=True)
+def func(a):
+    return a * SCALE + LIMITS[0]
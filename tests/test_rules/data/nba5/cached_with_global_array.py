@@ -0,0 +1,9 @@
+import numpy as np
+from numba import njit
+
+WEIGHTS = np.ones(3)
+
+
+@njit(cache=True)
+def func(a):
+    return a * WEIGHTS
@@ -0,0 +1,13 @@
+from numba import njit
+
+SCALE = 1.0
+
+
+@njit(cache=True)
+def func(a):
+    return a * SCALE
+
+
+def set_scale(value):
+    global SCALE
+    SCALE = value
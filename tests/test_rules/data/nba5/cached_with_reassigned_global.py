@@ -0,0 +1,9 @@
+from numba import njit
+
+SCALE = 1.0
+SCALE = 2.0
+
+
+@njit(cache=True)
+def func(a):
+    return a * SCALE
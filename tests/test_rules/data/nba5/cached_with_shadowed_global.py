@@ -0,0 +1,9 @@
+from numba import njit
+
+WEIGHTS = [1.0, 2.0]
+
+
+@njit(cache=True)
+def func(a):
+    WEIGHTS = a
+    return WEIGHTS
@@ -0,0 +1,9 @@
+from numba import njit
+
+
+def func(a, scale):
+    @njit
+    def inner(b):
+        return b * scale
+
+    return inner(a)
@@ -0,0 +1,6 @@
+import numba
+
+
+def func(kernel, a):
+    gufunc = numba.guvectorize("(n)->(n)")(kernel)
+    return gufunc(a)
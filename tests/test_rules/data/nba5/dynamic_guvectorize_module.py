@@ -0,0 +1,9 @@
+from numba import guvectorize
+
+
+def func(a, out):
+    for i in range(a.shape[0]):
+        out[i] = 2 * a[i]
+
+
+kernel = guvectorize("(n)->(n)")(func)
@@ -0,0 +1,7 @@
+from numba import guvectorize
+
+
+@guvectorize(["void(float64[:], float64[:])"], "(n)->(n)")
+def func(a, out):
+    for i in range(a.shape[0]):
+        out[i] = 2 * a[i]
@@ -0,0 +1,6 @@
+import numba
+
+
+def func(kernel, a):
+    gufunc = numba.guvectorize(["void(float64[:], float64[:])"], "(n)->(n)")(kernel)
+    return gufunc(a)
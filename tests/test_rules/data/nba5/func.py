@@ -0,0 +1,2 @@
+def func(a):
+    return a
@@ -0,0 +1,6 @@
+from numba import njit
+
+
+def func(a):
+    square = njit(lambda b: b * b)
+    return square(a)
@@ -0,0 +1,6 @@
+from numba import vectorize
+
+
+@vectorize
+def func(a):
+    return a
@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit(cache=True)
+def func(a):
+    return a
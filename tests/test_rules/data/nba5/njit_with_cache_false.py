@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit(cache=False)
+def func(a):
+    return a
@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit("float64(float64[::1])", cache=True)
+def func(a):
+    return a.sum()
@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit(fastmath=True)
+def func(a):
+    return a
@@ -0,0 +1,9 @@
+import functools
+
+from numba import njit
+
+
+@functools.lru_cache(maxsize=8)
+@njit
+def func(a):
+    return a
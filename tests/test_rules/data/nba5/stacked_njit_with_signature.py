@@ -0,0 +1,9 @@
+import functools
+
+from numba import njit
+
+
+@functools.lru_cache
+@njit("float64(float64)")
+def func(a):
+    return a
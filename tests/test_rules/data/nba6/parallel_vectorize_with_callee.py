@@ -0,0 +1,11 @@
+from numba import njit, vectorize
+
+
+@vectorize(["float64(float64)"], target="parallel")
+def func(x):
+    return kernel(x)
+
+
+@njit(parallel=True)
+def kernel(x):
+    return x * 2.0
@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit("float64[:](float64[:])", parallel=True)
+def func(a):
+    return a * 2.0 + 1.0
@@ -0,0 +1,7 @@
+import numpy as np
+from numba import njit
+
+
+@njit(parallel=True)
+def func(a):
+    return np.sum(a)
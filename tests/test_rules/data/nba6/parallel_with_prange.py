@@ -0,0 +1,9 @@
+import numba as nb
+
+
+@nb.njit(parallel=True)
+def func(a):
+    total = 0.0
+    for i in nb.prange(a.shape[0]):
+        total += a[i]
+    return total
@@ -0,0 +1,9 @@
+from numba import njit
+
+
+@njit("float64(float64[:])", parallel=True)
+def func(a):
+    total = 0.0
+    for i in range(a.shape[0]):
+        total += a[i] * 2.0
+    return total
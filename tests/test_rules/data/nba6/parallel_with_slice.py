@@ -0,0 +1,7 @@
+from numba import njit
+
+
+@njit(parallel=True)
+def func(a, i):
+    a[i] = 0.0
+    return a[1:] + 1.0
@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit(parallel=True)
+def func(a, b):
+    return a + b
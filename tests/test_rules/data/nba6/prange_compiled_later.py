@@ -0,0 +1,9 @@
+import numba as nb
+
+
+def func(a):
+    for i in nb.prange(a.shape[0]):
+        a[i] = 0.0
+
+
+kernel = nb.njit(parallel=True)(func)
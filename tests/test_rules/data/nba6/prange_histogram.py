@@ -0,0 +1,7 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a, hist):
+    for i in prange(a.shape[0]):
+        hist[a[i]] += 1
@@ -0,0 +1,10 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a, out):
+    for i in prange(a.shape[0] - 1):
+        out[i] = a[i + 1] - a[i]
+        out[i] += 1.0
+        for j in range(a.shape[1]):
+            a[i, j] = a[i, j + 1]
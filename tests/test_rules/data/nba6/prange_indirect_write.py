@@ -0,0 +1,8 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a, order, out):
+    for i in prange(a.shape[0]):
+        k = order[i]
+        out[k] = a[i]
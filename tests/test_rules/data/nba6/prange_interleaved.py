@@ -0,0 +1,7 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a):
+    for i in prange(a.shape[0] // 2):
+        a[2 * i] = a[2 * i + 1]
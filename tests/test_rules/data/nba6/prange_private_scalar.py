@@ -0,0 +1,8 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a):
+    for i in prange(a.shape[0]):
+        value = a[i] ** 2
+        a[i] = value
@@ -0,0 +1,8 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a):
+    n = a.shape[0]
+    for i in prange(n):
+        a[i] = a[n - 1 - i]
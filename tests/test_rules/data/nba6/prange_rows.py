@@ -0,0 +1,17 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a, out):
+    total = 0.0
+    smallest = np.inf
+    for i in prange(a.shape[0]):
+        row = np.empty(a.shape[1])
+        row[0] = 0.0
+        value = a[i, 0] * 2.0
+        out[i, :] = value
+        total += value
+        smallest = min(smallest, value)
+        total = total + 1.0
+    return total, smallest
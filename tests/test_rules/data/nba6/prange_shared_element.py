@@ -0,0 +1,7 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a, out):
+    for i in prange(a.shape[0]):
+        out[0] = a[i]
@@ -0,0 +1,9 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a):
+    last = 0.0
+    for i in prange(a.shape[0]):
+        last = a[i]
+    return last
@@ -0,0 +1,7 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a):
+    for i in prange(a.shape[0] - 1):
+        a[i + 1] = a[i] * 0.5
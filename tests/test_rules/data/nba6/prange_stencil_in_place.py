@@ -0,0 +1,8 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a):
+    for i in prange(1, a.shape[0] - 1):
+        for j in range(a.shape[1]):
+            a[i, j] = (a[i - 1, j] + a[i + 1, j]) / 2
@@ -0,0 +1,8 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a, b, out):
+    for i in prange(a.shape[0]):
+        out[i] = np.dot(a[i], b)
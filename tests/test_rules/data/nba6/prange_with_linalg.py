@@ -0,0 +1,9 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a, out):
+    for i in prange(a.shape[0]):
+        for j in range(a.shape[1]):
+            out[i, j] = np.linalg.norm(a[i, j])
@@ -0,0 +1,7 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a, b, out):
+    for i in prange(a.shape[0]):
+        out[i] = a[i] @ b
@@ -0,0 +1,20 @@
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a, out):
+    for i in prange(a.shape[0]):
+        out[i] = helper(a[i])
+
+
+@njit
+def helper(row):
+    return inner(row)
+
+
+@njit(parallel=True)
+def inner(row):
+    total = 0.0
+    for j in prange(row.shape[0]):
+        total += row[j]
+    return total
@@ -0,0 +1,14 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True)
+def func(a, b, out):
+    c = np.dot(a, b)
+    for i in prange(a.shape[0]):
+        out[i] = helper(a[i]) + c[i, 0]
+
+
+@njit
+def helper(row):
+    return row.sum()
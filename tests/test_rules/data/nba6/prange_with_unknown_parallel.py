@@ -0,0 +1,9 @@
+from numba import njit, prange
+
+from .config import PARALLEL
+
+
+@njit(parallel=PARALLEL)
+def func(a):
+    for i in prange(a.shape[0]):
+        a[i] = 0.0
@@ -0,0 +1,7 @@
+from numba import njit, prange
+
+
+@njit
+def func(a):
+    for i in prange(a.shape[0]):
+        a[i] = 0.0
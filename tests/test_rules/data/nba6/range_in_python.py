@@ -0,0 +1,3 @@
+def func(a):
+    for i in range(a.shape[0]):
+        a[i] = 0.0
@@ -0,0 +1,7 @@
+from numba import njit
+
+
+@njit
+def func(a):
+    for i in range(a.shape[0] - 1):
+        a[i + 1] = a[i] * 0.5
@@ -0,0 +1,10 @@
+import numpy as np
+from numba import njit
+
+
+@njit
+def func(a):
+    out = np.empty_like(a)
+    for i in range(a.shape[0]):
+        out[i] = a[i] * 2.0
+    return out
@@ -0,0 +1,10 @@
+import numpy as np
+from numba import njit
+
+
+@njit
+def func(a):
+    out = np.empty(0)
+    for value in a:
+        out = np.append(out, value)
+    return out
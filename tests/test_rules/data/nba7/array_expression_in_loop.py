@@ -0,0 +1,9 @@
+from numba import njit
+
+
+@njit("float64(float64[:], float64[:])")
+def func(a, b):
+    total = 0.0
+    for _ in range(10):
+        total += (a * b).sum()
+    return total
@@ -0,0 +1,8 @@
+import numpy as np
+from numba import njit
+
+
+@njit
+def func(a):
+    for i in range(a.shape[0]):
+        a[i] = np.sqrt(a[i]) + np.sum(a)
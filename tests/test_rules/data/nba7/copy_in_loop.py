@@ -0,0 +1,8 @@
+from numba import njit
+
+
+@njit
+def func(a):
+    for i in range(a.shape[0]):
+        b = a[i].copy()
+        b[0] = 0.0
@@ -0,0 +1,10 @@
+from numba import njit
+
+
+@njit
+def func(a):
+    found = []
+    for i in range(a.shape[0]):
+        if a[i] > 0:
+            found.append(i)
+    return found
@@ -0,0 +1,9 @@
+from numba import njit
+
+
+@njit
+def func(a, limits):
+    total = 0.0
+    for limit in limits:
+        total += a[a > limit].sum()
+    return total
@@ -0,0 +1,10 @@
+import numpy as np
+from numba import njit
+
+
+@njit
+def func(a, w):
+    for i in range(a.shape[0]):
+        scale = np.exp(w[i])
+        for j in range(a.shape[1]):
+            a[i, j] *= np.exp(w[i]) * scale
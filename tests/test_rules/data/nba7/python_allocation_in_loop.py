@@ -0,0 +1,6 @@
+import numpy as np
+
+
+def func(n):
+    for i in range(n):
+        np.zeros(n)
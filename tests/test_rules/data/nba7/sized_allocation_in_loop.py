@@ -0,0 +1,11 @@
+import numpy as np
+from numba import njit
+
+
+@njit
+def func(n):
+    total = 0.0
+    for i in range(n):
+        values = np.arange(i)
+        total += values.sum()
+    return total
@@ -0,0 +1,10 @@
+import math
+
+from numba import njit
+
+
+@njit
+def func(a, sigma):
+    for i in range(a.shape[0]):
+        for j in range(a.shape[1]):
+            a[i, j] /= math.sqrt(2.0 * math.pi * sigma)
@@ -0,0 +1,9 @@
+from numba import njit
+
+
+@njit
+def func(a, b):
+    total = 0.0
+    for i in range(b.shape[0]):
+        total += a.T[i, 0] * b[i]
+    return total
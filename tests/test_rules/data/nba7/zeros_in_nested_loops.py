@@ -0,0 +1,13 @@
+import numpy as np
+from numba import njit
+
+
+@njit
+def func(a):
+    total = 0.0
+    for i in range(a.shape[0]):
+        buffer = np.empty(3)
+        for j in range(a.shape[1]):
+            row = np.zeros(a.shape[1])
+            total += row[j] + buffer[0]
+    return total
@@ -0,0 +1,11 @@
+from numba import njit
+
+
+@njit
+def func(a, col):
+    total = 0.0
+    for i in range(a.shape[0]):
+        total += a[i, col]
+    for i in range(a.shape[0]):
+        a[i, :] = 0.0
+    return total
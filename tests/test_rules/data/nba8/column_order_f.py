@@ -0,0 +1,10 @@
+from numba import njit
+
+
+@njit("float64(float64[::1, :])")
+def func(a):
+    total = 0.0
+    for j in range(a.shape[1]):
+        for i in range(a.shape[0]):
+            total += a[i, j]
+    return total
@@ -0,0 +1,9 @@
+from numba import njit
+
+
+@njit
+def func(a, out):
+    for i in range(a.shape[2]):
+        for j in range(a.shape[1]):
+            for k in range(a.shape[0]):
+                out[k, j, i] = a[k, j, i] * 2.0
@@ -0,0 +1,6 @@
+def func(a):
+    total = 0.0
+    for i in range(a.shape[1]):
+        for j in range(a.shape[0]):
+            total += a[j, i]
+    return total
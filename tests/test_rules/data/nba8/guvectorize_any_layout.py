@@ -0,0 +1,6 @@
+from numba import guvectorize
+
+
+@guvectorize(["void(float64[:], float64[:])"], "(n)->(n)")
+def func(a, out):
+    out[:] = a
@@ -0,0 +1,8 @@
+import numba as nb
+
+SIGNATURE = nb.float64(nb.float64[:])
+
+
+@nb.jit(SIGNATURE)
+def func(a):
+    return a[0]
@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit(["float64(float64[::1], float64[:, :])"])
+def func(a, b):
+    return a[0] + b[0, 0]
@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit(["float64(unknown[:])"])
+def func(a):
+    return a[0]
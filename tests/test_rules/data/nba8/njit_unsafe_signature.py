@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit(__import__("builtins").setattr(__import__("builtins"), "nba801_evaluated", True))
+def func(a):
+    return a[0]
@@ -0,0 +1,10 @@
+from numba import njit
+
+
+@njit("float64(float64[:], boolean)")
+def func(a, flag):
+    if flag:
+        x = a.copy()
+    else:
+        x = a[0]
+    return x.sum()
@@ -0,0 +1,13 @@
+from numba import njit
+
+
+@njit("float64(float64[:], boolean)")
+def func(a, flag):
+    if flag:
+        y = 1
+    else:
+        y = a
+    s = 0
+    for i in range(a.shape[0]):
+        s += a[i]
+    return s
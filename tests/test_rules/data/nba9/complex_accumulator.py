@@ -0,0 +1,9 @@
+from numba import njit
+
+
+@njit("complex128(complex128[:])")
+def func(a):
+    total = 0
+    for i in range(a.shape[0]):
+        total = total + a[i]
+    return total
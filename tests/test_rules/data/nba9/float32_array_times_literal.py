@@ -0,0 +1,7 @@
+import numpy as np
+from numba import njit
+
+
+@njit("float32[::1](float32[::1])")
+def func(a):
+    return np.sqrt(a) * 0.5
@@ -0,0 +1,7 @@
+from numba import njit
+
+
+@njit("void(float32[::1])")
+def func(a):
+    for i in range(a.shape[0]):
+        a[i] += 1.0
@@ -0,0 +1,8 @@
+import math
+
+from numba import njit
+
+
+@njit("float32(float32)")
+def func(x):
+    return math.sqrt(x)
@@ -0,0 +1,9 @@
+from numba import njit
+
+
+@njit("float32(float32[::1])")
+def func(a):
+    total = a[0]
+    for i in range(1, a.shape[0]):
+        total = total + 0.5 * a[i]
+    return total
@@ -0,0 +1,11 @@
+import numpy as np
+from numba import njit
+
+
+@njit("float32(float32[::1])")
+def func(a):
+    half = np.float32(0.5)
+    total = np.float32(0)
+    for i in range(a.shape[0]):
+        total += half * a[i]
+    return total
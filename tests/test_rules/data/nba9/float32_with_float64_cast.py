@@ -0,0 +1,7 @@
+import numpy as np
+from numba import njit
+
+
+@njit("float32[::1](float32[::1], float32)")
+def func(a, scale):
+    return a * np.float64(scale)
@@ -0,0 +1,6 @@
+from numba import njit
+
+
+@njit("float64(float64)")
+def func(x):
+    return 0.5 * x
@@ -0,0 +1,8 @@
+import numpy as np
+
+
+def func(a: np.ndarray) -> float:
+    total = 0
+    for i in range(a.shape[0]):
+        total += a[i]
+    return total
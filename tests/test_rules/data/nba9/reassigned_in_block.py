@@ -0,0 +1,8 @@
+from numba import njit
+
+
+@njit("float64(float64[:])")
+def func(a):
+    x = 0
+    x = a[0]
+    return x
@@ -0,0 +1,7 @@
+import numpy as np
+from numba import vectorize
+
+
+@vectorize(["float32(float32, float32)"])
+def func(x, y):
+    return x * y / np.float32(2)
@@ -0,0 +1,6 @@
+from numba import vectorize
+
+
+@vectorize(["float32(float32, float32)"])
+def func(x, y):
+    return x * y / 2.0
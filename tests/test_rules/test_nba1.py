@@ -1,10 +1,13 @@
 import ast
+import sys
 
 import pytest
 
 from flake8_numba.rule import Error
 from flake8_numba.rules.nba1 import NBA101, NBA102
 
+_MATCH = pytest.mark.skipif(sys.version_info < (3, 10), reason="`match` requires 3.10")
+
 
 @pytest.mark.parametrize(
     "file_name, expected_error",
@@ -28,6 +31,10 @@ def test_nba101(
         ("nba1/func", False),
         ("nba1/vec_with_one_return", False),
         ("nba1/vec_with_no_return_value", True),
+        ("nba1/vec_with_return_in_one_branch", True),
+        ("nba1/vec_with_return_in_all_branches", False),
+        pytest.param("nba1/vec_with_match_wildcard", False, marks=_MATCH),
+        pytest.param("nba1/vec_with_match_without_wildcard", True, marks=_MATCH),
     ],
 )
 def test_nba102(
@@ -39,6 +39,7 @@ def test_nba201(
     [
         ("nba2/guvec_with_matching_signatures", False),
         ("nba2/guvec_with_missmatching_signatures3", True),
+        ("nba2/guvec_with_signature_constants", True),
     ],
 )
 def test_nba202(
@@ -147,6 +148,7 @@ def test_nba207(
         ("nba2/guvec", True),
         ("nba2/guvec_with_one_pos_arg", True),
         ("nba2/guvec_with_second_arg_wrong_type", True),
+        ("nba2/guvec_with_signature_constants", False),
     ],
 )
 def test_nba208(
@@ -162,6 +164,8 @@ def test_nba208(
     [
         ("nba2/guvec_not_assigned_output", True),
         ("nba2/guvec_with_assigned_output", False),
+        ("nba2/guvec_with_output_assigned_in_loop", False),
+        ("nba2/guvec_with_output_assigned_after_return", True),
     ],
 )
 def test_nba209(
@@ -0,0 +1,83 @@
+import ast
+
+import pytest
+
+from flake8_numba.rule import Error
+from flake8_numba.rules import nba3
+from flake8_numba.rules.nba3 import NBA301, NBA302, NBA303, NBA311
+
+
+@pytest.mark.parametrize(
+    "file_name, numba_version, expected_error",
+    [
+        ("nba3/jit_without_nopython", (0, 58), True),
+        ("nba3/jit_without_nopython", (0, 59), False),
+        ("nba3/jit_with_nopython", (0, 58), False),
+        ("nba3/jit_with_forceobj", (0, 58), False),
+        ("nba3/njit", (0, 58), False),
+    ],
+)
+def test_nba301(
+    file_name: str,
+    numba_version: tuple[int, int],
+    expected_error: bool,
+    node: ast.FunctionDef,
+    errors: list[Error],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the rule returns the expected outputs for different functions."""
+    monkeypatch.setattr(nba3, "NUMBA_VERSION", numba_version)
+    NBA301().check(node, errors)
+    assert expected_error == bool(errors)
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_error",
+    [
+        ("nba3/jit_with_forceobj", True),
+        ("nba3/jit_with_forceobj_false", False),
+        ("nba3/jit_without_nopython", False),
+    ],
+)
+def test_nba302(
+    file_name: str, expected_error: bool, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule returns the expected outputs for different functions."""
+    NBA302().check(node, errors)
+    assert expected_error == bool(errors)
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_error",
+    [
+        ("nba3/vec_with_nopython_false", True),
+        ("nba3/vec_with_nopython_true", False),
+        ("nba3/jit_without_nopython", False),
+    ],
+)
+def test_nba303(
+    file_name: str, expected_error: bool, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule returns the expected outputs for different functions."""
+    NBA303().check(node, errors)
+    assert expected_error == bool(errors)
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_depth",
+    [
+        ("nba3/njit_with_objmode_in_nested_loops", 2),
+        ("nba3/njit_with_objmode_in_while", 1),
+        ("nba3/njit_with_objmode_outside_loop", 0),
+        ("nba3/njit_with_objmode_in_nested_function", 0),
+        ("nba3/func_with_objmode_in_loop", 0),
+    ],
+)
+def test_nba311(
+    file_name: str, expected_depth: int, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule reports the depth of the most deeply nested block."""
+    NBA311().check(node, errors)
+    assert bool(expected_depth) == bool(errors)
+    if errors:
+        assert f"within {expected_depth} nested loop(s)" in errors[0].message
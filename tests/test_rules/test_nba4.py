@@ -0,0 +1,74 @@
+import ast
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from flake8_numba.deep import DeepCompiler
+from flake8_numba.rule import Error
+from flake8_numba.rules.nba4 import NBA401, NBA411, NBA412
+
+
+@pytest.fixture
+def deep(tmp_path: Path) -> Generator[None, None, None]:
+    """Enable `--numba-deep` with an empty cache."""
+    DeepCompiler.active = DeepCompiler(str(tmp_path))
+    yield
+    DeepCompiler.active = None
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_error",
+    [
+        ("nba4/func_with_unsupported_call", False),
+        ("nba4/njit_with_supported_calls", False),
+        ("nba4/njit_with_unsupported_numpy_call", True),
+        ("nba4/njit_with_unsupported_math_call", True),
+        ("nba4/njit_with_unsupported_method", True),
+        ("nba4/njit_with_unsupported_builtin", True),
+        ("nba4/njit_with_shadowed_builtin", False),
+        ("nba4/jit_with_forceobj", False),
+        ("nba4/vec_with_unsupported_call", True),
+    ],
+)
+def test_nba401(
+    file_name: str, expected_error: bool, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule returns the expected outputs for different functions."""
+    NBA401().check(node, errors)
+    assert expected_error == bool(errors)
+
+
+@pytest.mark.usefixtures("deep")
+@pytest.mark.parametrize(
+    "file_name, expected_error",
+    [
+        ("nba4/deep_njit_with_typing_error", True),
+        ("nba4/deep_njit_with_helper", False),
+        ("nba4/deep_njit_with_relative_import", False),
+        ("nba4/deep_njit_without_signatures", False),
+        ("nba4/deep_jit_with_forceobj", False),
+    ],
+)
+def test_nba411(
+    file_name: str, expected_error: bool, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule returns the expected outputs for different functions."""
+    NBA411().check(node, errors)
+    assert expected_error == bool(errors)
+
+
+@pytest.mark.usefixtures("deep")
+@pytest.mark.parametrize(
+    "file_name, expected_error",
+    [
+        ("nba4/deep_njit_with_helper", False),
+        ("nba4/deep_jit_with_forceobj", False),
+    ],
+)
+def test_nba412(
+    file_name: str, expected_error: bool, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule returns the expected outputs for different functions."""
+    NBA412().check(node, errors)
+    assert expected_error == bool(errors)
@@ -0,0 +1,150 @@
+import ast
+import os
+
+import pytest
+
+from flake8_numba.rule import Error
+from flake8_numba.rules.nba5 import NBA501, NBA502, NBA503, NBA504, NBA511, NBA512
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "nba5")
+
+
+@pytest.mark.parametrize(
+    "file_name, required_paths, expected_error",
+    [
+        ("nba5/njit_without_cache", (DATA_PATH,), True),
+        ("nba5/njit_without_cache", ("*/nba5/njit_*.py",), True),
+        ("nba5/njit_without_cache", ("*/nba4/*",), False),
+        ("nba5/njit_without_cache", (), False),
+        ("nba5/njit_with_cache", (DATA_PATH,), False),
+        ("nba5/njit_with_cache_false", (DATA_PATH,), False),
+        ("nba5/lazy_vectorize", (DATA_PATH,), False),
+        ("nba5/func", (DATA_PATH,), False),
+    ],
+)
+def test_nba501(
+    file_name: str,
+    required_paths: tuple[str, ...],
+    expected_error: bool,
+    node: ast.FunctionDef,
+    errors: list[Error],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that caching is only required within the configured paths."""
+    monkeypatch.setattr(NBA501, "required_paths", required_paths)
+    NBA501().check(node, errors)
+    assert expected_error == bool(errors)
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_error",
+    [
+        ("nba5/cached_closure", True),
+        ("nba5/closure_without_cache", False),
+        ("nba5/cached_method", False),
+        ("nba5/njit_with_cache", False),
+    ],
+)
+def test_nba502(
+    file_name: str, expected_error: bool, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule returns the expected outputs for nested functions."""
+    for child in ast.walk(node):
+        if isinstance(child, ast.FunctionDef):
+            NBA502().check(child, errors)
+    assert expected_error == bool(errors)
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_error",
+    [
+        ("nba5/cached_lambda", True),
+        ("nba5/cached_lambda_decorator", True),
+        ("nba5/lambda_without_cache", False),
+        ("nba5/func", False),
+    ],
+)
+def test_nba503(
+    file_name: str, expected_error: bool, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule returns the expected outputs for different functions."""
+    NBA503().check(node, errors)
+    assert expected_error == bool(errors)
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_global",
+    [
+        ("nba5/cached_with_global_array", "WEIGHTS"),
+        ("nba5/cached_with_reassigned_global", "SCALE"),
+        ("nba5/cached_with_global_statement", "SCALE"),
+        ("nba5/cached_with_constant", ""),
+        ("nba5/cached_with_shadowed_global", ""),
+        ("nba5/global_array_without_cache", ""),
+    ],
+)
+def test_nba504(
+    file_name: str, expected_global: str, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule reports the mutable global read by the function."""
+    NBA504().check(node, errors)
+    assert bool(expected_global) == bool(errors)
+    if errors:
+        assert f"`{expected_global}`" in errors[0].message
+
+
+@pytest.mark.parametrize(
+    "file_name, paths, expected_error",
+    [
+        ("nba5/njit_without_cache", (DATA_PATH,), True),
+        ("nba5/njit_with_cache", (DATA_PATH,), True),
+        ("nba5/lazy_vectorize", ("*/nba5/*.py",), True),
+        ("nba5/stacked_lazy_njit", (DATA_PATH,), True),
+        ("nba5/stacked_njit_with_signature", (DATA_PATH,), False),
+        ("nba5/njit_without_cache", (), False),
+        ("nba5/lazy_vectorize", ("*/nba4/*",), False),
+        ("nba5/njit_with_signature", (DATA_PATH,), False),
+        ("nba5/eager_vectorize", (DATA_PATH,), False),
+        ("nba5/dynamic_guvectorize", (DATA_PATH,), False),
+        ("nba5/func", (DATA_PATH,), False),
+    ],
+)
+def test_nba511(
+    file_name: str,
+    paths: tuple[str, ...],
+    expected_error: bool,
+    node: ast.FunctionDef,
+    errors: list[Error],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that eager signatures are only required within the configured paths."""
+    monkeypatch.setattr(NBA511, "paths", paths)
+    NBA511().check(node, errors)
+    assert expected_error == bool(errors)
+
+
+@pytest.mark.parametrize(
+    "file_name, paths, expected_line",
+    [
+        ("nba5/dynamic_guvectorize", (DATA_PATH,), 5),
+        ("nba5/dynamic_guvectorize_call", (DATA_PATH,), 5),
+        ("nba5/dynamic_guvectorize_module", (DATA_PATH,), 9),
+        ("nba5/eager_guvectorize_module", (DATA_PATH,), 0),
+        ("nba5/dynamic_guvectorize", (), 0),
+        ("nba5/eager_guvectorize", (DATA_PATH,), 0),
+        ("nba5/eager_guvectorize_call", (DATA_PATH,), 0),
+        ("nba5/lazy_vectorize", (DATA_PATH,), 0),
+    ],
+)
+def test_nba512(
+    file_name: str,
+    paths: tuple[str, ...],
+    expected_line: int,
+    node: ast.FunctionDef,
+    errors: list[Error],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the rule points at the creation of the dynamic gufunc."""
+    monkeypatch.setattr(NBA512, "paths", paths)
+    NBA512().check(node, errors)
+    assert [error.line for error in errors] == ([expected_line] if expected_line else [])
@@ -0,0 +1,134 @@
+import ast
+
+import pytest
+
+from flake8_numba.rule import Error
+from flake8_numba.rules.nba6 import (
+    NBA601,
+    NBA602,
+    NBA603,
+    NBA611,
+    NBA612,
+    NBA621,
+)
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_error",
+    [
+        ("nba6/parallel_with_scalar_loop", True),
+        ("nba6/parallel_with_prange", False),
+        ("nba6/parallel_with_array_expression", False),
+        ("nba6/parallel_with_numpy_call", False),
+        ("nba6/parallel_with_array_method", False),
+        ("nba6/parallel_with_unknown_operand", False),
+        ("nba6/parallel_with_slice", False),
+        ("nba6/serial_scalar_loop", False),
+    ],
+)
+def test_nba601(
+    file_name: str, expected_error: bool, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule returns the expected outputs for different functions."""
+    NBA601().check(node, errors)
+    assert expected_error == bool(errors)
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_line",
+    [
+        ("nba6/prange_without_parallel", 6),
+        ("nba6/prange_with_parallel_false", 6),
+        ("nba6/prange_with_unknown_parallel", 0),
+        ("nba6/parallel_with_prange", 0),
+        ("nba6/prange_in_python", 0),
+    ],
+)
+def test_nba602(
+    file_name: str, expected_line: int, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule points at the `prange` loop."""
+    NBA602().check(node, errors)
+    assert [error.line for error in errors] == ([expected_line] if expected_line else [])
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_line",
+    [
+        ("nba6/prange_in_python", 5),
+        ("nba6/prange_compiled_later", 0),
+        ("nba6/range_in_python", 0),
+        ("nba6/prange_without_parallel", 0),
+    ],
+)
+def test_nba603(
+    file_name: str, expected_line: int, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule points at the `prange` loop."""
+    NBA603().check(node, errors)
+    assert [error.line for error in errors] == ([expected_line] if expected_line else [])
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_line",
+    [
+        ("nba6/prange_shifted_write", 7),
+        ("nba6/prange_stencil_in_place", 8),
+        ("nba6/prange_independent", 0),
+        ("nba6/prange_rows", 0),
+        ("nba6/range_shifted_write", 0),
+        ("nba6/prange_interleaved", 0),
+        ("nba6/prange_reversed", 8),
+        ("nba6/prange_strided_overlap", 7),
+    ],
+)
+def test_nba611(
+    file_name: str, expected_line: int, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule points at the access that depends on another iteration."""
+    NBA611().check(node, errors)
+    assert [error.line for error in errors] == ([expected_line] if expected_line else [])
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_target",
+    [
+        ("nba6/prange_shared_element", "`out[0]` is written by every iteration"),
+        ("nba6/prange_histogram", "`hist[a[i]]` is accumulated"),
+        ("nba6/prange_shared_scalar", "`last` is shared"),
+        ("nba6/prange_indirect_write", ""),
+        ("nba6/prange_private_scalar", ""),
+        ("nba6/prange_rows", ""),
+        ("nba6/prange_independent", ""),
+    ],
+)
+def test_nba612(
+    file_name: str, expected_target: str, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule recognizes reductions and reports other shared writes."""
+    NBA612().check(node, errors)
+    assert bool(expected_target) == bool(errors)
+    if errors:
+        assert expected_target in errors[0].message
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_reason",
+    [
+        ("nba6/prange_with_dot", "`numpy.dot` runs multithreaded BLAS"),
+        ("nba6/prange_with_linalg", "`numpy.linalg.norm` runs multithreaded BLAS"),
+        ("nba6/prange_with_matmul", "`@` runs multithreaded BLAS"),
+        ("nba6/prange_with_parallel_callee", "`helper` calls code that runs in parallel"),
+        ("nba6/parallel_vectorize_with_callee", "`kernel` runs in parallel"),
+        ("nba6/prange_with_serial_callee", ""),
+        ("nba6/vectorize_with_callee", ""),
+    ],
+)
+def test_nba621(
+    file_name: str, expected_reason: str, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule explains why each nested call runs in parallel."""
+    NBA621().check(node, errors)
+    assert bool(expected_reason) == bool(errors)
+    if errors:
+        assert expected_reason in errors[0].message
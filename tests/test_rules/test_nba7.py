@@ -0,0 +1,52 @@
+import ast
+
+import pytest
+
+from flake8_numba.rule import Error
+from flake8_numba.rules.nba7 import NBA701, NBA702
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_message",
+    [
+        ("nba7/zeros_in_nested_loops", "`numpy.zeros` within 2 nested loop(s)"),
+        ("nba7/sized_allocation_in_loop", "Preallocate it"),
+        ("nba7/append_in_loop", "`numpy.append` within 1 nested loop(s)"),
+        ("nba7/copy_in_loop", "`.copy()`"),
+        ("nba7/mask_in_loop", "Mask or fancy indexing `a[a > limit]`"),
+        ("nba7/list_growth_in_loop", "Growing list `found`"),
+        ("nba7/array_expression_in_loop", "Array expression `a * b`"),
+        ("nba7/allocation_before_loop", ""),
+        ("nba7/python_allocation_in_loop", ""),
+    ],
+)
+def test_nba701(
+    file_name: str, expected_message: str, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule describes the most deeply nested allocation."""
+    NBA701().check(node, errors)
+    assert bool(expected_message) == bool(errors)
+    if errors:
+        assert expected_message in errors[0].message
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_message",
+    [
+        ("nba7/sqrt_of_constant_in_loop", "does not change within 2 loop(s)"),
+        ("nba7/transpose_in_loop", "`a.T` does not change within 1 loop(s)"),
+        ("nba7/partially_invariant", "`np.exp(w[i])` does not change within 1 loop(s)"),
+        ("nba7/call_on_loop_variable", ""),
+        ("nba7/random_in_loop", ""),
+        ("nba7/zeros_in_nested_loops", ""),
+        ("nba7/python_allocation_in_loop", ""),
+    ],
+)
+def test_nba702(
+    file_name: str, expected_message: str, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule reports how many loops the expression can be hoisted out of."""
+    NBA702().check(node, errors)
+    assert bool(expected_message) == bool(errors)
+    if errors:
+        assert expected_message in errors[0].message
@@ -0,0 +1,72 @@
+import ast
+import builtins
+import os
+
+import pytest
+
+from flake8_numba.rule import Error
+from flake8_numba.rules.nba8 import NBA801, NBA802
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "nba8")
+
+
+@pytest.mark.parametrize(
+    "file_name, paths, expected_message",
+    [
+        ("nba8/njit_any_layout", (), "`b` is declared as `float64[:, :]`"),
+        ("nba8/njit_any_layout", (DATA_PATH,), "Declare it as `float64[:, ::1]`"),
+        ("nba8/njit_any_layout", ("*/nba7/*",), ""),
+        ("nba8/jit_any_layout_object", (), "`a` is declared as `float64[:]`"),
+        ("nba8/njit_contiguous", (), ""),
+        ("nba8/njit_lazy", (), ""),
+        ("nba8/guvectorize_any_layout", (), ""),
+        ("nba8/njit_invalid_signature", (), ""),
+    ],
+)
+def test_nba801(
+    file_name: str,
+    paths: tuple[str, ...],
+    expected_message: str,
+    node: ast.FunctionDef,
+    errors: list[Error],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the rule suggests the C-contiguous form within the configured paths."""
+    monkeypatch.setattr(NBA801, "paths", paths)
+    NBA801().check(node, errors)
+    assert bool(expected_message) == bool(errors)
+    if errors:
+        assert expected_message in errors[0].message
+
+
+@pytest.mark.parametrize("file_name", ["nba8/njit_unsafe_signature"])
+def test_nba801_unsafe_signature(node: ast.FunctionDef, errors: list[Error]) -> None:
+    """Test that signatures that can not be evaluated safely are not run."""
+    NBA801().check(node, errors)
+    assert not errors
+    assert not hasattr(builtins, "nba801_evaluated")
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_message",
+    [
+        (
+            "nba8/column_order_c",
+            "first axis of an array in C order in the innermost loop",
+        ),
+        ("nba8/row_order_f", "last axis of an array in F order"),
+        ("nba8/column_order_lazy_3d", "`out[k, j, i]`"),
+        ("nba8/row_order_c", ""),
+        ("nba8/column_order_f", ""),
+        ("nba8/column_access", ""),
+        ("nba8/column_order_python", ""),
+    ],
+)
+def test_nba802(
+    file_name: str, expected_message: str, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that loop orders are compared with the declared layouts."""
+    NBA802().check(node, errors)
+    assert bool(expected_message) == bool(errors)
+    if errors:
+        assert expected_message in errors[0].message
@@ -0,0 +1,101 @@
+import ast
+
+import pytest
+
+from flake8_numba.rule import Error
+from flake8_numba.rules.nba9 import NBA901, NBA902, NBA911, NBA912
+from flake8_numba.visitor import check_function
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_types",
+    [
+        ("nba9/branch_int_float", "`float64` here and `int64` at line 7"),
+        ("nba9/branch_array_scalar", "`float64` here and `float64[::1]` at line 7"),
+        ("nba9/branch_conflict_and_accumulator", "`float64[:]` here and `int64` at"),
+        ("nba9/int_accumulator", ""),
+        ("nba9/reassigned_in_block", ""),
+        ("nba9/branch_same_kind", ""),
+        ("nba9/int_accumulator_of_ints", ""),
+        ("nba9/int_accumulator_in_python", ""),
+    ],
+)
+def test_nba901(
+    file_name: str, expected_types: str, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule reports both types that numba has to unify."""
+    NBA901().check(node, errors)
+    assert bool(expected_types) == bool(errors)
+    if errors:
+        assert expected_types in errors[0].message
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_initial",
+    [
+        ("nba9/int_accumulator", "`0.0`"),
+        ("nba9/complex_accumulator", "`0j`"),
+        ("nba9/branch_conflict_and_accumulator", "`0.0`"),
+        ("nba9/float_accumulator", ""),
+        ("nba9/int_accumulator_of_ints", ""),
+        ("nba9/int_accumulator_in_python", ""),
+    ],
+)
+def test_nba902(
+    file_name: str, expected_initial: str, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule suggests an initial value of the accumulated type."""
+    NBA902().check(node, errors)
+    assert bool(expected_initial) == bool(errors)
+    if errors:
+        assert f"Initialize it as {expected_initial}" in errors[0].message
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_cause",
+    [
+        ("nba9/float32_times_literal", "`0.5 * a[i]` promotes `float32` values to"),
+        ("nba9/float32_augmented_literal", "because of `1.0` (`float64`)"),
+        ("nba9/float32_math_call", "because of `math.sqrt`"),
+        ("nba9/float32_with_float64_cast", "because of `np.float64`"),
+        ("nba9/float32_with_float64_array", "because of `weights` (`float64[::1]`)"),
+        ("nba9/vectorize_float32_return", "because of `2.0` (`float64`)"),
+        ("nba9/float32_array_times_literal", ""),
+        ("nba9/float32_with_float32_literal", ""),
+        ("nba9/vectorize_float32_cast", ""),
+        ("nba9/float64_times_literal", ""),
+    ],
+)
+def test_nba911(
+    file_name: str, expected_cause: str, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule reports what promotes single-precision values."""
+    NBA911().check(node, errors)
+    assert bool(expected_cause) == bool(errors)
+    if errors:
+        assert expected_cause in errors[0].message
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_line",
+    [
+        ("nba9/vectorize_float32_return", 6),
+        ("nba9/float32_math_call", 8),
+        ("nba9/vectorize_float32_cast", 0),
+        ("nba9/vectorize_float64_return", 0),
+        ("nba9/float32_augmented_literal", 0),
+    ],
+)
+def test_nba912(
+    file_name: str, expected_line: int, node: ast.FunctionDef, errors: list[Error]
+) -> None:
+    """Test that the rule points at the truncated return value."""
+    NBA912().check(node, errors)
+    assert [error.line for error in errors] == ([expected_line] if expected_line else [])
+
+
+@pytest.mark.parametrize("file_name", ["nba9/branch_conflict_and_accumulator"])
+def test_nba901_with_accumulator(file_name: str, node: ast.FunctionDef) -> None:
+    """Test that an accumulator does not hide the conflicts of other variables."""
+    codes = {error.message[:6] for error in check_function(node)}
+    assert {"NBA901", "NBA902"} <= codes
@@ -5,6 +5,7 @@ from typing import Final
 import pytest
 
 from flake8_numba import Error, Rule
+from flake8_numba import rules as rules
 
 THIS_DIR: Final = os.path.dirname(__file__)
 """Directory where this script lies."""
@@ -0,0 +1,132 @@
+import ast
+import json
+import runpy
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from numba.core import event
+
+from flake8_numba.runtime import (
+    CompileProfile,
+    CompileRecorder,
+    FunctionProfile,
+    first_line,
+    main,
+)
+
+WORKLOAD = """
+import numpy as np
+from numba import jit, njit
+
+
+@njit
+def add(x, y):
+    return x + y
+
+
+@jit(forceobj=True)
+def to_list(a):
+    return list(a)
+
+
+add(1, 2)
+add(1.0, 2.0)
+add(3, 4)
+to_list(np.ones(3))
+"""
+
+MODULE = """
+import numpy as np
+from numba import njit
+
+
+@njit
+def pad(a):
+    return np.pad(a, 1)
+"""
+
+
+@pytest.fixture
+def workload(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Script running a few jitted functions, within the working directory."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "workload.py"
+    path.write_text(WORKLOAD)
+    return path
+
+
+class TestCompileRecorder:
+    """Test class `CompileRecorder`."""
+
+    def test_record(self, workload: Path) -> None:
+        """Test that compilations and object mode fallbacks are recorded."""
+        with CompileRecorder("profile.json") as recorder:
+            runpy.run_path(str(workload))
+
+        functions = {f.name: f for f in CompileProfile.load("profile.json").functions}
+        assert functions == {f.name: f for f in recorder.profile.functions}
+        add, to_list = functions["add"], functions["to_list"]
+        assert (add.file, add.line) == ("workload.py", 6)
+        assert add.signatures == ("(int64, int64)", "(float64, float64)")
+        assert add.object_mode == ()
+        assert add.compile_time > 0
+        assert to_list.object_mode == to_list.signatures
+        assert "1 in object mode" in to_list.describe()
+
+    def test_unmatched_end(self) -> None:
+        """Test that compilations started before it was registered are ignored."""
+        recorder = CompileRecorder()
+        end = event.Event("numba:compile", event.EventStatus.END)  # type: ignore[no-untyped-call]
+        recorder.on_end(end)
+        assert recorder.events == []
+
+    def test_main(self, workload: Path) -> None:
+        """Test that scripts can be run from the command line, appending results."""
+        main(["-o", "profile.json", str(workload)])
+        main(["-o", "profile.json", "--append", str(workload)])
+        with open("profile.json") as f:
+            data = json.load(f)
+        assert data["version"] == 1
+        assert {function[2] for function in data["functions"]} == {"add", "to_list"}
+
+
+class TestCompileProfile:
+    """Test class `CompileProfile`."""
+
+    def test_lookup(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that functions are found by file and first line, merging them."""
+        monkeypatch.chdir(tmp_path)
+        profile = CompileProfile()
+        profile.add(FunctionProfile("module.py", 6, "pad", 0.5, ("(int64,)",), ()))
+        profile.add(FunctionProfile("module.py", 6, "pad", 0.25, ("(float64,)",), ()))
+        node = ast.parse(MODULE).body[2]
+        assert isinstance(node, ast.FunctionDef)
+        assert first_line(node) == 6
+
+        function = profile.lookup(str(tmp_path / "module.py"), node)
+        assert function is not None
+        assert function.compile_time == 0.75
+        assert function.describe() == "measured: 2 compilation(s), 0.75s"
+        assert profile.lookup("other.py", node) is None
+        assert CompileProfile.load("missing.json").functions == []
+
+
+def test_profile_option(tmp_path: Path) -> None:
+    """Test that Flake8 appends the measured cost to the errors and the report."""
+    (tmp_path / "module.py").write_text(MODULE)
+    CompileProfile([FunctionProfile("module.py", 6, "pad", 1.5, ("(int64,)",), ())]).save(
+        str(tmp_path / "profile.json")
+    )
+    command = [sys.executable, "-m", "flake8", "--select", "NBA", "module.py"]
+    options = ["--numba-profile", "profile.json", "--numba-cost-report", "report.json"]
+    result = subprocess.run(
+        command + options, cwd=tmp_path, capture_output=True, text=True, check=False
+    )
+    assert "NBA401" in result.stdout
+    assert "[measured: 1 compilation(s), 1.50s]" in result.stdout
+    with open(tmp_path / "report.json") as f:
+        (row,) = json.load(f)
+    assert (row["compile_time"], row["compilations"]) == (1.5, 1)
+    assert row["findings"] == ["NBA401"]
@@ -0,0 +1,331 @@
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from flake8_numba import server
+from flake8_numba.deep import DeepCompiler
+from flake8_numba.plugin import Plugin
+from flake8_numba.rules.nba5 import NBA501, NBA511, NBA512
+from flake8_numba.rule import Error
+from flake8_numba.rules.nba8 import NBA801
+from flake8_numba.server import (
+    Server,
+    apply_change,
+    load_options,
+    read_message,
+    split_lines,
+    to_diagnostic,
+    write_message,
+)
+from flake8_numba.symbols import ModuleIndex
+from flake8_numba.visitor import check_function
+
+CODE = """
+@vectorize
+def f(x):
+    x + 1
+
+
+def g(x):
+    return x
+"""
+
+
+def _frame(*messages: dict[str, Any]) -> io.BytesIO:
+    """Build a stream with all the given messages framed as the LSP expects."""
+    stream = io.BytesIO()
+    for message in messages:
+        write_message(stream, message)
+    stream.seek(0)
+    return stream
+
+
+def _read_all(stream: io.BytesIO) -> list[dict[str, Any]]:
+    """Read all messages written into a stream."""
+    stream.seek(0)
+    messages = []
+    while (message := read_message(stream)) is not None:
+        messages.append(message)
+    return messages
+
+
+def _open(text: str, uri: str = "file:///a.py") -> dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "method": "textDocument/didOpen",
+        "params": {"textDocument": {"uri": uri, "text": text}},
+    }
+
+
+@pytest.fixture
+def plugin_options(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Restore the options of the plugin after the test."""
+    monkeypatch.setattr(ModuleIndex, "project", None)
+    monkeypatch.setattr(NBA501, "required_paths", ())
+    monkeypatch.setattr(NBA511, "paths", ())
+    monkeypatch.setattr(NBA512, "paths", ())
+    monkeypatch.setattr(NBA801, "paths", ())
+    monkeypatch.setattr(DeepCompiler, "active", None)
+    monkeypatch.setattr(Plugin, "cost_report", None)
+    monkeypatch.setattr(Plugin, "profile", None)
+
+
+class TestServer:
+    """Tests for the language server."""
+
+    def test_framing(self) -> None:
+        """Test that written messages can be read back."""
+        message = {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}}
+        assert read_message(_frame(message)) == message
+
+    def test_session(self) -> None:
+        """Test a whole session from initialization to exit."""
+        reader = _frame(
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+            _open(CODE),
+            {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+            {"jsonrpc": "2.0", "method": "exit"},
+        )
+        writer = io.BytesIO()
+        Server(reader, writer).serve()
+
+        initialize, diagnostics, shutdown = _read_all(writer)
+        assert "capabilities" in initialize["result"]
+        assert [d["code"] for d in diagnostics["params"]["diagnostics"]] == ["NBA102"]
+        assert diagnostics["params"]["diagnostics"][0]["range"]["start"]["line"] == 3
+        assert shutdown == {"jsonrpc": "2.0", "id": 2, "result": None}
+
+    def test_unchanged_functions_are_not_checked_again(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that moving a function reuses the errors previously found."""
+        checked: list[str] = []
+
+        def spy(node: Any) -> Any:
+            checked.append(node.name)
+            return check_function(node)
+
+        monkeypatch.setattr("flake8_numba.server.check_function", spy)
+        lsp = Server(io.BytesIO(), io.BytesIO())
+        lsp.check(CODE)
+        errors = lsp.check("\n\n" + CODE)
+
+        assert checked == ["f", "g"]
+        assert errors is not None
+        assert errors[0].line == 6
+
+    def test_callee_changes_are_checked_again(self) -> None:
+        """Test that errors depending on another function follow its changes."""
+        code = (
+            "from numba import njit, prange\n\n"
+            "@njit(parallel=True)\n"
+            "def f(a, out):\n"
+            "    for i in prange(a.shape[0]):\n"
+            "        out[i] = g(a[i])\n\n"
+            "@njit(parallel={})\n"
+            "def g(row):\n"
+            "    return row.sum()\n"
+        )
+        lsp = Server(io.BytesIO(), io.BytesIO())
+        assert lsp.check(code.format(False)) == []
+        errors = lsp.check(code.format(True))
+        assert errors is not None
+        assert [error.message[:6] for error in errors] == ["NBA621"]
+
+    def test_calls_of_other_functions_are_ignored(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a new call in a function does not check the others again."""
+        checked: list[str] = []
+
+        def spy(node: Any) -> Any:
+            checked.append(node.name)
+            return check_function(node)
+
+        monkeypatch.setattr("flake8_numba.server.check_function", spy)
+        lsp = Server(io.BytesIO(), io.BytesIO())
+        lsp.check(CODE)
+        lsp.check(CODE.replace("return x", "return f(x)"))
+
+        assert checked == ["f", "g", "g"]
+
+    def test_numba_calls_are_checked_again(self) -> None:
+        """Test that errors depending on how a function is compiled follow the calls."""
+        code = (
+            "from numba import njit, prange\n\n"
+            "def f(a):\n"
+            "    for i in prange(a.shape[0]):\n"
+            "        a[i] = 0\n\n"
+            "def g():\n"
+            "    return {}\n"
+        )
+        lsp = Server(io.BytesIO(), io.BytesIO())
+        errors = lsp.check(code.format("None"))
+        assert errors is not None
+        assert [error.message[:6] for error in errors] == ["NBA603"]
+        assert lsp.check(code.format("njit(parallel=True)(f)")) == []
+
+    def test_closed_documents_are_dropped(self) -> None:
+        """Test that only the errors of functions within open documents are kept."""
+        lsp = Server(io.BytesIO(), io.BytesIO())
+        lsp.handle(_open(CODE))
+        assert len(lsp.cache) == 2
+        lsp.handle(
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didChange",
+                "params": {
+                    "textDocument": {"uri": "file:///a.py"},
+                    "contentChanges": [{"text": "def g(x):\n    return x\n"}],
+                },
+            }
+        )
+        assert len(lsp.cache) == 1
+        lsp.handle(
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didClose",
+                "params": {"textDocument": {"uri": "file:///a.py"}},
+            }
+        )
+        assert lsp.cache == {}
+
+    def test_syntax_error_keeps_diagnostics(self) -> None:
+        """Test that no diagnostics are published while the code can not be parsed."""
+        writer = io.BytesIO()
+        lsp = Server(io.BytesIO(), writer)
+        lsp.handle(_open("def f(:"))
+        assert not _read_all(writer)
+
+    @pytest.mark.usefixtures("plugin_options")
+    def test_workspace_options(self, tmp_path: Path) -> None:
+        """Test that the options of the workspace apply to the path of each document."""
+        (tmp_path / "setup.cfg").write_text(
+            "[flake8]\nnumba-cache-required-paths = src\n"
+        )
+        code = "from numba import njit\n\n@njit\ndef f(x):\n    return x\n"
+        writer = io.BytesIO()
+        lsp = Server(io.BytesIO(), writer)
+        lsp.handle(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {"rootUri": tmp_path.as_uri()},
+            }
+        )
+        lsp.handle(_open(code, (tmp_path / "src" / "a.py").as_uri()))
+        lsp.handle(_open(code, (tmp_path / "b.py").as_uri()))
+
+        _, inside, outside = _read_all(writer)
+        assert [d["code"] for d in inside["params"]["diagnostics"]] == ["NBA501"]
+        assert outside["params"]["diagnostics"] == []
+
+    def test_unknown_request(self) -> None:
+        """Test that unknown requests are answered with an error."""
+        writer = io.BytesIO()
+        Server(io.BytesIO(), writer).handle({"jsonrpc": "2.0", "id": 7, "method": "foo"})
+        (response,) = _read_all(writer)
+        assert response["error"]["code"] == server.METHOD_NOT_FOUND
+
+
+@pytest.mark.parametrize(
+    "change, expected",
+    [
+        ({"text": "y = 2\n"}, "y = 2\n"),
+        (
+            {
+                "range": {
+                    "start": {"line": 1, "character": 4},
+                    "end": {"line": 1, "character": 5},
+                },
+                "text": "3",
+            },
+            "x = 1\ny = 3\n",
+        ),
+        (
+            {
+                "range": {
+                    "start": {"line": 2, "character": 0},
+                    "end": {"line": 2, "character": 0},
+                },
+                "text": "z = 4\n",
+            },
+            "x = 1\ny = 2\nz = 4\n",
+        ),
+    ],
+)
+def test_apply_change(change: dict[str, Any], expected: str) -> None:
+    """Test that full and incremental changes are applied to the document."""
+    assert apply_change("x = 1\ny = 2\n", json.loads(json.dumps(change))) == expected
+
+
+def test_load_options(tmp_path: Path) -> None:
+    """Test that options are read from the first configuration with a flake8 section."""
+    (tmp_path / "setup.cfg").write_text("[metadata]\nname = a\n")
+    (tmp_path / "tox.ini").write_text(
+        "[flake8]\n"
+        "max-line-length = 90\n"
+        "numba_latency_paths = src/a.py,\n    src/b\n"
+        "numba-deep = true\n"
+        "numba-deep-timeout = 5\n"
+    )
+    options = load_options(str(tmp_path))
+    assert options.numba_latency_paths == [
+        str(tmp_path / "src" / "a.py"),
+        str(tmp_path / "src" / "b"),
+    ]
+    assert options.numba_deep is True
+    assert options.numba_deep_timeout == 5.0
+    assert options.numba_layout_paths == ""
+    assert options.numba_project_index == ""
+
+
+def test_load_options_without_config(tmp_path: Path) -> None:
+    """Test that defaults are used if the workspace has no flake8 configuration."""
+    options = load_options(str(tmp_path))
+    assert options.numba_deep is False
+    assert Path(options.numba_project_root) == tmp_path
+
+
+@pytest.mark.parametrize(
+    "text, start, end, expected",
+    [
+        # The emoji takes two UTF-16 code units
+        ("x = '\U0001f600'\ny = 2\n", (0, 5), (0, 7), "x = 'a'\ny = 2\n"),
+        ("x = 'é'\ny = 2\n", (0, 5), (0, 6), "x = 'a'\ny = 2\n"),
+        ("x = 1\ry = 2\r\n", (1, 4), (1, 5), "x = 1\ry = a\r\n"),
+        # Only line feeds and carriage returns break lines
+        ("x = '\u2028\x0c'\ny = 2\n", (1, 4), (1, 5), "x = '\u2028\x0c'\ny = a\n"),
+        # Positions past the end of a line stop there
+        ("x = 1\ny = 2\n", (0, 5), (0, 9), "x = 1a\ny = 2\n"),
+    ],
+)
+def test_apply_change_positions(
+    text: str, start: tuple[int, int], end: tuple[int, int], expected: str
+) -> None:
+    """Test that positions are counted in UTF-16 code units within LSP lines."""
+    change = {
+        "range": {
+            "start": {"line": start[0], "character": start[1]},
+            "end": {"line": end[0], "character": end[1]},
+        },
+        "text": "a",
+    }
+    assert apply_change(text, change) == expected
+
+
+def test_split_lines() -> None:
+    """Test that documents are split into lines as the LSP does."""
+    assert split_lines("a\r\nb\rc\u2028d\ne") == ["a\r\n", "b\r", "c\u2028d\n", "e"]
+
+
+def test_diagnostic_column() -> None:
+    """Test that columns are converted from UTF-8 bytes to UTF-16 code units."""
+    line = "s = '\U0001f600é' + x\n"
+    column = len("s = '\U0001f600é' + ".encode())
+    diagnostic = to_diagnostic(Error(1, column, "NBA000: message"), line)
+    assert diagnostic["range"]["start"] == {"line": 0, "character": 12}
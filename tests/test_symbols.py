@@ -0,0 +1,81 @@
+import ast
+from typing import Optional
+
+import pytest
+
+from flake8_numba.symbols import ModuleIndex, get_module_index, index_module
+
+CODE = """
+import numba as nb
+from numba import guvectorize as guvec, float32
+from .types import SIGS
+from . import layouts
+
+ARRAY = float32[:]
+LAYOUT = "(n) -> (n)"
+COUNTER = 0
+COUNTER += 1
+A, B = 1, 2
+MAPPING = {}
+MAPPING["key"] = 1
+
+
+def func() -> None:
+    pass
+"""
+
+
+class TestModuleIndex:
+    """Test class ModuleIndex."""
+
+    @pytest.fixture
+    def index(self) -> ModuleIndex:
+        """Index of the code sample."""
+        return index_module(ast.parse(CODE))
+
+    def test_constants(self, index: ModuleIndex) -> None:
+        """Test that only names assigned once are considered constants."""
+        assert set(index.constants) == {"ARRAY", "LAYOUT"}
+
+    @pytest.mark.parametrize(
+        "code, expected",
+        [
+            ("nb.guvectorize", "numba.guvectorize"),
+            ("guvec", "numba.guvectorize"),
+            ("SIGS", ".types.SIGS"),
+            ("layouts.SQUARE", ".layouts.SQUARE"),
+            ("vectorize", "vectorize"),
+            ("a[0]", None),
+        ],
+    )
+    def test_qualified_name(
+        self, index: ModuleIndex, code: str, expected: Optional[str]
+    ) -> None:
+        """Test that import aliases are resolved."""
+        expr = ast.parse(code, mode="eval").body
+        assert index.qualified_name(expr) == expected
+
+    @pytest.mark.parametrize(
+        "code, expected",
+        [
+            ("[(ARRAY, float32)]", "[(numba.float32[:], numba.float32)]"),
+            ("LAYOUT", "'(n) -> (n)'"),
+            ("nb.types.int64", "numba.int64"),
+            ("COUNTER", "COUNTER"),
+        ],
+    )
+    def test_resolve(self, index: ModuleIndex, code: str, expected: str) -> None:
+        """Test that constants and numba aliases are inlined."""
+        expr = ast.parse(code, mode="eval").body
+        assert ast.unparse(index.resolve(expr)) == expected
+        assert ast.unparse(expr) == code
+
+    def test_functions_are_linked(self) -> None:
+        """Test that functions share the index of their module."""
+        module = ast.parse(CODE)
+        index = index_module(module)
+        assert get_module_index(module.body[-1]) is index
+
+    def test_unlinked_node(self) -> None:
+        """Test that an empty index is returned for nodes that were never linked."""
+        assert not get_module_index(ast.parse(CODE).body[-1]).constants
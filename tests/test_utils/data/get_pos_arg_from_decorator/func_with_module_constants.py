@@ -0,0 +1,9 @@
+from numba import float32 as f32
+
+ARRAY = f32[:]
+SIGS = [(ARRAY, f32)]
+
+
+@guvectorize(SIGS, "(n) -> ()")
+def func(val, out) -> None:
+    pass
@@ -0,0 +1,6 @@
+import numba as nmb
+
+
+@vectorize([nmb.float32(nmb.float32, nmb.float32)])
+def func(val1, val2) -> None:
+    pass
@@ -0,0 +1,5 @@
+@deco
+@other("value1")
+@njit("float64(float64)")
+def func() -> None:
+    pass
@@ -0,0 +1,6 @@
+from numba import guvectorize as guvec
+
+
+@guvec
+def func() -> None:
+    pass
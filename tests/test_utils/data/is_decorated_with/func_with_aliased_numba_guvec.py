@@ -0,0 +1,6 @@
+import numba as nmb
+
+
+@nmb.guvectorize
+def func() -> None:
+    pass
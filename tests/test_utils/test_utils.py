@@ -3,9 +3,10 @@ import os
 from typing import Optional
 
 import pytest
-from numba import float32
+from numba import float32, float64
 
 from flake8_numba import utils
+from flake8_numba.symbols import index_module
 
 
 @pytest.fixture
@@ -24,7 +25,11 @@ def node(relative_path: str) -> ast.FunctionDef:
     abs_path = os.path.join(os.path.dirname(__file__), relative_path + ".py")
     with open(abs_path) as f:
         function = f.read()
-    return ast.parse(function).body[0]  # type: ignore
+    module = ast.parse(function)
+    index_module(module, abs_path)
+    return next(
+        statement for statement in module.body if isinstance(statement, ast.FunctionDef)
+    )
 
 
 class TestHasReturnValue:
@@ -59,6 +64,8 @@ class TestIsDecoratedWith:
             ("data/is_decorated_with/func_with_nb_guvec", True),
             ("data/is_decorated_with/func_with_vec", False),
             ("data/is_decorated_with/non_decorated_func", False),
+            ("data/is_decorated_with/func_with_aliased_guvec", True),
+            ("data/is_decorated_with/func_with_aliased_numba_guvec", True),
         ],
     )
     def test_is_decorated_with(
@@ -194,6 +201,11 @@ class TestGetPosArgFromDecorator:
             ("data/get_pos_arg_from_decorator/func_with_only_kwargs", 1, None),
             ("data/get_pos_arg_from_decorator/func_with_mixed_symbols", 0, "[float32(float32, value3)]"),  # noqa: E501
             ("data/get_pos_arg_from_decorator/func_with_numba_types", 0, [float32(float32, float32)]),  # noqa: E501
+            ("data/get_pos_arg_from_decorator/func_with_numba_alias", 0, [float32(float32, float32)]),  # noqa: E501
+            ("data/get_pos_arg_from_decorator/func_with_module_constants", 0, [(float32[:], float32)]),  # noqa: E501
+            ("data/get_pos_arg_from_decorator/func_with_module_constants", 1, "'(n) -> ()'"),  # noqa: E501
+            ("data/get_pos_arg_from_decorator/func_with_stacked_decorators", 0, float64(float64)),  # noqa: E501
+            ("data/get_pos_arg_from_decorator/func_with_stacked_decorators", 1, None),
         ],
         # fmt: on
     )
@@ -1,8 +1,10 @@
 import ast
+from typing import Optional
 
 import pytest
 
-from flake8_numba.visitor import Visitor
+from flake8_numba.rule import Error, Rule
+from flake8_numba.visitor import Visitor, _rule_plan, check_function
 
 
 class TestVisitor:
@@ -25,3 +27,67 @@ def hello_world() -> None:
         """
         visitor = Visitor()
         visitor.visit(code_sample)
+
+    def test_all_functions_are_checked(self) -> None:
+        """Test that errors are reported for every function and not only the first."""
+        code = """
+@vectorize
+def f(x):
+    x + 1
+
+@vectorize
+def g(x):
+    x + 1
+        """
+        visitor = Visitor()
+        visitor.visit(ast.parse(code))
+        assert [error.line for error in visitor.errors] == [4, 8]
+
+    def test_stacked_decorators(self) -> None:
+        """Test that the numba decorator is found below other decorators."""
+        code = """
+from numba import njit
+
+@deco
+@other(1, 2)
+@njit("float64(float64)")
+def f(x):
+    return x
+        """
+        visitor = Visitor()
+        visitor.visit(ast.parse(code))
+        assert visitor.errors == []
+
+
+def test_check_function_dependencies(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that rules are only skipped if a rule they depend on was raised."""
+    monkeypatch.setattr(Rule, "all_rules", [])
+
+    class Raised(Rule):
+        def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+            return Error(node.lineno, 0, "RAISED")
+
+    class Skipped(Rule):
+        @property
+        def depends_on(self) -> set[type[Rule]]:
+            return {Raised}
+
+        def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+            return Error(node.lineno, 0, "SKIPPED")
+
+    class Checked(Rule):
+        @property
+        def depends_on(self) -> set[type[Rule]]:
+            return {Skipped}
+
+        def _check(self, node: ast.FunctionDef) -> Optional[Error]:
+            return Error(node.lineno, 0, "CHECKED")
+
+    node = ast.parse("def f():\n    pass").body[0]
+    assert isinstance(node, ast.FunctionDef)
+    # The plan is cached by the number of registered rules
+    _rule_plan.cache_clear()
+    try:
+        assert [error.message for error in check_function(node)] == ["RAISED", "CHECKED"]
+    finally:
+        _rule_plan.cache_clear()
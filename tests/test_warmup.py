@@ -0,0 +1,112 @@
+import glob
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from flake8_numba.warmup import ManifestEntry, collect_manifest, main
+
+KERNELS = """
+import numba as nb
+from numba import float64, njit, vectorize
+
+SIGNATURE = "float64(float64)"
+PARALLEL = False
+
+
+@njit([SIGNATURE, "int64(int64)"], cache=True, parallel=PARALLEL)
+def double(x):
+    return 2 * x
+
+
+@njit(float64(float64, float64), cache=True, nogil=True)
+def add(x, y):
+    return x + y
+
+
+@vectorize(["float64(float64)"], cache=not PARALLEL)
+def square(x):
+    return x * x
+
+
+@njit(cache=True)
+def scale(x):
+    return 0.5 * x
+
+
+@nb.njit
+def lazy(x):
+    def inner(y):
+        return y
+
+    return inner(x)
+
+
+def plain(x):
+    return x
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Project with a single package of jitted kernels."""
+    package = tmp_path / "package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "kernels.py").write_text(KERNELS)
+    (package / "broken.py").write_text("def f(:\n")
+    return tmp_path
+
+
+def test_collect_manifest(project: Path) -> None:
+    """Test that top-level jitted functions are listed with signatures and options."""
+    entries = {entry.name: entry for entry in collect_manifest(str(project))}
+    assert set(entries) == {"double", "add", "square", "scale", "lazy"}
+    assert entries["double"] == ManifestEntry(
+        module="package.kernels",
+        name="double",
+        decorator="njit",
+        signatures=("'float64(float64)'", "'int64(int64)'"),
+        eager=True,
+        cache=True,
+        parallel=False,
+        nogil=False,
+        file="package/kernels.py",
+        line=10,
+    )
+    assert entries["add"].signatures == ("numba.float64(numba.float64, numba.float64)",)
+    assert entries["add"].nogil is True
+    assert entries["square"].cache is None
+    assert entries["lazy"].signatures == ()
+    assert not entries["lazy"].eager
+
+
+def test_warm_up(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the generated script populates the cache of cached functions."""
+    monkeypatch.chdir(project)
+    main(["--manifest", "build/manifest.json", "--script", "warmup.py"])
+    with open("build/manifest.json") as f:
+        manifest = json.load(f)
+    assert len(manifest["functions"]) == 5
+    # Signatures of lazy functions can be added by hand
+    manifest["functions"][3]["signatures"] = ["'float64(float64)'"]
+    with open("build/manifest.json", "w") as f:
+        json.dump(manifest, f)
+
+    env = {**os.environ, "PYTHONPATH": str(project)}
+    result = subprocess.run(
+        [sys.executable, "warmup.py", "--workers", "1"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "4 signature(s) compiled from 1 module(s)." in result.stdout
+    cached = glob.glob(str(project / "package" / "__pycache__" / "kernels.*.nbi"))
+    names = {os.path.basename(path).split(".")[1].split("-")[0] for path in cached}
+    # `square` is not listed as cached but it is compiled when its module is imported
+    assert names == {"double", "add", "scale", "square"}